@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Cart Rendering Benchmark for Mini E-Kart
+Measures, inside the page, how long single cart operations take with the
+keyed incremental renderer as the cart grows to thousands of lines, next to
+a full updateCartDisplay() re-render at the same cart size (what every
+add/remove used to cost). Results go to reports/cart_render_benchmark.json
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+
+from utilities.driver_setup import DriverSetup
+from utilities.perf_metrics import summarize
+from catalog_fixtures import generate_catalog_page
+
+# Runs the whole measurement in one execute_script call so WebDriver
+# roundtrips do not drown out the DOM work being measured
+RENDER_BENCH_JS = """
+const [lines, bucketSize, fullRenderEvery] = arguments;
+const buttons = Array.from(document.querySelectorAll('.add-btn')).slice(0, lines);
+const samples = {add: [], quantity: [], remove: [], full_render: []};
+const byLines = {};
+const record = (kind, elapsed) => {
+    samples[kind].push(elapsed);
+    const bucket = Math.floor(cartIndex.size / bucketSize) * bucketSize;
+    const key = `${bucket}-${bucket + bucketSize - 1}`;
+    (byLines[key] = byLines[key] || {add: [], quantity: [], remove: [], full_render: []})[kind].push(elapsed);
+};
+const timed = fn => { const start = performance.now(); fn(); return performance.now() - start; };
+
+clearCart();
+buttons.forEach((button, index) => {
+    record('add', timed(() => button.click()));
+    if (index % fullRenderEvery === 0) {
+        record('full_render', timed(() => updateCartDisplay()));
+    }
+});
+buttons.filter((_, index) => index % 10 === 0).forEach(button => {
+    record('quantity', timed(() => button.click()));
+});
+const rendered = document.querySelectorAll('#cart-items .cart-item').length;
+buttons.slice().reverse().forEach((button, index) => {
+    const name = button.getAttribute('data-name');
+    const remove = document.querySelector(`#cart-items .cart-item[data-name="${CSS.escape(name)}"] .remove-btn`);
+    record('remove', timed(() => remove.click()));
+});
+return {samples: samples, byLines: byLines, rendered: rendered, totalAfter: totalPrice};
+"""
+
+
+def run_render_benchmark(lines, bucket_size, full_render_every, seed, money_mode):
+    """Fill a cart with `lines` distinct products and time every operation"""
+    index_path, _ = generate_catalog_page(lines, seed)
+    setup = DriverSetup(base_url=index_path.resolve().as_uri(), money_mode=money_mode)
+    setup.setup_driver()
+    try:
+        if not setup.navigate_to_homepage():
+            raise Exception(f"Could not open catalog fixture {index_path}")
+        setup.get_driver().set_script_timeout(600)
+        data = setup.get_driver().execute_script(RENDER_BENCH_JS, lines, bucket_size, full_render_every)
+    finally:
+        setup.cleanup()
+
+    if data['rendered'] != lines:
+        raise Exception(f"Expected {lines} rendered cart lines, found {data['rendered']}")
+    return {
+        'cart_lines': lines,
+        'money_mode': money_mode,
+        'operations': {kind: summarize(samples) for kind, samples in data['samples'].items()},
+        'by_cart_lines': {
+            bucket: {kind: summarize(samples) for kind, samples in kinds.items() if samples}
+            for bucket, kinds in data['byLines'].items()
+        },
+        'total_after_removing_all': data['totalAfter'],
+    }
+
+
+def main():
+    """Run the rendering benchmark and save the report"""
+    parser = argparse.ArgumentParser(description="Benchmark incremental cart rendering on large carts")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--bucket-size", type=int, default=500, help="cart-size bucket for the breakdown")
+    parser.add_argument("--full-render-every", type=int, default=50,
+                        help="time a full updateCartDisplay() every N adds")
+    parser.add_argument("--money-mode", choices=["float", "cents"], default="float")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="reports/cart_render_benchmark.json")
+    args = parser.parse_args()
+
+    results = []
+    for lines in args.lines:
+        print(f"⏱️ Rendering a cart of {lines} lines...")
+        report = run_render_benchmark(lines, args.bucket_size, args.full_render_every, args.seed, args.money_mode)
+        for kind, stats in report['operations'].items():
+            print(f"   {kind:<12} p50 {stats['p50']:.3f}ms  p99 {stats['p99']:.3f}ms  ({stats['runs']} ops)")
+        results.append(report)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'results': results}, f, indent=2)
+    print(f"📊 Cart render benchmark saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
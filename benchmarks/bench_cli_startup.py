@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Runner Startup Benchmark for Mini E-Kart
+Time from launching `run_tests.py` to the first scenario starting, with a
+full setup on every run (dependency install and driver probe, the old
+behaviour, forced with --force-setup) against the cached setup fingerprint.
+Results go to reports/cli_startup_benchmark.json
+"""
+
+import os
+import sys
+import json
+import subprocess
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+
+from utilities.perf_metrics import summarize
+
+FIRST_SCENARIO_FILE = Path("reports/first_scenario.json")
+
+
+def first_scenario_location(feature):
+    """file:line of the first scenario in a feature file"""
+    for number, line in enumerate(Path(feature).read_text().splitlines(), 1):
+        if line.strip().startswith(("Scenario:", "Scenario Outline:")):
+            return f"{feature}:{number}"
+    raise Exception(f"No scenario in {feature}")
+
+
+def time_to_first_scenario(location, force_setup):
+    """Run one scenario through the runner and read its time-to-first-scenario"""
+    cmd = [sys.executable, "run_tests.py", "run", location, "--no-budgets"]
+    if force_setup:
+        cmd.append("--force-setup")
+    # A file left by an earlier run would be read as this run's timing
+    if FIRST_SCENARIO_FILE.exists():
+        FIRST_SCENARIO_FILE.unlink()
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"{' '.join(cmd)} failed with exit code {result.returncode}:\n"
+                        f"{result.stdout[-2000:]}{result.stderr[-2000:]}")
+    if not FIRST_SCENARIO_FILE.exists():
+        raise Exception(f"{' '.join(cmd)} did not reach the first scenario")
+    return json.loads(FIRST_SCENARIO_FILE.read_text())['time_to_first_scenario_s']
+
+
+def main():
+    """Compare full and cached setup and save the results to reports/"""
+    parser = argparse.ArgumentParser(description="Benchmark runner time-to-first-scenario")
+    parser.add_argument("--runs", type=int, default=5, help="runs per mode")
+    parser.add_argument("--feature", default="features/add_to_cart.feature",
+                        help="feature whose first scenario is run")
+    args = parser.parse_args()
+
+    location = first_scenario_location(args.feature)
+    print(f"⏱️ Timing {args.runs} runs per mode of {location}...")
+    full = summarize([time_to_first_scenario(location, force_setup=True) for _ in range(args.runs)])
+    # The full runs above left a fresh fingerprint, so these all take the cached path
+    cached = summarize([time_to_first_scenario(location, force_setup=False) for _ in range(args.runs)])
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'location': location,
+        'full_setup_s': full,
+        'cached_setup_s': cached,
+        'speedup': full['mean'] / cached['mean'],
+    }
+    print(f"   full setup:   {full['mean']:.2f}s to first scenario")
+    print(f"   cached setup: {cached['mean']:.2f}s to first scenario ({report['speedup']:.1f}x)")
+
+    output = Path("reports/cli_startup_benchmark.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📊 Runner startup benchmark saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Driver Pool Benchmark for Mini E-Kart
+Compares per-scenario browser startup cost with and without the driver pool,
+and pooled resets by page reload against checkpoint restore
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+
+from utilities.driver_setup import DriverSetup, DriverPool
+from utilities.perf_metrics import summarize
+
+
+def bench_cold(scenarios):
+    """Start and quit a fresh Chrome for every simulated scenario"""
+    samples = []
+    for _ in range(scenarios):
+        start = time.perf_counter()
+        setup = DriverSetup()
+        setup.setup_driver()
+        if not setup.navigate_to_homepage():
+            raise Exception("Could not open homepage")
+        samples.append(time.perf_counter() - start)
+        setup.cleanup()
+    return samples
+
+
+def bench_pooled(scenarios, max_uses, checkpoints=False):
+    """
+    Acquire a warm session from the pool for every simulated scenario
+    Each simulated scenario leaves a product in the cart for the next reset to clean up
+    Returns:
+        Tuple of (samples, whether every reset was isolated)
+    """
+    pool = DriverPool(max_uses=max_uses, checkpoints=checkpoints)
+    samples = []
+    try:
+        for _ in range(scenarios):
+            start = time.perf_counter()
+            setup = pool.acquire()
+            samples.append(time.perf_counter() - start)
+            name = next(iter(setup.get_catalog()))
+            setup.seed_cart([(name, setup.get_product(name)['price'])])
+            pool.release(setup)
+    finally:
+        pool.shutdown()
+    return samples, pool.isolation_report()['all_isolated']
+
+
+def main():
+    """Run both modes and save the comparison to reports/"""
+    parser = argparse.ArgumentParser(description="Benchmark per-scenario driver startup cost")
+    parser.add_argument("--scenarios", type=int, default=10, help="simulated scenarios per mode")
+    parser.add_argument("--max-uses", type=int, default=20, help="pool recycle threshold")
+    args = parser.parse_args()
+
+    print(f"⏱️ Benchmarking {args.scenarios} scenarios per mode...")
+    cold = summarize(bench_cold(args.scenarios))
+    reload_samples, reload_isolated = bench_pooled(args.scenarios, args.max_uses)
+    checkpoint_samples, checkpoint_isolated = bench_pooled(args.scenarios, args.max_uses, checkpoints=True)
+    pooled = summarize(reload_samples)
+    checkpoint = summarize(checkpoint_samples)
+
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'scenarios': args.scenarios,
+        'max_uses': args.max_uses,
+        'cold_start': cold,
+        'pooled': pooled,
+        'pooled_checkpoint': checkpoint,
+        'isolated': {'reload': reload_isolated, 'checkpoint': checkpoint_isolated},
+        'speedup': cold['mean'] / pooled['mean'] if pooled['mean'] else None,
+        'checkpoint_speedup': pooled['mean'] / checkpoint['mean'] if checkpoint['mean'] else None,
+    }
+
+    print(f"Cold start per scenario: {cold['mean']:.3f}s (median {cold['median']:.3f}s)")
+    print(f"Pooled per scenario:     {pooled['mean']:.3f}s (median {pooled['median']:.3f}s)")
+    print(f"Checkpoint per scenario: {checkpoint['mean']:.3f}s (median {checkpoint['median']:.3f}s)")
+    if results['speedup']:
+        print(f"Speedup: {results['speedup']:.1f}x")
+    if results['checkpoint_speedup']:
+        print(f"Checkpoint vs reload: {results['checkpoint_speedup']:.1f}x "
+              f"(isolated: {'yes' if checkpoint_isolated else 'NO'})")
+
+    report_path = Path("reports") / "driver_pool_benchmark.json"
+    report_path.parent.mkdir(exist_ok=True)
+    with open(report_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"📊 Benchmark saved to: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Large-Catalog and Large-Cart Scale Benchmark for Mini E-Kart
+Drives add/remove sequences through Selenium against generated catalogs and
+records per-operation latency percentiles into reports/
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+
+from utilities.driver_setup import DriverSetup
+from utilities.perf_metrics import summarize
+from utilities.static_server import APP_ASSETS, StaticServer
+from catalog_fixtures import generate_catalog_page
+
+CART_SIZE_BUCKET = 100
+
+
+def build_operations(products, cart_lines, repeat_adds, seed):
+    """
+    Build an add/remove sequence: fill the cart with distinct lines, bump
+    some quantities, then remove every line in random order
+    """
+    rng = random.Random(seed)
+    names = rng.sample([name for name, _ in products], min(cart_lines, len(products)))
+    operations = [("add", name) for name in names]
+    operations += [("add", rng.choice(names)) for _ in range(repeat_adds)]
+    removal_order = names[:]
+    rng.shuffle(removal_order)
+    operations += [("remove", name) for name in removal_order]
+    return operations
+
+
+def run_catalog(catalog_size, cart_lines, repeat_adds, seed, http=False):
+    """Benchmark one catalog size and return its latency report"""
+    index_path, products = generate_catalog_page(catalog_size, seed)
+    server = StaticServer(index_path.parent, allow=APP_ASSETS).start() if http else None
+    setup = DriverSetup(base_url=server.url("index.html") if server else index_path.resolve().as_uri())
+    setup.setup_driver()
+    try:
+        start = time.perf_counter()
+        if not setup.navigate_to_homepage():
+            raise Exception(f"Could not open catalog fixture {index_path}")
+        load_ms = (time.perf_counter() - start) * 1000
+        # Second load shows the cost with a warm HTTP cache (file:// has none)
+        start = time.perf_counter()
+        if not setup.navigate_to_homepage():
+            raise Exception(f"Could not reload catalog fixture {index_path}")
+        reload_ms = (time.perf_counter() - start) * 1000
+
+        latencies = {"add": [], "remove": []}
+        by_cart_size = {}
+        lines_in_cart = set()
+        for kind, name in build_operations(products, cart_lines, repeat_adds, seed):
+            if kind == "add":
+                element = setup.get_product(name)['button']
+            else:
+                element = setup.find_cart_remove_button(name)
+
+            start = time.perf_counter()
+            if not setup.click_and_wait_for_cart(element, f"{kind} {name}", timeout=30):
+                raise Exception(f"Could not {kind} {name}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            latencies[kind].append(elapsed_ms)
+            bucket = (len(lines_in_cart) // CART_SIZE_BUCKET) * CART_SIZE_BUCKET
+            by_cart_size.setdefault(f"{bucket}-{bucket + CART_SIZE_BUCKET - 1}", []).append(elapsed_ms)
+            if kind == "add":
+                lines_in_cart.add(name)
+            else:
+                lines_in_cart.discard(name)
+
+        return {
+            'catalog_size': catalog_size,
+            'cart_lines': cart_lines,
+            'transport': 'http' if http else 'file',
+            'page_load_ms': load_ms,
+            'page_reload_ms': reload_ms,
+            'server': dict(server.stats) if server else None,
+            'operations': {kind: summarize(samples) for kind, samples in latencies.items()},
+            'by_cart_lines': {bucket: summarize(samples) for bucket, samples in by_cart_size.items()},
+        }
+    finally:
+        setup.cleanup()
+        if server:
+            server.stop()
+
+
+def main():
+    """Run the scale benchmark for each catalog size and save the report"""
+    parser = argparse.ArgumentParser(description="Benchmark cart operations on large catalogs and carts")
+    parser.add_argument("--catalog-sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--cart-lines", type=int, default=300, help="distinct products added to the cart")
+    parser.add_argument("--repeat-adds", type=int, default=50, help="extra adds that only bump quantities")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--http", action="store_true", help="serve the fixtures over the embedded HTTP server")
+    parser.add_argument("--output", default="reports/scale_benchmark.json")
+    args = parser.parse_args()
+
+    results = []
+    for catalog_size in args.catalog_sizes:
+        print(f"⏱️ Catalog of {catalog_size} products, {args.cart_lines} cart lines...")
+        report = run_catalog(catalog_size, args.cart_lines, args.repeat_adds, args.seed, args.http)
+        for kind, stats in report['operations'].items():
+            print(f"   {kind:<6} p50 {stats['p50']:.1f}ms  p90 {stats['p90']:.1f}ms  "
+                  f"p99 {stats['p99']:.1f}ms  ({stats['runs']} ops)")
+        results.append(report)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'results': results}, f, indent=2)
+    print(f"📊 Scale benchmark saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for Mini E-Kart
+Time from "new scenario" to a ready homepage for a cold Chrome launch with
+the default profile, a cold launch from the minimal fast-startup profile,
+and a warm start (new browser context in a shared Chrome). Also times the
+driver probe with and without its cache. Results go to
+reports/startup_benchmark.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+
+from utilities.driver_setup import DriverSetup, SharedBrowser
+from utilities.driver_probe import probe_driver
+from utilities.perf_metrics import summarize
+
+
+def bench_cold(scenarios, fast_startup):
+    """Launch and quit a whole Chrome for every simulated scenario"""
+    samples = []
+    for _ in range(scenarios):
+        start = time.perf_counter()
+        setup = DriverSetup(fast_startup=fast_startup)
+        setup.setup_driver()
+        if not setup.navigate_to_homepage():
+            raise Exception("Could not open homepage")
+        samples.append(time.perf_counter() - start)
+        setup.cleanup()
+    return samples
+
+
+def bench_warm(scenarios):
+    """Open a fresh browser context in one shared Chrome for every simulated scenario"""
+    browser = SharedBrowser()
+    samples = []
+    try:
+        for _ in range(scenarios):
+            start = time.perf_counter()
+            setup = browser.acquire()
+            samples.append(time.perf_counter() - start)
+            name = next(iter(setup.get_catalog()))
+            setup.seed_cart([(name, setup.get_product(name)['price'])])
+            browser.release(setup)
+    finally:
+        browser.shutdown()
+    return samples, browser.startup_report()
+
+
+def main():
+    """Run every startup mode and save the comparison to reports/"""
+    parser = argparse.ArgumentParser(description="Benchmark cold versus warm browser startup")
+    parser.add_argument("--scenarios", type=int, default=10, help="simulated scenarios per mode")
+    args = parser.parse_args()
+
+    print(f"⏱️ Benchmarking {args.scenarios} scenarios per startup mode...")
+    probe_start = time.perf_counter()
+    probe = probe_driver(force=True)
+    probe_uncached = time.perf_counter() - probe_start
+    probe_start = time.perf_counter()
+    probe_driver()
+    probe_cached = time.perf_counter() - probe_start
+    if not probe['ok']:
+        raise Exception(f"Chrome WebDriver is not working: {probe['error']}")
+
+    cold = summarize(bench_cold(args.scenarios, fast_startup=False))
+    cold_fast = summarize(bench_cold(args.scenarios, fast_startup=True))
+    warm_samples, shared = bench_warm(args.scenarios)
+    warm = summarize(warm_samples)
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'scenarios': args.scenarios,
+        'chrome': probe['chrome'],
+        'driver_probe_s': {'uncached': probe_uncached, 'cached': probe_cached},
+        'cold_default_profile_s': cold,
+        'cold_fast_profile_s': cold_fast,
+        'warm_shared_context_s': warm,
+        'shared_browser': shared,
+        'speedup_fast_profile': cold['mean'] / cold_fast['mean'],
+        'speedup_warm_context': cold['mean'] / warm['mean'],
+    }
+
+    print(f"   driver probe:    {probe_uncached:.2f}s uncached, {probe_cached * 1000:.0f}ms cached")
+    print(f"   cold (default):  {cold['mean']:.2f}s per scenario")
+    print(f"   cold (fast):     {cold_fast['mean']:.2f}s per scenario ({report['speedup_fast_profile']:.1f}x)")
+    print(f"   warm (context):  {warm['mean']:.2f}s per scenario ({report['speedup_warm_context']:.1f}x)")
+
+    output = Path("reports/startup_benchmark.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📊 Startup benchmark saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Catalog fixtures for Mini E-Kart scale benchmarks
+Generates copies of index.html with an arbitrary number of products
+"""
+
+import re
+import random
+import shutil
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = PROJECT_ROOT / "reports" / "fixtures"
+GRID_PATTERN = re.compile(r'(<div class="products-grid">)(.*?)(</div>\s*</section>)', re.DOTALL)
+
+CARD_TEMPLATE = """
+                    <div class="product-card">
+                        <div class="product-image">📦</div>
+                        <h3 class="product-name">{name}</h3>
+                        <p class="product-price">${price}</p>
+                        <button class="add-btn" data-name="{name}" data-price="{price}">Add to Cart</button>
+                    </div>"""
+
+
+def generate_products(count, seed=42):
+    """Return a deterministic list of (name, price) tuples"""
+    rng = random.Random(seed)
+    return [(f"Product {i:06d}", f"{rng.randint(100, 200000) / 100:.2f}") for i in range(count)]
+
+
+def generate_catalog_page(count, seed=42):
+    """
+    Write an index.html with `count` products next to copies of script.js/style.css
+    Returns:
+        Tuple of (path to the generated index.html, list of products)
+    """
+    products = generate_products(count, seed)
+    fixture_dir = FIXTURES_DIR / f"catalog_{count}"
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    for asset in ("script.js", "style.css"):
+        shutil.copyfile(PROJECT_ROOT / asset, fixture_dir / asset)
+
+    template = (PROJECT_ROOT / "index.html").read_text(encoding="utf-8")
+    cards = "".join(CARD_TEMPLATE.format(name=name, price=price) for name, price in products)
+    page = GRID_PATTERN.sub(lambda m: m.group(1) + cards + "\n                " + m.group(3), template, count=1)
+
+    index_path = fixture_dir / "index.html"
+    index_path.write_text(page, encoding="utf-8")
+    return index_path, products
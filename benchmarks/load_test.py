@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Load Test for Mini E-Kart
+Simulates N concurrent shoppers, each in its own headless Chrome session,
+adding and removing products through the asyncio WebDriver client (one
+process, one chromedriver, pooled keep-alive connections). Reports
+throughput and tail latency of cart operations to reports/load_test.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+
+from utilities.async_webdriver import AsyncWebDriver, ChromeDriverService
+from utilities.driver_setup import CATALOG_INDEX_JS, WAIT_FOR_CART_VERSION_JS
+from utilities.perf_metrics import summarize
+from utilities.static_server import APP_ASSETS, StaticServer
+
+REMOVE_BUTTON_JS = """
+return document.querySelector(
+    `#cart-items .cart-item[data-name="${CSS.escape(arguments[0])}"] .remove-btn`);
+"""
+
+
+async def timed_click(driver, element, timeout_ms):
+    """Click and wait for the cart to re-render; returns the latency in ms"""
+    start = time.perf_counter()
+    version = await driver.execute_script("return cartVersion;")
+    await driver.click(element)
+    rendered = await driver.execute_async_script(WAIT_FOR_CART_VERSION_JS, version, timeout_ms)
+    if rendered <= version:
+        raise TimeoutError("cart did not re-render after click")
+    return (time.perf_counter() - start) * 1000
+
+
+async def shopper(shopper_id, service, url, args, deadline, results):
+    """One shopper: open the page, then add/remove products until the deadline"""
+    rng = random.Random(args.seed + shopper_id)
+    samples = results['samples']
+    start = time.perf_counter()
+    try:
+        driver = await AsyncWebDriver(service.pool).start()
+    except Exception as e:
+        results['errors'].append(f"shopper {shopper_id}: session: {e}")
+        return
+    samples['session'].append((time.perf_counter() - start) * 1000)
+    try:
+        await driver.set_script_timeout(args.op_timeout)
+        start = time.perf_counter()
+        await driver.get(url)
+        samples['navigation'].append((time.perf_counter() - start) * 1000)
+        catalog = await driver.execute_script(CATALOG_INDEX_JS)
+        cart = []
+
+        while time.perf_counter() < deadline:
+            if cart and (len(cart) >= args.max_lines or rng.random() < args.remove_ratio):
+                name = cart.pop(rng.randrange(len(cart)))
+                button = await driver.execute_script(REMOVE_BUTTON_JS, name)
+                kind = 'remove'
+            else:
+                name, _, button = rng.choice(catalog)
+                if name not in cart:
+                    cart.append(name)
+                kind = 'add'
+            try:
+                samples[kind].append(await timed_click(driver, button, int(args.op_timeout * 1000)))
+            except Exception as e:
+                results['errors'].append(f"shopper {shopper_id}: {kind} {name}: {e}")
+                break
+            if args.think_ms:
+                await asyncio.sleep(rng.uniform(0, args.think_ms) / 1000)
+    except Exception as e:
+        results['errors'].append(f"shopper {shopper_id}: {e}")
+    finally:
+        await driver.quit()
+
+
+async def run_load_test(args, url):
+    """Start chromedriver, ramp up the shoppers and run them for the test duration"""
+    results = {
+        'samples': {'session': [], 'navigation': [], 'add': [], 'remove': []},
+        'errors': [],
+    }
+    async with ChromeDriverService(args.chromedriver, max_connections=args.connections) as service:
+        deadline = time.perf_counter() + args.ramp_up + args.duration
+
+        async def delayed_shopper(shopper_id):
+            await asyncio.sleep(args.ramp_up * shopper_id / max(1, args.shoppers))
+            await shopper(shopper_id, service, url, args, deadline, results)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(delayed_shopper(i) for i in range(args.shoppers)))
+        elapsed = time.perf_counter() - start
+        results['pool'] = dict(service.pool.stats)
+    results['elapsed_s'] = elapsed
+    return results
+
+
+def main():
+    """Run the load test and save the report"""
+    parser = argparse.ArgumentParser(description="Concurrent shopper load test for Mini E-Kart")
+    parser.add_argument("--shoppers", type=int, default=20, help="concurrent browser sessions")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of shopping per run")
+    parser.add_argument("--ramp-up", type=float, default=5, help="seconds over which sessions start")
+    parser.add_argument("--think-ms", type=float, default=0, help="max random pause between operations")
+    parser.add_argument("--remove-ratio", type=float, default=0.4, help="chance an operation is a removal")
+    parser.add_argument("--max-lines", type=int, default=10, help="cart lines before a shopper must remove")
+    parser.add_argument("--op-timeout", type=float, default=10, help="seconds to wait for a cart update")
+    parser.add_argument("--connections", type=int, default=32, help="keep-alive connections to chromedriver")
+    parser.add_argument("--chromedriver", help="chromedriver path (default: PATH, then webdriver-manager)")
+    parser.add_argument("--file", action="store_true", help="load index.html from file:// instead of HTTP")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="reports/load_test.json")
+    args = parser.parse_args()
+
+    server = None
+    if args.file:
+        url = (PROJECT_ROOT / "index.html").as_uri()
+    else:
+        server = StaticServer(PROJECT_ROOT, allow=APP_ASSETS).start()
+        url = server.url("index.html")
+
+    print(f"🛒 {args.shoppers} shoppers for {args.duration:.0f}s (ramp-up {args.ramp_up:.0f}s)...")
+    try:
+        results = asyncio.run(run_load_test(args, url))
+    finally:
+        if server:
+            server.stop()
+
+    samples = results['samples']
+    operations = len(samples['add']) + len(samples['remove'])
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'shoppers': args.shoppers,
+        'duration_s': args.duration,
+        'elapsed_s': results['elapsed_s'],
+        'url': url,
+        'operations': operations,
+        # Over the wall-clock run (ramp-up included), not the nominal duration
+        'throughput_ops_per_s': operations / results['elapsed_s'] if results['elapsed_s'] else None,
+        'latency': {kind: summarize(values) for kind, values in samples.items()},
+        'cart_ops': summarize(samples['add'] + samples['remove']),
+        'connection_pool': results['pool'],
+        'errors': results['errors'],
+    }
+
+    print(f"   throughput   {report['throughput_ops_per_s']:.1f} ops/s ({operations} operations)")
+    for kind, stats in report['latency'].items():
+        if stats['runs']:
+            print(f"   {kind:<12} p50 {stats['p50']:.1f}ms  p90 {stats['p90']:.1f}ms  "
+                  f"p99 {stats['p99']:.1f}ms  max {stats['max']:.1f}ms  ({stats['runs']} ops)")
+    pool = results['pool']
+    print(f"   connections  {pool['connections_opened']} opened, {pool['reused']} reuses "
+          f"over {pool['requests']} requests")
+    if results['errors']:
+        print(f"⚠️ {len(results['errors'])} shopper error(s), first: {results['errors'][0]}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📊 Load test report saved to: {output}")
+    return 1 if results['errors'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
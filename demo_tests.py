@@ -32,20 +32,24 @@ def main():
     for i, f in enumerate(features, 1):
         print(f"{i}. {f}")
     print("5. Run all tests")
+    print("6. Rerun last failures")
+    print("7. Run tests impacted by local changes")
     print("0. Exit")
 
     try:
-        choice = input("Enter your choice (0-5): ").strip()
+        choice = input("Enter your choice (0-7): ").strip()
         if choice == "0":
             print("Exiting...")
             return
-        elif choice == "5":
-            subprocess.run([sys.executable, "run_tests.py"])
+        elif choice in ["5", "6", "7"]:
+            # Same interpreter: no second Python startup or re-import of the runner
+            import run_tests
+            run_tests.main({"5": ["run"], "6": ["run", "--rerun-failed"], "7": ["run", "--impact"]}[choice])
         elif choice in ["1", "2", "3", "4"]:
             feature = features[int(choice) - 1]
             run_feature_tests(feature)
         else:
-            print("Invalid option. Please enter 0-5.")
+            print("Invalid option. Please enter 0-7.")
     except KeyboardInterrupt:
         print("\nStopped by user.")
     except Exception as e:
@@ -3,7 +3,89 @@ Environment file for Behave tests
 This file sets up the WebDriver before each scenario
 """
 
-from utilities.driver_setup import DriverSetup
+import os
+import json
+import time
+from contextlib import nullcontext
+
+# Selenium-backed modules (driver_setup, perf_metrics, static_server) are
+# imported in the hooks that need them, so model runs never load Selenium
+from utilities.cart_backends import SeleniumCartBackend, ModelCartBackend
+from utilities.cart_model import load_catalog
+
+
+def before_all(context):
+    """
+    Behave hook that runs once before all features
+    Creates the driver pool when pooled mode is enabled
+    """
+    userdata = context.config.userdata
+    context.cart_backend = userdata.get("cart_backend", "selenium")
+    context.driver_pool = None
+    context.money_mode = userdata.get("money_mode", "float")
+    context.fast_startup = userdata.getbool("fast_startup", True)
+    context.static_server = None
+    context.base_url = None
+    context.run_start = os.environ.get("EKART_RUN_START")
+    # Parallel workers write their reports to per-worker files (<name>_<worker_id>)
+    context.worker_id = userdata.get("worker_id")
+    context.report_suffix = f"_{context.worker_id}" if context.worker_id else ""
+    if context.cart_backend != "model" and userdata.getbool("http_server", False):
+        from utilities.static_server import APP_ASSETS, StaticServer
+        # One server per run; pages load over http:// so the browser cache stays warm
+        context.static_server = StaticServer(".", allow=APP_ASSETS,
+                                             gzip_enabled=userdata.getbool("http_gzip", True)).start()
+        context.base_url = context.static_server.url("index.html")
+    if context.cart_backend == "model":
+        # Logic-only runs: scenarios tagged @logic run against the in-process cart model
+        context.catalog = load_catalog()
+        print("🧮 Model cart backend enabled (no browser)")
+    elif userdata.getbool("shared_browser", False):
+        from utilities.driver_setup import SharedBrowser
+        # One Chrome process for the run; every scenario gets a fresh browser context
+        context.driver_pool = SharedBrowser(fast_startup=context.fast_startup,
+                                            base_url=context.base_url, money_mode=context.money_mode)
+        print("🪟 Shared browser mode enabled (one isolated context per scenario)")
+    elif userdata.getbool("driver_pool", False):
+        from utilities.driver_setup import DriverPool
+        context.driver_pool = DriverPool(max_uses=userdata.getint("driver_pool_max_uses", 20),
+                                         checkpoints=userdata.getbool("checkpoint_restore", True),
+                                         base_url=context.base_url, money_mode=context.money_mode,
+                                         fast_startup=context.fast_startup)
+        print("♻️ Pooled driver mode enabled")
+    context.profiler = None
+    if userdata.getbool("profile", False):
+        from utilities.instrumentation import Profiler
+        context.profiler = Profiler()
+    context.artifacts = None
+    if context.cart_backend != "model" and userdata.getbool("failure_artifacts", False):
+        from utilities.artifact_store import ArtifactStore
+        context.artifacts = ArtifactStore(
+            f"reports/artifacts{context.report_suffix}",
+            max_bytes=userdata.getint("failure_artifacts_max_mb", 50) * 1024 * 1024,
+            max_captures=userdata.getint("failure_artifacts_max_captures", 25),
+        )
+    context.perf_metrics = None
+    if context.cart_backend != "model" and userdata.getbool("perf_metrics", False):
+        from utilities.perf_metrics import PerfMetricsCollector
+        context.perf_metrics = PerfMetricsCollector(f"reports/perf_metrics{context.report_suffix}.jsonl",
+                                                    serial=not context.worker_id)
+
+
+def _record_first_scenario(context):
+    """Save the time from starting run_tests.py to the first scenario (once per run)"""
+    timing = {
+        'time_to_first_scenario_s': time.time() - float(context.run_start),
+        'setup': os.environ.get("EKART_SETUP_MODE"),
+    }
+    with open(f"reports/first_scenario{context.report_suffix}.json", "w") as f:
+        json.dump(timing, f, indent=2)
+    context.run_start = None
+
+
+def _phase(context, name):
+    """Profile a block when instrumentation is enabled"""
+    return context.profiler.phase(name) if context.profiler else nullcontext()
 
 
 def before_scenario(context, scenario):
@@ -12,14 +94,72 @@ def before_scenario(context, scenario):
     Sets up the WebDriver and navigates to homepage
     """
     print(f"\n🚀 Starting scenario: {scenario.name}")
-    context.driver_setup = DriverSetup()
+    if context.run_start:
+        _record_first_scenario(context)
+    if context.profiler:
+        context.profiler.start_scenario(scenario.feature.name, scenario.name)
+    if context.perf_metrics:
+        context.perf_metrics.start_scenario(scenario.feature.name, scenario.name)
+
+    if context.cart_backend == "model":
+        if "logic" not in scenario.effective_tags:
+            scenario.skip("needs the selenium backend (DOM/visual checks)")
+            return
+        context.cart = ModelCartBackend(context.catalog)
+        return
+
+    if context.driver_pool:
+        with _phase(context, "DriverPool.acquire"):
+            context.driver_setup = context.driver_pool.acquire()
+        if context.profiler:
+            context.profiler.instrument_driver_setup(context.driver_setup)
+        if context.perf_metrics:
+            context.perf_metrics.instrument_driver_setup(context.driver_setup)
+            if context.driver_setup.uses == 1:
+                # A new session loaded the page inside acquire(), before instrumentation
+                context.perf_metrics.sample(context.driver_setup.get_driver(), "navigation",
+                                            context.driver_setup.base_url)
+        context.driver = context.driver_setup.get_driver()
+        context.wait = context.driver_setup.get_wait()
+        context.cart = SeleniumCartBackend(context.driver_setup)
+        return
+
+    from utilities.driver_setup import DriverSetup
+    context.driver_setup = DriverSetup(base_url=context.base_url, money_mode=context.money_mode,
+                                       fast_startup=context.fast_startup)
+    if context.profiler:
+        context.profiler.instrument_driver_setup(context.driver_setup)
+    if context.perf_metrics:
+        context.perf_metrics.instrument_driver_setup(context.driver_setup)
     context.driver = context.driver_setup.setup_driver()
     context.wait = context.driver_setup.get_wait()
-    
+
     # Navigate to homepage
     success = context.driver_setup.navigate_to_homepage()
     if not success:
         raise Exception("Failed to navigate to homepage")
+    context.cart = SeleniumCartBackend(context.driver_setup)
+
+
+def before_step(context, step):
+    """
+    Behave hook that runs before each step
+    Opens a profiler frame for the step
+    """
+    if context.profiler:
+        context.profiler.enter(f"step:{step.keyword} {step.name}")
+
+
+def after_step(context, step):
+    """
+    Behave hook that runs after each step
+    Captures failure artifacts and closes the step's profiler frame
+    """
+    if context.artifacts and step.status == "failed" and hasattr(context, 'driver_setup'):
+        context.artifacts.capture(context.driver_setup.get_driver(), context.scenario.feature.name,
+                                  context.scenario.name, f"{step.keyword} {step.name}", step.error_message)
+    if context.profiler:
+        context.profiler.exit()
 
 
 def after_scenario(context, scenario):
@@ -29,6 +169,43 @@ def after_scenario(context, scenario):
     """
     print(f"🏁 Completed scenario: {scenario.name}")
     if hasattr(context, 'driver_setup'):
-        context.driver_setup.cleanup()
+        if context.driver_pool:
+            with _phase(context, "DriverPool.release"):
+                context.driver_pool.release(context.driver_setup, failed=scenario.status == "failed")
+        else:
+            context.driver_setup.cleanup()
+    status = getattr(scenario.status, "name", scenario.status)
+    if context.perf_metrics:
+        context.perf_metrics.end_scenario(status)
+    if context.profiler:
+        context.profiler.end_scenario(status)
     print("-" * 50)
 
+
+def after_all(context):
+    """
+    Behave hook that runs once after all features
+    Closes any sessions still held by the driver pool
+    """
+    if context.driver_pool:
+        context.driver_pool.shutdown()
+        if hasattr(context.driver_pool, "write_startup_report"):
+            report = context.driver_pool.write_startup_report(f"reports/startup_times{context.report_suffix}.json")
+            print(f"⏱️ Startup times saved to: {report}")
+        elif context.driver_pool.resets:
+            report = context.driver_pool.write_isolation_report(
+                f"reports/checkpoint_isolation{context.report_suffix}.json")
+            print(f"🧪 Checkpoint isolation report saved to: {report}")
+    if context.static_server:
+        context.static_server.stop()
+        stats = context.static_server.write_stats(f"reports/static_server_stats{context.report_suffix}.json")
+        print(f"🌐 Static server stats saved to: {stats}")
+    if context.artifacts:
+        stats = context.artifacts.close()
+        if stats['captures']:
+            print(f"🗃️ Failure artifacts: {stats['captures']} capture(s), {stats['blobs_written']} blob(s) "
+                  f"({stats['archive_bytes'] // 1024} KB, {stats['deduplicated']} deduplicated) "
+                  f"in {context.artifacts.directory}")
+    if context.profiler:
+        breakdown, folded = context.profiler.write_reports("reports", tag=context.worker_id)
+        print(f"🔥 Profile saved to: {breakdown}, {folded}")
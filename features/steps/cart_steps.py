@@ -1,133 +1,178 @@
-import time
-import re
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-def parse_price(price_text):
-    match = re.search(r'\$?(\d+\.?\d*)', price_text)
-    if match:
-        return float(match.group(1))
-    else:
-        return 0.0
+from utilities.cart_snapshot import parse_price
 
-def get_product_price_by_name(driver, product_name):
-    try:
-        cards = driver.find_elements(By.CLASS_NAME, "product-card")
-        for card in cards:
-            name = card.find_element(By.CLASS_NAME, "product-name").text.strip()
-            if name == product_name:
-                price = card.find_element(By.CLASS_NAME, "product-price").text
-                return parse_price(price)
+def get_product_price_by_name(cart, product_name):
+    price = cart.get_product_price(product_name)
+    if price is None:
         print(f"⚠️ Product {product_name} not found")
         return 0.0
-    except Exception as e:
-        print(f"❌ Error getting price for {product_name}: {e}")
-        return 0.0
-
-def get_cart_item_count(driver):
-    try:
-        items = driver.find_elements(By.CLASS_NAME, "cart-item")
-        return len(items)
-    except:
-        return 0
-
-def get_cart_total_price(driver):
-    try:
-        total = driver.find_element(By.ID, "total-price").text
-        return parse_price(total)
-    except Exception as e:
-        print(f"Error reading total: {e}")
-        return 0.0
+    return price
 
-def is_cart_empty(driver):
-    try:
-        msg = driver.find_element(By.ID, "empty-message")
-        return msg.is_displayed()
-    except:
-        return False
+def get_cart_snapshot(context):
+    return context.cart.snapshot()
 
 @given('the user is on the e-kart homepage')
 def step_user_on_homepage(context):
-    WebDriverWait(context.driver, 10).until(
-        EC.presence_of_element_located((By.CLASS_NAME, "products-grid"))
-    )
-    assert "Mini E-Kart" in context.driver.title
+    context.cart.verify_homepage()
     print("✅ User is on homepage")
 
 @given('the cart is empty')
 def step_cart_is_empty(context):
-    msg = context.driver.find_element(By.ID, "empty-message")
-    assert msg.is_displayed()
-    items = context.driver.find_elements(By.CLASS_NAME, "cart-item")
-    assert len(items) == 0
+    snap = get_cart_snapshot(context)
+    assert snap.empty_message_visible
+    assert snap.line_count == 0
     print("✅ Cart is empty")
 
+@given('the cart contains {count:d} product')
+@given('the cart contains {count:d} products')
+def step_seed_cart_count(context, count):
+    names = context.cart.product_names()
+    if not names:
+        raise AssertionError("No products found")
+    # Seeded in one step; more products than the catalog holds become quantities
+    context.cart.seed([names[i % len(names)] for i in range(count)])
+    snap = get_cart_snapshot(context)
+    assert snap.quantity_count == count, f"Expected {count} products, got {snap.quantity_count}"
+    print(f"✅ Cart seeded with {count} products")
+
+@given('the cart contains a "{product_name}"')
+def step_cart_contains_product(context, product_name):
+    context.cart.seed([product_name])
+    assert get_cart_snapshot(context).find(product_name), f"{product_name} not in cart"
+    print(f"✅ Cart seeded with {product_name}")
+
 @when('the user clicks "Add to Cart" for "{product_name}"')
 def step_click_add_for_product(context, product_name):
-    cards = context.driver.find_elements(By.CLASS_NAME, "product-card")
-    found = False
-    for c in cards:
-        name = c.find_element(By.CLASS_NAME, "product-name").text.strip()
-        if name == product_name:
-            c.find_element(By.CLASS_NAME, "add-btn").click()
-            print(f"✅ Added {product_name}")
-            found = True
-            time.sleep(1)
-            break
-    if not found:
-        raise AssertionError(f"{product_name} not found to add")
+    context.cart.add(product_name)
+    print(f"✅ Added {product_name}")
+
+@when('the user clicks "Add to Cart" for one product')
+def step_click_add_one(context):
+    context.cart.add(context.cart.product_names()[0])
+    print("✅ Added one product")
 
 @when('the user clicks "Remove" for "{product_name}"')
 def step_click_remove(context, product_name):
-    items = context.driver.find_elements(By.CLASS_NAME, "cart-item")
-    ok = False
-    for i in items:
-        n = i.find_element(By.CLASS_NAME, "cart-item-name").text.strip()
-        if n == product_name:
-            i.find_element(By.CLASS_NAME, "remove-btn").click()
-            print(f"✅ Removed {product_name}")
-            time.sleep(1)
-            ok = True
+    context.cart.remove(product_name)
+    print(f"✅ Removed {product_name}")
+
+@when('the user clicks "Remove" for one product')
+def step_click_remove_one(context):
+    if not context.cart.remove_first():
+        raise AssertionError("No product in cart to remove")
+    print("✅ Removed one product")
+
+@when('the user removes all products')
+def step_remove_all(context):
+    # Each click removes a whole line; bounded so a remove that does nothing cannot spin forever
+    for _ in range(get_cart_snapshot(context).line_count):
+        if not context.cart.remove_first():
             break
-    if not ok:
-        raise AssertionError(f"{product_name} not found to remove")
+    remaining = get_cart_snapshot(context).line_count
+    assert remaining == 0, f"{remaining} cart line(s) left after removing all products"
+    print("✅ Removed all products")
+
+@when('the user tries to remove a product')
+def step_try_remove(context):
+    removed = context.cart.remove_first()
+    print(f"✅ Tried to remove a product (removed: {removed})")
 
 @when('the user adds {count:d} products')
 def step_add_multiple(context, count):
-    btns = context.driver.find_elements(By.CLASS_NAME, "add-btn")
-    if len(btns) < count:
+    names = context.cart.product_names()
+    if len(names) < count:
         raise AssertionError("Not enough products")
     for i in range(count):
-        btns[i].click()
+        context.cart.add(names[i])
         print(f"Added product {i+1}")
-        time.sleep(0.5)
+
+@when('the user navigates to homepage')
+def step_navigate_home(context):
+    context.cart.navigate_home()
+    print("✅ Navigated to homepage")
 
 @then('the cart should display that product')
 def step_cart_display(context):
-    WebDriverWait(context.driver, 5).until(
-        EC.presence_of_element_located((By.CLASS_NAME, "cart-item"))
-    )
-    items = context.driver.find_elements(By.CLASS_NAME, "cart-item")
-    assert len(items) > 0
+    snap = get_cart_snapshot(context)
+    assert snap.line_count > 0
     print("✅ Product shown in cart")
 
+@then('the cart should display "{product_name}" with price ${price}')
+def step_cart_display_product(context, product_name, price):
+    line = get_cart_snapshot(context).find(product_name)
+    assert line is not None, f"{product_name} not in cart"
+    assert line.price == parse_price(price), f"Expected ${price}, got {line.price}"
+    print(f"✅ {product_name} shown at {line.price}")
+
+@then('the cart should contain {count:d} product')
+@then('the cart should contain {count:d} products')
+def step_cart_contains(context, count):
+    snap = get_cart_snapshot(context)
+    assert snap.quantity_count == count, f"Expected {count} products, got {snap.quantity_count}"
+    print(f"✅ Cart contains {count} products")
+
+@then('the cart should not contain any products')
+@then('no cart items should be displayed')
+def step_no_cart_items(context):
+    snap = get_cart_snapshot(context)
+    assert snap.line_count == 0, f"Expected no cart items, got {snap.line_count}"
+    print("✅ No cart items")
+
+@then('no remove buttons should be visible')
+def step_no_remove_buttons(context):
+    snap = get_cart_snapshot(context)
+    assert snap.remove_buttons == 0, f"Expected no remove buttons, got {snap.remove_buttons}"
+    print("✅ No remove buttons")
+
+@then('the "{product_name}" should be removed from the cart')
+def step_product_removed(context, product_name):
+    assert get_cart_snapshot(context).find(product_name) is None, f"{product_name} still in cart"
+    print(f"✅ {product_name} removed")
+
 @then('the cart should be empty')
+@then('the cart should remain empty')
 def step_cart_empty(context):
-    msg = context.driver.find_element(By.ID, "empty-message")
-    assert msg.is_displayed()
-    items = context.driver.find_elements(By.CLASS_NAME, "cart-item")
-    assert len(items) == 0
+    snap = get_cart_snapshot(context)
+    assert snap.empty_message_visible
+    assert snap.line_count == 0
     print("✅ Cart empty")
 
+@then('the cart should show "{message}"')
+def step_cart_shows_message(context, message):
+    snap = get_cart_snapshot(context)
+    assert snap.empty_message_visible and message in snap.empty_message, f"'{message}' not shown"
+    print(f"✅ Cart shows '{message}'")
+
+@then('the cart should not show "{message}"')
+def step_cart_hides_message(context, message):
+    snap = get_cart_snapshot(context)
+    assert not (snap.empty_message_visible and message in snap.empty_message), f"'{message}' still shown"
+    print(f"✅ Cart does not show '{message}'")
+
+@then('the empty message should be visible')
+def step_empty_message_visible(context):
+    assert get_cart_snapshot(context).empty_message_visible
+    print("✅ Empty message visible")
+
 @then('the total price should be correctly updated')
 def step_total_correct(context):
-    items = context.driver.find_elements(By.CLASS_NAME, "cart-item")
-    exp_total = 0.0
-    for i in items:
-        price = i.find_element(By.CLASS_NAME, "cart-item-price").text
-        exp_total += parse_price(price)
-    total = context.driver.find_element(By.ID, "total-price").text
-    act_total = parse_price(total)
-    assert abs(exp_total - act_total) < 0.01, f"Expected {exp_total}, got {act_total}"
-    print(f"✅ Total OK: ${act_total:.2f}")
\ No newline at end of file
+    snap = get_cart_snapshot(context)
+    exp_total = snap.expected_total
+    act_total = snap.total
+    assert exp_total == act_total, f"Expected {exp_total}, got {act_total}"
+    if snap.state_total_cents is not None:
+        assert snap.state_total_cents == act_total.cents, \
+            f"Cart state holds {snap.state_total_cents} cents, page shows {act_total}"
+    print(f"✅ Total OK: {act_total}")
+
+@then('the total price should be ${expected}')
+def step_total_is(context, expected):
+    act_total = get_cart_snapshot(context).total
+    exp_total = parse_price(expected)
+    assert exp_total == act_total, f"Expected {exp_total}, got {act_total}"
+    print(f"✅ Total is {act_total}")
+
+@then('the total price should be greater than ${amount}')
+def step_total_greater(context, amount):
+    act_total = get_cart_snapshot(context).total
+    assert act_total > parse_price(amount), f"Expected more than ${amount}, got {act_total}"
+    print(f"✅ Total {act_total} > ${amount}")
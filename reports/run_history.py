@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Historical Test Run Store for Mini E-Kart
+Appends every test run to a local SQLite database and flags scenarios whose
+duration regressed against a rolling baseline of previous runs
+"""
+
+import sys
+import sqlite3
+import hashlib
+import argparse
+import statistics
+from datetime import datetime
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    source TEXT,
+    digest TEXT UNIQUE,
+    total_scenarios INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    feature TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    location TEXT,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    metric TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    p50 REAL,
+    p90 REAL,
+    p95 REAL,
+    p99 REAL,
+    max REAL
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_run ON scenarios(run_id);
+CREATE INDEX IF NOT EXISTS idx_metrics_key ON metrics(metric, run_id);
+CREATE INDEX IF NOT EXISTS idx_scenarios_key ON scenarios(feature, scenario, run_id);
+CREATE INDEX IF NOT EXISTS idx_scenarios_name ON scenarios(scenario, run_id);
+CREATE INDEX IF NOT EXISTS idx_steps_scenario ON steps(scenario_id);
+CREATE INDEX IF NOT EXISTS idx_steps_name ON steps(name, scenario_id);
+"""
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-1 of a result file, used to avoid ingesting the same run twice"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RunHistoryStore:
+    """
+    SQLite-backed store of test runs, scenarios and steps
+    """
+
+    def __init__(self, db_path="reports/run_history.db"):
+        """Open (and create if needed) the history database"""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def append_run(self, records, source=None, digest=None, started_at=None):
+        """
+        Append one run in a single transaction
+        Args:
+            records: Iterable of scenario records (see test_summary.iter_scenario_records)
+            source: Path of the result file the records came from
+            digest: Content digest of the source; runs already stored are skipped
+            started_at: ISO timestamp of the run (defaults to now)
+        Returns:
+            The new run id, or None if the run was already stored
+        """
+        if digest and self.conn.execute("SELECT 1 FROM runs WHERE digest = ?", (digest,)).fetchone():
+            return None
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (started_at, source, digest, total_scenarios, passed, failed, duration) "
+                "VALUES (?, ?, ?, 0, 0, 0, 0)",
+                (started_at or datetime.now().isoformat(), str(source) if source else None, digest)
+            )
+            run_id = cursor.lastrowid
+            total = passed = failed = 0
+            duration = 0.0
+            for record in records:
+                cursor = self.conn.execute(
+                    "INSERT INTO scenarios (run_id, feature, scenario, location, status, duration) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (run_id, record['feature'], record['scenario'], record['location'],
+                     record['status'], record['duration'])
+                )
+                scenario_id = cursor.lastrowid
+                self.conn.executemany(
+                    "INSERT INTO steps (scenario_id, position, name, status, duration) VALUES (?, ?, ?, ?, ?)",
+                    [(scenario_id, position, step['name'], step['status'], step['duration'])
+                     for position, step in enumerate(record['steps'])]
+                )
+                total += 1
+                passed += record['status'] == 'passed'
+                failed += record['status'] == 'failed'
+                duration += record['duration']
+            self.conn.execute(
+                "UPDATE runs SET total_scenarios = ?, passed = ?, failed = ?, duration = ? WHERE id = ?",
+                (total, passed, failed, duration, run_id)
+            )
+        return run_id
+
+    def append_metrics(self, run_id, summary):
+        """
+        Store a run's page performance percentiles
+        Args:
+            run_id: Run the metrics belong to
+            summary: "<kind>.<metric>" -> count/p50/p90/p95/p99/max (see utilities.perf_metrics)
+        """
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO metrics (run_id, metric, count, p50, p90, p95, p99, max) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, metric, stats['count'], stats.get('p50'), stats.get('p90'), stats.get('p95'),
+                  stats.get('p99'), stats.get('max')) for metric, stats in summary.items()]
+            )
+
+    def recent_scenario_durations(self, window=20):
+        """
+        Durations of every scenario over the last `window` runs (passing runs only)
+        Returns:
+            Dict of (feature, scenario) -> list of durations
+        """
+        rows = self.conn.execute(
+            "SELECT feature, scenario, duration FROM scenarios "
+            "WHERE status = 'passed' AND run_id > (SELECT COALESCE(MAX(id), 0) FROM runs) - ?",
+            (window,)
+        ).fetchall()
+        durations = {}
+        for feature, scenario, duration in rows:
+            durations.setdefault((feature, scenario), []).append(duration)
+        return durations
+
+    def recent_feature_durations(self, window=20):
+        """
+        Total duration of each feature per run over the last `window` runs
+        (runs where any of its scenarios failed are left out)
+        Returns:
+            Dict of feature -> list of per-run totals
+        """
+        rows = self.conn.execute(
+            "SELECT feature, SUM(duration) FROM scenarios "
+            "WHERE run_id > (SELECT COALESCE(MAX(id), 0) FROM runs) - ? "
+            "GROUP BY run_id, feature HAVING SUM(status = 'failed') = 0",
+            (window,)
+        ).fetchall()
+        durations = {}
+        for feature, total in rows:
+            durations.setdefault(feature, []).append(total)
+        return durations
+
+    def recent_metric_values(self, metric, stat="p95", window=20):
+        """Per-run values of one metric statistic over the last `window` runs"""
+        if stat not in ('p50', 'p90', 'p95', 'p99', 'max'):
+            raise ValueError(f"Unknown metric statistic: {stat}")
+        rows = self.conn.execute(
+            f"SELECT {stat} FROM metrics WHERE metric = ? AND {stat} IS NOT NULL "
+            "AND run_id > (SELECT COALESCE(MAX(id), 0) FROM runs) - ?",
+            (metric, window)
+        ).fetchall()
+        return [value for value, in rows]
+
+    def latest_run_id(self):
+        """Id of the most recently stored run"""
+        row = self.conn.execute("SELECT MAX(id) FROM runs").fetchone()
+        return row[0]
+
+    def scenario_history(self, feature, scenario, before_run_id=None, limit=10):
+        """Durations of the most recent passing runs of a scenario, newest first"""
+        if before_run_id is None:
+            before_run_id = sys.maxsize
+        rows = self.conn.execute(
+            "SELECT run_id, duration FROM scenarios "
+            "WHERE feature = ? AND scenario = ? AND run_id < ? AND status = 'passed' "
+            "ORDER BY run_id DESC LIMIT ?",
+            (feature, scenario, before_run_id, limit)
+        ).fetchall()
+        return rows
+
+    def find_regressions(self, run_id=None, threshold=0.25, window=10, min_history=3, min_delta=0.1):
+        """
+        Flag scenarios whose duration regressed against a rolling baseline
+        Args:
+            run_id: Run to check (defaults to the latest run)
+            threshold: Allowed relative slowdown over the baseline (0.25 = 25%)
+            window: Number of previous passing runs forming the baseline
+            min_history: Minimum number of previous runs needed to judge
+            min_delta: Ignore slowdowns smaller than this many seconds
+        Returns:
+            List of regression dicts, worst first
+        """
+        run_id = run_id or self.latest_run_id()
+        if run_id is None:
+            return []
+
+        # One query: each scenario of the run with its last `window` passing durations
+        # (ROW_NUMBER needs SQLite 3.25+)
+        rows = self.conn.execute(
+            "WITH current AS (SELECT id, feature, scenario, location, duration FROM scenarios WHERE run_id = :run), "
+            "history AS (SELECT h.feature, h.scenario, h.duration, ROW_NUMBER() OVER "
+            "(PARTITION BY h.feature, h.scenario ORDER BY h.run_id DESC) AS position FROM scenarios h "
+            "JOIN (SELECT DISTINCT feature, scenario FROM current) USING (feature, scenario) "
+            "WHERE h.run_id < :run AND h.status = 'passed') "
+            "SELECT c.id, c.feature, c.scenario, c.location, c.duration, h.duration FROM current c "
+            "LEFT JOIN history h ON h.feature = c.feature AND h.scenario = c.scenario AND h.position <= :window "
+            "ORDER BY c.id",
+            {'run': run_id, 'window': window}
+        ).fetchall()
+        scenarios = {}
+        for scenario_id, feature, scenario, location, duration, previous in rows:
+            entry = scenarios.setdefault(scenario_id, (feature, scenario, location, duration, []))
+            if previous is not None:
+                entry[4].append(previous)
+
+        regressions = []
+        for feature, scenario, location, duration, history in scenarios.values():
+            if len(history) < min_history:
+                continue
+            baseline = statistics.median(history)
+            if duration > baseline * (1 + threshold) and duration - baseline > min_delta:
+                regressions.append({
+                    'feature': feature,
+                    'scenario': scenario,
+                    'location': location,
+                    'duration': duration,
+                    'baseline': baseline,
+                    'ratio': duration / baseline if baseline else float('inf'),
+                })
+        regressions.sort(key=lambda r: r['ratio'], reverse=True)
+        return regressions
+
+    def scenario_trend(self, scenario, limit=20):
+        """Recent (run, status, duration) rows for a scenario name, oldest first"""
+        rows = self.conn.execute(
+            "SELECT s.run_id, r.started_at, s.status, s.duration FROM scenarios s "
+            "JOIN runs r ON r.id = s.run_id WHERE s.scenario = ? ORDER BY s.run_id DESC LIMIT ?",
+            (scenario, limit)
+        ).fetchall()
+        return list(reversed(rows))
+
+
+def main():
+    """Command line interface for ingesting runs and reporting regressions"""
+    parser = argparse.ArgumentParser(description="Mini E-Kart test run history")
+    parser.add_argument("--db", default="reports/run_history.db", help="history database path")
+    parser.add_argument("--ingest", metavar="JSON", help="append a behave JSON result file")
+    parser.add_argument("--regressions", action="store_true", help="report duration regressions")
+    parser.add_argument("--run-id", type=int, help="run to check (default: latest)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative slowdown to flag")
+    parser.add_argument("--window", type=int, default=10, help="runs in the rolling baseline")
+    parser.add_argument("--trend", metavar="SCENARIO", help="show recent durations for a scenario")
+    args = parser.parse_args()
+
+    store = RunHistoryStore(args.db)
+    try:
+        if args.ingest:
+            from test_summary import iter_scenario_records
+            run_id = store.append_run(iter_scenario_records(args.ingest), source=args.ingest,
+                                      digest=file_digest(args.ingest))
+            print(f"🗄️ Stored run {run_id}" if run_id else "ℹ️ Run already stored")
+
+        if args.regressions:
+            regressions = store.find_regressions(args.run_id, args.threshold, args.window)
+            if not regressions:
+                print("✅ No duration regressions detected")
+            for r in regressions:
+                print(f"⚠️ {r['feature']} / {r['scenario']}: {r['duration']:.2f}s "
+                      f"vs baseline {r['baseline']:.2f}s ({r['ratio']:.1f}x)")
+
+        if args.trend:
+            for run_id, started_at, status, duration in store.scenario_trend(args.trend):
+                print(f"run {run_id:<6} {started_at}  {status:<8} {duration:.2f}s")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
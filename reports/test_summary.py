@@ -6,11 +6,100 @@ This script analyzes Behave test results and provides comprehensive statistics
 
 import os
 import re
+import sys
 import json
 import time
 from datetime import datetime
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Also run as `python reports/test_summary.py`, where only reports/ is on the path
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utilities.perf_metrics import load_perf_records, summarize_perf_metrics
+
+STEP_ERROR_STATUSES = ('undefined',)
+
+
+def iter_behave_features(json_file, chunk_size=65536):
+    """
+    Stream feature records from a Behave JSON result file one at a time
+    Only the feature currently being decoded is held in memory
+    Args:
+        json_file: Path to a behave json/json.pretty output file
+        chunk_size: Number of characters read from disk at a time
+    """
+    decoder = json.JSONDecoder()
+    with open(json_file, 'r') as f:
+        buffer = ''
+        eof = False
+        in_array = False
+        while True:
+            buffer = buffer.lstrip(' \t\r\n,')
+            if not in_array and buffer.startswith('['):
+                buffer = buffer[1:]
+                in_array = True
+                continue
+            if buffer.startswith(']'):
+                return
+            if buffer:
+                try:
+                    feature, end = decoder.raw_decode(buffer)
+                except ValueError:
+                    if eof:
+                        raise
+                else:
+                    yield feature
+                    buffer = buffer[end:]
+                    continue
+            if eof:
+                return
+            # Grow reads with the buffer so large features decode in amortized linear time
+            chunk = f.read(max(chunk_size, len(buffer)))
+            if not chunk:
+                eof = True
+            buffer += chunk
+
+
+def iter_scenario_records(json_file):
+    """
+    Stream flattened scenario records (with their steps) from a Behave JSON file
+    Yields:
+        Dict with feature, scenario, location, status, duration and steps
+    """
+    for feature in iter_behave_features(json_file):
+        for element in feature.get('elements', []):
+            if element.get('type') == 'background':
+                continue
+            steps = []
+            for step in element.get('steps', []):
+                result = step.get('result', {})
+                steps.append({
+                    'name': f"{step.get('keyword', '').strip()} {step.get('name', '')}".strip(),
+                    'location': step.get('location'),
+                    'status': result.get('status', 'skipped'),
+                    'duration': result.get('duration', 0.0),
+                })
+            yield {
+                'feature': feature.get('name'),
+                'scenario': element.get('name'),
+                'location': element.get('location'),
+                'status': element.get('status') or _derive_status(steps),
+                'duration': sum(step['duration'] for step in steps),
+                'steps': steps,
+            }
+
+
+def _derive_status(steps):
+    """Scenario status from its steps when Behave did not record one"""
+    statuses = {step['status'] for step in steps}
+    if statuses & {'failed', *STEP_ERROR_STATUSES}:
+        return 'failed'
+    if statuses and statuses <= {'passed'}:
+        return 'passed'
+    return 'skipped'
+
 
 class TestSummaryReporter:
     """
@@ -39,13 +128,118 @@ class TestSummaryReporter:
             'errors': 0,
             'skipped': 0
         }
+        
+        # Aggregated per-step timings: step name -> count/total/max seconds
+        self.step_timings = {}
+        
+        # Page performance percentiles: "<kind>.<metric>" -> count/max/p50/p90/p95/p99
+        self.perf_metrics = {}
     
-    def parse_behave_output(self, output_file="behave_output.txt"):
+    def parse_behave_json(self, json_files=None):
+        """
+        Ingest structured Behave JSON results (streamed, bounded memory)
+        Args:
+            json_files: Result file or list of files (one per run); defaults
+                        to reports/behave_results.json
+        Returns:
+            True if at least one result file was ingested
+        """
+        if json_files is None:
+            json_files = [self.reports_dir / "behave_results.json"]
+        elif isinstance(json_files, (str, Path)):
+            json_files = [json_files]
+        
+        ingested = False
+        for json_file in json_files:
+            if not os.path.exists(json_file):
+                print(f"⚠️ Result file {json_file} not found")
+                continue
+            try:
+                for record in iter_scenario_records(json_file):
+                    self._add_scenario_record(record)
+                ingested = True
+                print(f"✅ Successfully parsed Behave JSON from {json_file}")
+            except ValueError as e:
+                print(f"❌ Error parsing Behave JSON {json_file}: {e}")
+        return ingested
+    
+    def _add_scenario_record(self, record):
+        """Accumulate one scenario record into the statistics"""
+        self.cucumber_stats['total_scenarios'] += 1
+        status = record['status']
+        if status in self.cucumber_stats:
+            self.cucumber_stats[status] += 1
+        else:
+            self.cucumber_stats['skipped'] += 1
+        
+        for step in record['steps']:
+            self.selenium_stats['total_tests'] += 1
+            step_status = step['status']
+            if step_status in STEP_ERROR_STATUSES:
+                self.selenium_stats['errors'] += 1
+            elif step_status in ('passed', 'failed'):
+                self.selenium_stats[step_status] += 1
+            else:
+                self.selenium_stats['skipped'] += 1
+            self.selenium_stats['execution_time'] += step['duration']
+            
+            timing = self.step_timings.setdefault(step['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            timing['count'] += 1
+            timing['total'] += step['duration']
+            timing['max'] = max(timing['max'], step['duration'])
+    
+    def append_to_history(self, json_file=None):
+        """
+        Append the run (and its performance percentiles, if parsed) to the
+        SQLite run history (reports/run_history.db)
+        Args:
+            json_file: Behave JSON result file; defaults to reports/behave_results.json
+        """
+        json_file = json_file or self.reports_dir / "behave_results.json"
+        try:
+            from reports.run_history import RunHistoryStore, file_digest
+            
+            store = RunHistoryStore(self.reports_dir / "run_history.db")
+            try:
+                run_id = store.append_run(iter_scenario_records(json_file), source=json_file,
+                                          digest=file_digest(json_file))
+                if run_id and self.perf_metrics:
+                    store.append_metrics(run_id, self.perf_metrics)
+            finally:
+                store.close()
+            if run_id:
+                print(f"🗄️ Run appended to history (run {run_id})")
+        except Exception as e:
+            print(f"❌ Error appending run to history: {e}")
+    
+    def parse_perf_metrics(self, metrics_files=None):
+        """
+        Summarize page performance samples into percentiles
+        Args:
+            metrics_files: JSONL files written by the metrics collector; defaults
+                           to reports/perf_metrics*.jsonl (one per parallel worker)
+        Returns:
+            True if any samples were found
+        """
+        if metrics_files is None:
+            metrics_files = sorted(self.reports_dir.glob("perf_metrics*.jsonl"))
+        try:
+            self.perf_metrics = summarize_perf_metrics(load_perf_records(metrics_files))
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading performance metrics: {e}")
+            return False
+        if self.perf_metrics:
+            print(f"✅ Summarized {len(self.perf_metrics)} performance metrics")
+        return bool(self.perf_metrics)
+    
+    def parse_behave_output(self, output_file=None):
         """
         Parse Behave test output to extract statistics
         Args:
             output_file: Path to the Behave output file
         """
+        if output_file is None:
+            output_file = self.reports_dir / "behave_output.txt"
         try:
             if not os.path.exists(output_file):
                 print(f"⚠️ Output file {output_file} not found. Creating sample data...")
@@ -69,33 +263,39 @@ class TestSummaryReporter:
     
     def _parse_scenario_results(self, content):
         """Parse scenario execution results from Behave output"""
-        # Count scenarios by status
-        passed_scenarios = len(re.findall(r'(\d+) scenario passed', content))
-        failed_scenarios = len(re.findall(r'(\d+) scenario failed', content))
-        skipped_scenarios = len(re.findall(r'(\d+) scenario skipped', content))
-        
-        # Count steps by status
-        passed_steps = len(re.findall(r'(\d+) step passed', content))
-        failed_steps = len(re.findall(r'(\d+) step failed', content))
-        skipped_steps = len(re.findall(r'(\d+) step skipped', content))
+        # Behave prints "N scenarios passed, N failed, N skipped"; the last
+        # summary in the file covers the whole run
+        scenario_counts = self._last_summary_counts(r'scenarios?', content)
+        step_counts = self._last_summary_counts(r'steps?', content)
+        undefined_match = re.findall(r'steps? passed.*?(\d+) undefined', content)
+        undefined_steps = int(undefined_match[-1]) if undefined_match else 0
         
         # Update Cucumber statistics
-        self.cucumber_stats['total_scenarios'] = passed_scenarios + failed_scenarios + skipped_scenarios
-        self.cucumber_stats['passed'] = passed_scenarios
-        self.cucumber_stats['failed'] = failed_scenarios
-        self.cucumber_stats['skipped'] = skipped_scenarios
+        self.cucumber_stats['total_scenarios'] = sum(scenario_counts)
+        self.cucumber_stats['passed'] = scenario_counts[0]
+        self.cucumber_stats['failed'] = scenario_counts[1]
+        self.cucumber_stats['skipped'] = scenario_counts[2]
         
         # Update Selenium statistics (steps are individual Selenium actions)
-        self.selenium_stats['total_tests'] = passed_steps + failed_steps + skipped_steps
-        self.selenium_stats['passed'] = passed_steps
-        self.selenium_stats['failed'] = failed_steps
-        self.selenium_stats['skipped'] = skipped_steps
+        self.selenium_stats['total_tests'] = sum(step_counts) + undefined_steps
+        self.selenium_stats['passed'] = step_counts[0]
+        self.selenium_stats['failed'] = step_counts[1]
+        self.selenium_stats['skipped'] = step_counts[2]
+        self.selenium_stats['errors'] = undefined_steps
+    
+    def _last_summary_counts(self, noun, content):
+        """Return (passed, failed, skipped) from the last Behave summary line for a noun"""
+        matches = re.findall(rf'(\d+) {noun} passed, (\d+) failed, (\d+) skipped', content)
+        if not matches:
+            return (0, 0, 0)
+        return tuple(int(n) for n in matches[-1])
     
     def _parse_execution_time(self, content):
-        """Parse execution time from Behave output"""
-        time_match = re.search(r'(\d+\.?\d*) seconds', content)
-        if time_match:
-            self.selenium_stats['execution_time'] = float(time_match.group(1))
+        """Parse execution time from Behave output ("Took 1m23.456s")"""
+        time_matches = re.findall(r'Took (\d+)m(\d+\.?\d*)s', content)
+        if time_matches:
+            minutes, seconds = time_matches[-1]
+            self.selenium_stats['execution_time'] = int(minutes) * 60 + float(seconds)
     
     def _create_sample_data(self):
         """Create sample test data for demonstration"""
@@ -161,6 +361,28 @@ class TestSummaryReporter:
         
         print()
         
+        # Slowest steps (only available from JSON results)
+        if self.step_timings:
+            print("🐢 Slowest Steps (total time)")
+            print("-" * 30)
+            slowest = sorted(self.step_timings.items(), key=lambda kv: kv[1]['total'], reverse=True)[:5]
+            for name, timing in slowest:
+                print(f"{timing['total']:7.2f}s  x{timing['count']:<3} {name}")
+            print()
+        
+        # Page performance percentiles (only available with perf_metrics enabled)
+        if self.perf_metrics:
+            print("⚡ Page Performance (p50 / p95 / p99)")
+            print("-" * 30)
+            for metric, stats in self.perf_metrics.items():
+                if not metric.endswith("Ms"):
+                    continue
+                print(f"{metric:<40} {stats['p50']:8.1f} {stats['p95']:8.1f} {stats['p99']:8.1f} ms  (n={stats['count']})")
+            heap = self.perf_metrics.get("navigation.heapUsedBytes")
+            if heap:
+                print(f"{'JS heap used (p95)':<40} {heap['p95'] / 1048576:8.1f} MB")
+            print()
+        
         # Overall Summary
         print("📈 Overall Summary")
         print("-" * 30)
@@ -250,7 +472,9 @@ class TestSummaryReporter:
                     'total_passed': self.selenium_stats['passed'] + self.cucumber_stats['passed'],
                     'total_failed': self.selenium_stats['failed'] + self.cucumber_stats['failed'],
                     'execution_time': self.selenium_stats['execution_time']
-                }
+                },
+                'step_timings': self.step_timings,
+                'perf_metrics': self.perf_metrics
             }
             
             report_path = self.reports_dir / filename
@@ -273,8 +497,12 @@ def main():
     # Initialize reporter
     reporter = TestSummaryReporter()
     
-    # Parse test results
-    reporter.parse_behave_output()
+    # Parse test results (structured JSON first, text output as a fallback)
+    reporter.parse_perf_metrics()
+    if reporter.parse_behave_json():
+        reporter.append_to_history()
+    else:
+        reporter.parse_behave_output()
     
     # Generate and display summary
     reporter.generate_summary_report()
@@ -2,14 +2,37 @@
 """
 Mini E-Kart Testing Framework Setup and Execution Script
 This script handles the complete setup and execution of Selenium + Cucumber tests
+
+Usage:
+    python run_tests.py [run] [PATH ...] [--workers N] [--rerun-failed] [--impact]
+    python run_tests.py feature add_to_cart
+    python run_tests.py setup [--force]
+    python run_tests.py summary
 """
 
 import os
 import sys
+import json
+import hashlib
 import subprocess
+import re
 import time
+import argparse
 from pathlib import Path
 
+# Taken before anything else runs, for the time-to-first-scenario measurement of a
+# command-line run; in-process callers (demo_tests.py) get a fresh start time per main()
+RUN_START = time.time()
+
+SUBCOMMANDS = ("run", "feature", "setup", "summary")
+
+# Behave's closing totals ("3 features passed, ...", "Took 0m12.3s") are always echoed
+BEHAVE_SUMMARY_LINE = re.compile(r"^(\d+ (features?|scenarios?|steps?) passed|Took \d)")
+
+
+class SetupError(Exception):
+    """Setup could not be completed; main() turns it into exit code 1"""
+
 
 class TestFrameworkSetup:
     """
@@ -21,12 +44,13 @@ class TestFrameworkSetup:
         self.project_root = Path.cwd()
         self.reports_dir = self.project_root / "reports"
         self.features_dir = self.project_root / "features"
+        self.fingerprint_file = self.project_root / ".cache" / "setup_fingerprint.json"
+        self.setup_mode = None
         
     def check_python_version(self):
         """Check if Python version is compatible"""
         if sys.version_info < (3, 7):
-            print("❌ Python 3.7 or higher is required")
-            sys.exit(1)
+            raise SetupError("Python 3.7 or higher is required")
         print(f"✅ Python {sys.version.split()[0]} detected")
     
     def install_dependencies(self):
@@ -37,28 +61,57 @@ class TestFrameworkSetup:
                           check=True, capture_output=True, text=True)
             print("✅ Dependencies installed successfully")
         except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install dependencies: {e}")
-            sys.exit(1)
+            raise SetupError(f"Failed to install dependencies: {e}")
     
-    def check_chrome_driver(self):
-        """Check if Chrome WebDriver is available"""
+    def check_chrome_driver(self, force=False):
+        """
+        Check if Chrome WebDriver is available
+        A successful probe is cached until the Chrome or chromedriver version changes
+        """
         print("🔍 Checking Chrome WebDriver...")
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.quit()
-            print("✅ Chrome WebDriver is working")
-        except Exception as e:
-            print(f"❌ Chrome WebDriver issue: {e}")
+        from utilities.driver_probe import probe_driver
+
+        result = probe_driver(force=force)
+        if not result['ok']:
             print("💡 Please install Chrome and ChromeDriver")
-            sys.exit(1)
+            raise SetupError(f"Chrome WebDriver issue: {result['error']}")
+        if result['cached']:
+            print(f"✅ Chrome WebDriver is working (cached probe, {result['chrome'] or 'Chrome'})")
+        else:
+            print(f"✅ Chrome WebDriver is working (probe took {result['probe_s']:.1f}s)")
+    
+    def setup_fingerprint(self):
+        """What the dependency install and driver probe depend on"""
+        from utilities.driver_probe import chrome_version
+        
+        requirements = self.project_root / "requirements.txt"
+        return {
+            'python': sys.version,
+            'executable': sys.executable,
+            'requirements': hashlib.sha256(requirements.read_bytes()).hexdigest() if requirements.exists() else None,
+            'chrome': chrome_version(),
+        }
+    
+    def ensure_setup(self, force=False):
+        """
+        Install dependencies and probe the driver only when requirements.txt,
+        the interpreter or the Chrome version changed since the last setup
+        """
+        fingerprint = self.setup_fingerprint()
+        if not force and self.fingerprint_file.exists():
+            try:
+                cached = json.loads(self.fingerprint_file.read_text())
+            except ValueError:
+                cached = None
+            if cached == fingerprint:
+                print("✅ requirements.txt and Chrome unchanged - skipping dependency install and driver probe")
+                self.setup_mode = "cached"
+                return
+        self.install_dependencies()
+        self.check_chrome_driver(force=force)
+        self.fingerprint_file.parent.mkdir(parents=True, exist_ok=True)
+        self.fingerprint_file.write_text(json.dumps(fingerprint, indent=2))
+        self.setup_mode = "full"
     
     def create_directories(self):
         """Create necessary directories"""
@@ -66,19 +119,37 @@ class TestFrameworkSetup:
         self.reports_dir.mkdir(exist_ok=True)
         print("✅ Directories created")
     
-    def run_tests(self):
-        """Execute all Cucumber tests"""
+    def run_tests(self, workers=1, locations=None, verbose=False):
+        """
+        Execute all Cucumber tests
+        Args:
+            workers: Number of parallel worker processes (1 runs serially)
+            locations: Optional scenario locations (file:line) to run instead of the whole suite
+            verbose: Echo all behave output, not just scenario results and totals
+        """
         print("🚀 Starting test execution...")
         print("="*60)
         
+        if locations is not None and not locations:
+            print("✅ No scenarios selected - nothing to run")
+            return True
+        
+        if workers > 1:
+            return self.run_tests_parallel(workers, locations)
+        
         try:
-            # Run behave with detailed output
+            # Stream results: NDJSON events on stdout, consumed line by line
             cmd = [
                 sys.executable, "-m", "behave",
-                "features/",
-                "--format=pretty",
+                *(locations or ["features/"]),
+                # Outfiles pair with formats by position: JSON to the report, the pretty
+                # log to behave_output.txt, events to stdout
                 "--format=json.pretty",
                 "--outfile=reports/behave_results.json",
+                "--format=pretty",
+                "--outfile=reports/behave_output.txt",
+                "--format=ndjson",
+                "--outfile=-",
                 "--no-capture",
                 "--no-capture-stderr"
             ]
@@ -86,78 +157,296 @@ class TestFrameworkSetup:
             print("Executing command:", " ".join(cmd))
             print()
             
-            # Run the tests
-            result = subprocess.run(cmd, cwd=self.project_root, 
-                                  capture_output=True, text=True)
-            
-            # Save output to file
-            with open(self.reports_dir / "behave_output.txt", "w") as f:
-                f.write(result.stdout)
-                if result.stderr:
-                    f.write("\nSTDERR:\n")
-                    f.write(result.stderr)
+            from utilities.live_results import LiveResults
             
-            # Print output to console
-            print(result.stdout)
-            if result.stderr:
-                print("STDERR:")
-                print(result.stderr)
+            live = LiveResults(self.reports_dir)
+            process = subprocess.Popen(cmd, cwd=self.project_root, stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, text=True, bufsize=1,
+                                       env=dict(os.environ, PYTHONUNBUFFERED="1"))
+            # The console log is written as lines arrive; only the summary lines are kept
+            summary_lines = []
+            with open(self.reports_dir / "behave_console.txt", "w") as output:
+                for line in process.stdout:
+                    event = live.parse(line)
+                    if event is None:
+                        output.write(line)
+                        is_summary = BEHAVE_SUMMARY_LINE.match(line)
+                        if is_summary:
+                            summary_lines.append(line)
+                        if verbose or is_summary:
+                            print(line, end="")
+                        continue
+                    text = live.handle(event)
+                    if text:
+                        output.write(text)
+                        print(text, end="", flush=True)
+            returncode = process.wait()
+            live.finish()
+            # Behave prints its totals to stdout, not to the pretty outfile; the
+            # summary's fallback parser reads them from behave_output.txt
+            with open(self.reports_dir / "behave_output.txt", "a") as output:
+                output.write("\n" + "".join(summary_lines))
             
             print("="*60)
-            print(f"Test execution completed with exit code: {result.returncode}")
+            print(f"Test execution completed with exit code: {returncode}")
             
-            return result.returncode == 0
+            return returncode == 0
             
         except Exception as e:
             print(f"❌ Error running tests: {e}")
             return False
     
+    def run_tests_parallel(self, workers, locations=None):
+        """Execute all Cucumber tests across parallel worker processes"""
+        from utilities.parallel_runner import ParallelRunner
+        
+        try:
+            success = ParallelRunner(self.project_root, workers).run(locations)
+            print("="*60)
+            print(f"Parallel test execution completed ({'passed' if success else 'failed'})")
+            return success
+        except Exception as e:
+            print(f"❌ Error running tests in parallel: {e}")
+            return False
+    
+    def select_tests(self, rerun_failed=False, impact=False, since=None):
+        """
+        Select the scenarios to run
+        Args:
+            rerun_failed: Only scenarios that failed in the previous behave_results.json
+            impact: Only scenarios affected by changed files
+            since: Git ref to diff against for impact mode (default: uncommitted changes)
+        Returns:
+            List of scenario locations, or None to run the whole suite
+        """
+        if not (rerun_failed or impact):
+            return None
+        
+        from utilities.test_selection import TestSelector
+        
+        selector = TestSelector(self.project_root)
+        selected = []
+        if rerun_failed:
+            failed = selector.rerun_failed(self.reports_dir / "behave_results.json")
+            print(f"🔁 Rerunning {len(failed)} previously failed scenarios")
+            selected += failed
+        if impact:
+            impacted, explanation = selector.impacted(since=since)
+            for path, count in explanation.items():
+                print(f"🎯 {path}: {count} scenarios affected")
+            print(f"🎯 {len(impacted)} of {len(selector.scenarios)} scenarios impacted by changes")
+            selected += [location for location in impacted if location not in selected]
+        return selected
+    
     def generate_summary(self):
-        """Generate test summary report"""
+        """Generate test summary report (in-process, no second interpreter)"""
         print("📊 Generating test summary...")
         try:
-            summary_script = self.project_root / "reports" / "test_summary.py"
-            subprocess.run([sys.executable, str(summary_script)], check=True)
+            from reports.test_summary import main as summary_main
+            summary_main()
         except Exception as e:
             print(f"❌ Error generating summary: {e}")
     
-    def setup_and_run(self):
-        """Complete setup and test execution"""
+    def report_time_to_first_scenario(self):
+        """
+        Print how long it took from starting the runner to the first scenario
+        (written by features/environment.py; the earliest worker when parallel)
+        """
+        timings = []
+        for path in self.reports_dir.glob("first_scenario*.json"):
+            try:
+                timings.append(json.loads(path.read_text())['time_to_first_scenario_s'])
+            except (ValueError, KeyError):
+                continue
+        if timings:
+            print(f"⏱️ Time to first scenario: {min(timings):.2f}s (setup: {self.setup_mode})")
+        return min(timings) if timings else None
+    
+    def check_budgets(self, budgets_file, tighten=False):
+        """
+        Check the run (merged results when parallel) against the performance budgets
+        Args:
+            budgets_file: Path of the budget file (see utilities/budgets.py)
+            tighten: Afterwards lower the budgets to historical p95 * headroom
+        Returns:
+            True if every budget was met
+        """
+        from utilities.budgets import check_run, format_violations, load_budgets, save_budgets, tighten_budgets
+        
+        results_json = self.reports_dir / "behave_results.json"
+        if not Path(budgets_file).exists() or not results_json.exists():
+            print(f"⚠️ Skipping budget check ({budgets_file} or {results_json} missing)")
+            return True
+        
+        print(f"⏱️ Checking performance budgets from {budgets_file}...")
+        violations = check_run(budgets_file, results_json, reports_dir=self.reports_dir)
+        if violations:
+            print(format_violations(violations))
+        else:
+            print("✅ All performance budgets met")
+        
+        if tighten:
+            from reports.run_history import RunHistoryStore
+            
+            store = RunHistoryStore(self.reports_dir / "run_history.db")
+            try:
+                budgets, changes = tighten_budgets(load_budgets(budgets_file), store)
+            finally:
+                store.close()
+            if changes:
+                save_budgets(budgets, budgets_file)
+            print(f"🔧 {len(changes)} budget(s) tightened from historical p95")
+        
+        return not violations
+    
+    def setup_and_run(self, workers=1, rerun_failed=False, impact=False, since=None,
+                      budgets_file="budgets.json", tighten_budgets=False, paths=None, force_setup=False,
+                      verbose=False, run_start=None):
+        """
+        Complete setup and test execution
+        Args:
+            paths: Feature files or scenario locations to run (default: the whole suite)
+            force_setup: Install dependencies and probe the driver even if nothing changed
+            verbose: Echo all behave output while the tests run
+            run_start: When the run started (time.time()), for the time to first scenario
+        Returns:
+            True if all tests passed and all performance budgets were met
+        Raises:
+            SetupError: If the Python version, dependency install or driver probe fails
+        """
         print("🎯 Mini E-Kart Testing Framework Setup")
         print("="*50)
         
-        # Setup steps
+        # Setup steps (skipped while the setup fingerprint is unchanged)
         self.check_python_version()
-        self.install_dependencies()
-        self.check_chrome_driver()
+        self.ensure_setup(force_setup)
         self.create_directories()
         
         print("\n✅ Setup completed successfully!")
         print("\n🚀 Starting test execution...")
         
-        # Run tests
-        success = self.run_tests()
+        # Select and run tests
+        locations = self.select_tests(rerun_failed, impact, since)
+        if locations is None and paths:
+            locations = list(paths)
+        if locations is not None and not locations:
+            # The reports still describe the previous run; summarizing them again would
+            # append that run to the history twice and gate budgets on stale results
+            print("✅ No scenarios selected - nothing to run")
+            return True
+        for stale in self.reports_dir.glob("first_scenario*.json"):
+            stale.unlink()
+        os.environ["EKART_RUN_START"] = str(time.time() if run_start is None else run_start)
+        os.environ["EKART_SETUP_MODE"] = self.setup_mode
+        success = self.run_tests(workers, locations, verbose)
+        self.report_time_to_first_scenario()
         
         # Generate summary
         self.generate_summary()
         
+        # Enforce performance budgets
+        within_budget = True
+        if budgets_file:
+            within_budget = self.check_budgets(budgets_file, tighten_budgets)
+        
         # Final status
-        if success:
+        if success and within_budget:
             print("\n🎉 All tests completed successfully!")
+        elif success:
+            print("\n⚠️ All tests passed but performance budgets were exceeded.")
         else:
             print("\n⚠️ Some tests failed. Check the reports for details.")
         
         print(f"\n📁 Reports saved in: {self.reports_dir}")
-        print("📄 Check 'behave_output.txt' for detailed test results")
+        print("📄 Check 'behave_output.txt' for detailed test results ('behave_console.txt' for hook output)")
+        print("📡 Check 'live_summary.json' and 'events.ndjson' for the streamed results")
         print("📊 Check 'test_summary_report.txt' for summary statistics")
+        return success and within_budget
 
 
-def main():
-    """Main function"""
+def build_parser():
+    """One CLI for setup, test runs and reports"""
+    parser = argparse.ArgumentParser(description="Mini E-Kart test runner")
+    commands = parser.add_subparsers(dest="command")
+    
+    run = commands.add_parser("run", help="set up (if needed), run the suite, summarize and check budgets")
+    run.add_argument("paths", nargs="*", metavar="PATH",
+                     help="feature files or scenario locations (default: features/)")
+    add_run_arguments(run)
+    
+    feature = commands.add_parser("feature", help="run one feature file by name, e.g. add_to_cart")
+    feature.add_argument("name")
+    add_run_arguments(feature)
+    
+    setup = commands.add_parser("setup", help="install dependencies and probe Chrome WebDriver")
+    setup.add_argument("--force", action="store_true", help="ignore the cached setup fingerprint")
+    
+    commands.add_parser("summary", help="regenerate the summary from the last run")
+    return parser
+
+
+def add_run_arguments(parser):
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of parallel worker processes (default: 1, serial)")
+    parser.add_argument("--rerun-failed", action="store_true",
+                        help="only run scenarios that failed in the previous run")
+    parser.add_argument("--impact", action="store_true",
+                        help="only run scenarios affected by changed files")
+    parser.add_argument("--since", metavar="REF",
+                        help="git ref to compare against in --impact mode")
+    parser.add_argument("--budgets", default="budgets.json", metavar="FILE",
+                        help="performance budget file checked after the run (default: budgets.json)")
+    parser.add_argument("--no-budgets", action="store_true",
+                        help="do not enforce performance budgets")
+    parser.add_argument("--tighten-budgets", action="store_true",
+                        help="lower the budgets to historical p95 after the run")
+    parser.add_argument("--force-setup", action="store_true",
+                        help="install dependencies and probe the driver even if nothing changed")
+    parser.add_argument("--verbose", action="store_true",
+                        help="echo all behave output, not just scenario results")
+
+
+def main(argv=None, run_start=None):
+    """
+    Main function
+    Args:
+        argv: Command line without the program name (default: sys.argv[1:])
+        run_start: When the run started (default: now)
+    Returns:
+        Process exit code
+    """
+    run_start = time.time() if run_start is None else run_start
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Plain `run_tests.py [--flags]` keeps working as `run_tests.py run [--flags]`
+    if not argv or argv[0] not in SUBCOMMANDS + ("-h", "--help"):
+        argv.insert(0, "run")
+    args = build_parser().parse_args(argv)
+    
     setup = TestFrameworkSetup()
-    setup.setup_and_run()
+    if args.command == "summary":
+        setup.generate_summary()
+        return 0
+    
+    try:
+        if args.command == "setup":
+            setup.check_python_version()
+            setup.ensure_setup(force=args.force)
+            setup.create_directories()
+            return 0
+        
+        paths = [f"features/{args.name}.feature"] if args.command == "feature" else args.paths
+        ok = setup.setup_and_run(workers=args.workers, rerun_failed=args.rerun_failed,
+                                 impact=args.impact, since=args.since,
+                                 budgets_file=None if args.no_budgets else args.budgets,
+                                 tighten_budgets=args.tighten_budgets,
+                                 paths=paths, force_setup=args.force_setup, verbose=args.verbose,
+                                 run_start=run_start)
+    except SetupError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0 if ok else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(run_start=RUN_START))
 
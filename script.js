@@ -2,8 +2,24 @@
 // This file contains all the cart functionality and event handlers
 
 // Global variables to store cart data
-let cart = []; // Array to store cart items
-let totalPrice = 0; // Total price of all items in cart
+const cartIndex = new Map(); // Product name -> cart item, in the order items were added
+const cartNodes = new Map(); // Product name -> rendered cart line ({ root, info, quantity })
+let totalPrice = 0; // Total price of all items in cart (running sum)
+let totalCents = 0; // Total price of all items in integer cents (running sum)
+let cartVersion = 0; // Incremented every time the cart finishes re-rendering
+
+// Cart persistence: the cart is saved to localStorage as a compact list of
+// [name, priceCents, quantity] rows. Writes are debounced so a burst of
+// clicks is coalesced into a single write
+const CART_STORAGE_KEY = 'ekart.cart.v1';
+const CART_PERSIST_DELAY_MS = 250;
+let persistTimer = null; // Pending debounced write, if any
+let cartStorageWrites = 0; // Number of localStorage writes (for tests and benchmarks)
+
+// Money mode: 'float' (default) accumulates totalPrice as floating point,
+// 'cents' accumulates integer cents and derives the displayed total from them.
+// Select with ?money=cents in the page URL.
+const moneyMode = new URLSearchParams(window.location.search).get('money') === 'cents' ? 'cents' : 'float';
 
 // DOM elements
 const cartItemsContainer = document.getElementById('cart-items');
@@ -20,8 +36,20 @@ document.addEventListener('DOMContentLoaded', function() {
         button.addEventListener('click', addToCart);
     });
     
-    // Initialize cart display
+    // Restore the saved cart, then render it in a single pass
+    loadCartFromStorage();
     updateCartDisplay();
+    
+    // The restored cart is already saved
+    cancelCartPersist();
+});
+
+// Write any pending cart change before the page goes away
+window.addEventListener('pagehide', flushCartStorage);
+document.addEventListener('visibilitychange', function() {
+    if (document.visibilityState === 'hidden') {
+        flushCartStorage();
+    }
 });
 
 /**
@@ -29,6 +57,8 @@ document.addEventListener('DOMContentLoaded', function() {
  * @param {Event} event - The click event from the add button
  */
 function addToCart(event) {
+    const started = performance.now();
+    
     // Get product information from the button's data attributes
     const productName = event.target.getAttribute('data-name');
     const productPrice = parseFloat(event.target.getAttribute('data-price'));
@@ -36,25 +66,35 @@ function addToCart(event) {
     console.log(`Adding ${productName} ($${productPrice}) to cart`);
     
     // Check if product already exists in cart
-    const existingItem = cart.find(item => item.name === productName);
+    const existingItem = cartIndex.get(productName);
     
     if (existingItem) {
         // If product exists, increase quantity
         existingItem.quantity += 1;
         console.log(`Increased quantity of ${productName} to ${existingItem.quantity}`);
+        
+        // Patch only the quantity label of the existing line
+        addToTotal(existingItem.price, existingItem.priceCents);
+        updateCartLineQuantity(existingItem);
     } else {
         // If product doesn't exist, add new item to cart
         const newItem = {
             name: productName,
             price: productPrice,
+            priceCents: toCents(productPrice),
             quantity: 1
         };
-        cart.push(newItem);
+        cartIndex.set(productName, newItem);
         console.log(`Added new item: ${productName}`);
+        
+        // Append a single new line
+        addToTotal(newItem.price, newItem.priceCents);
+        insertCartLine(newItem);
     }
     
-    // Update the cart display and total
-    updateCartDisplay();
+    // Update the total and empty message
+    renderCartTotals();
+    measureCartUpdate('add', started);
     
     // Provide visual feedback to user
     showAddToCartFeedback(event.target);
@@ -65,53 +105,204 @@ function addToCart(event) {
  * @param {string} productName - Name of the product to remove
  */
 function removeFromCart(productName) {
+    const started = performance.now();
     console.log(`Removing ${productName} from cart`);
     
     // Find the item in cart
-    const itemIndex = cart.findIndex(item => item.name === productName);
+    const item = cartIndex.get(productName);
     
-    if (itemIndex !== -1) {
-        // Remove the item from cart array
-        cart.splice(itemIndex, 1);
+    if (item) {
+        // Remove the item from the cart index
+        cartIndex.delete(productName);
         console.log(`Removed ${productName} from cart`);
         
-        // Update the cart display
-        updateCartDisplay();
+        // Drop its line and subtract it from the running total
+        addToTotal(-item.price * item.quantity, -item.priceCents * item.quantity);
+        deleteCartLine(productName);
+        renderCartTotals();
+        measureCartUpdate('remove', started);
+    }
+}
+
+/**
+ * Record how long a cart update took as a 'cart-update' performance measure
+ * (read by the test harness's performance metrics collector)
+ * @param {string} kind - 'add' or 'remove'
+ * @param {number} started - performance.now() when the update began
+ */
+function measureCartUpdate(kind, started) {
+    if (performance.measure) {
+        performance.measure('cart-update', { start: started, end: performance.now(), detail: kind });
     }
 }
 
 /**
  * Update the cart display on the page
- * This function handles showing/hiding empty message and rendering cart items
+ * Full render: rebuilds every cart line and recomputes the total. Used on
+ * start-up and after bulk changes; single adds/removes patch the DOM instead
  */
 function updateCartDisplay() {
     // Calculate total price
     calculateTotalPrice();
     
-    // Update total price display
-    totalPriceElement.textContent = totalPrice.toFixed(2);
-    
     // Clear the cart items container
     cartItemsContainer.innerHTML = '';
+    cartNodes.clear();
     
-    if (cart.length === 0) {
-        // Show empty message if cart is empty
-        emptyMessage.style.display = 'block';
-        console.log('Cart is empty - showing empty message');
-    } else {
-        // Hide empty message and show cart items
-        emptyMessage.style.display = 'none';
-        
-        // Render each item in the cart
-        cart.forEach(item => {
-            const cartItemElement = createCartItemElement(item);
-            cartItemsContainer.appendChild(cartItemElement);
-        });
-        
-        console.log(`Displaying ${cart.length} items in cart`);
+    // Render each item in the cart
+    const fragment = document.createDocumentFragment();
+    cartIndex.forEach(item => {
+        const cartItemElement = createCartItemElement(item);
+        fragment.appendChild(cartItemElement);
+    });
+    cartItemsContainer.appendChild(fragment);
+    
+    console.log(`Displaying ${cartIndex.size} items in cart`);
+    
+    renderCartTotals();
+}
+
+/**
+ * Show the total and the empty message for the current cart
+ * O(1): reads the running totals instead of walking the cart
+ */
+function renderCartTotals() {
+    // Update total price display
+    totalPriceElement.textContent = moneyMode === 'cents' ? formatCents(totalCents) : totalPrice.toFixed(2);
+    
+    // Show empty message if cart is empty
+    emptyMessage.style.display = cartIndex.size === 0 ? 'block' : 'none';
+    
+    // Signal that the cart has been re-rendered (used by the test harness to
+    // wait for updates instead of sleeping)
+    markCartRendered();
+    
+    // Save the new state (debounced)
+    scheduleCartPersist();
+}
+
+/**
+ * Serialize the cart to its compact storage form
+ * @returns {string} - JSON list of [name, priceCents, quantity] rows
+ */
+function serializeCart() {
+    const rows = [];
+    cartIndex.forEach(item => rows.push([item.name, item.priceCents, item.quantity]));
+    return JSON.stringify(rows);
+}
+
+/**
+ * Queue a cart write; repeated calls within the delay share one write
+ */
+function scheduleCartPersist() {
+    if (persistTimer !== null) {
+        return;
+    }
+    persistTimer = setTimeout(flushCartStorage, CART_PERSIST_DELAY_MS);
+}
+
+/**
+ * Write the cart to localStorage now if a write is pending
+ */
+function flushCartStorage() {
+    if (persistTimer === null) {
+        return;
+    }
+    clearTimeout(persistTimer);
+    persistTimer = null;
+    try {
+        if (cartIndex.size === 0) {
+            localStorage.removeItem(CART_STORAGE_KEY);
+        } else {
+            localStorage.setItem(CART_STORAGE_KEY, serializeCart());
+        }
+        cartStorageWrites += 1;
+    } catch (error) {
+        // Storage can be unavailable (private mode, quota); the cart still works in memory
+        console.warn(`Could not save cart: ${error}`);
     }
 }
 
+/**
+ * Drop any pending write without saving it
+ */
+function cancelCartPersist() {
+    if (persistTimer !== null) {
+        clearTimeout(persistTimer);
+        persistTimer = null;
+    }
+}
+
+/**
+ * Fill the cart index from localStorage (does not render)
+ * @returns {number} - Number of cart lines restored
+ */
+function loadCartFromStorage() {
+    let rows;
+    try {
+        rows = JSON.parse(localStorage.getItem(CART_STORAGE_KEY) || '[]');
+    } catch (error) {
+        console.warn(`Ignoring unreadable saved cart: ${error}`);
+        return 0;
+    }
+    cartIndex.clear();
+    rows.forEach(([name, priceCents, quantity]) => {
+        cartIndex.set(name, { name: name, price: priceCents / 100, priceCents: priceCents, quantity: quantity });
+    });
+    console.log(`Restored ${cartIndex.size} items from storage`);
+    return cartIndex.size;
+}
+
+/**
+ * Append the line for a newly added item
+ * @param {Object} item - Cart item object with name, price, and quantity
+ */
+function insertCartLine(item) {
+    cartItemsContainer.appendChild(createCartItemElement(item));
+}
+
+/**
+ * Show the current quantity on an existing cart line
+ * @param {Object} item - Cart item whose quantity changed
+ */
+function updateCartLineQuantity(item) {
+    const line = cartNodes.get(item.name);
+    if (!line) {
+        return;
+    }
+    if (item.quantity > 1) {
+        if (!line.quantity) {
+            line.quantity = createQuantityElement();
+            line.info.prepend(line.quantity);
+        }
+        line.quantity.textContent = `Qty: ${item.quantity}`;
+    } else if (line.quantity) {
+        line.quantity.remove();
+        line.quantity = null;
+    }
+}
+
+/**
+ * Remove the rendered line for a product
+ * @param {string} productName - Name of the product whose line to remove
+ */
+function deleteCartLine(productName) {
+    const line = cartNodes.get(productName);
+    if (line) {
+        line.root.remove();
+        cartNodes.delete(productName);
+    }
+}
+
+/**
+ * Bump the cart version and mirror it on <body data-cart-version="...">
+ * so observers can react as soon as a render has completed
+ */
+function markCartRendered() {
+    cartVersion += 1;
+    document.body.setAttribute('data-cart-version', cartVersion);
+}
+
 /**
  * Create HTML element for a cart item
  * @param {Object} item - Cart item object with name, price, and quantity
@@ -121,6 +312,7 @@ function createCartItemElement(item) {
     // Create the main cart item container
     const cartItemDiv = document.createElement('div');
     cartItemDiv.className = 'cart-item';
+    cartItemDiv.setAttribute('data-name', item.name);
     
     // Create item info section
     const itemInfoDiv = document.createElement('div');
@@ -137,12 +329,10 @@ function createCartItemElement(item) {
     priceElement.textContent = `$${item.price.toFixed(2)}`;
     
     // If quantity is more than 1, show quantity
+    let quantityElement = null;
     if (item.quantity > 1) {
-        const quantityElement = document.createElement('div');
-        quantityElement.className = 'cart-item-quantity';
+        quantityElement = createQuantityElement();
         quantityElement.textContent = `Qty: ${item.quantity}`;
-        quantityElement.style.fontSize = '0.9rem';
-        quantityElement.style.color = '#7f8c8d';
         itemInfoDiv.appendChild(quantityElement);
     }
     
@@ -158,22 +348,83 @@ function createCartItemElement(item) {
     cartItemDiv.appendChild(itemInfoDiv);
     cartItemDiv.appendChild(removeButton);
     
+    // Keep the line so later updates can patch it in place
+    cartNodes.set(item.name, { root: cartItemDiv, info: itemInfoDiv, quantity: quantityElement });
+    
     return cartItemDiv;
 }
 
+/**
+ * Create the "Qty: N" label of a cart line
+ * @returns {HTMLElement} - The quantity element
+ */
+function createQuantityElement() {
+    const quantityElement = document.createElement('div');
+    quantityElement.className = 'cart-item-quantity';
+    quantityElement.style.fontSize = '0.9rem';
+    quantityElement.style.color = '#7f8c8d';
+    return quantityElement;
+}
+
+/**
+ * Apply a price change to the running totals
+ * @param {number} price - Change in dollars
+ * @param {number} cents - The same change in integer cents
+ */
+function addToTotal(price, cents) {
+    totalCents += cents;
+    if (moneyMode === 'cents') {
+        // Derive the float total from the exact integer sum
+        totalPrice = totalCents / 100;
+    } else if (cartIndex.size === 0) {
+        // Nothing left in the cart: drop any accumulated rounding error
+        totalPrice = 0;
+    } else {
+        totalPrice += price;
+    }
+}
+
 /**
  * Calculate the total price of all items in the cart
+ * Full recomputation; resets the running totals
  */
 function calculateTotalPrice() {
     totalPrice = 0;
+    totalCents = 0;
     
-    cart.forEach(item => {
+    cartIndex.forEach(item => {
         totalPrice += item.price * item.quantity;
+        totalCents += item.priceCents * item.quantity;
     });
     
+    if (moneyMode === 'cents') {
+        // Derive the float total from the exact integer sum
+        totalPrice = totalCents / 100;
+    }
+    
     console.log(`Total cart price: $${totalPrice.toFixed(2)}`);
 }
 
+/**
+ * Convert a price to integer cents
+ * @param {number} price - Price in dollars
+ * @returns {number} - Price in cents
+ */
+function toCents(price) {
+    return Math.round(price * 100);
+}
+
+/**
+ * Format integer cents as a dollar amount without going through floats
+ * @param {number} cents - Amount in cents
+ * @returns {string} - e.g. "2199.97"
+ */
+function formatCents(cents) {
+    const sign = cents < 0 ? '-' : '';
+    const absolute = Math.abs(cents);
+    return `${sign}${Math.floor(absolute / 100)}.${String(absolute % 100).padStart(2, '0')}`;
+}
+
 /**
  * Provide visual feedback when adding item to cart
  * @param {HTMLElement} button - The add button that was clicked
@@ -194,17 +445,41 @@ function showAddToCartFeedback(button) {
     }, 1000);
 }
 
+/**
+ * Replace the whole cart in one step and render it once
+ * Fast path for tests and fixtures: setup cost does not grow with clicks
+ * @param {Array} items - [name, price, quantity] rows (repeated names add up)
+ * @returns {number} - The cart version after rendering
+ */
+function seedCart(items) {
+    cartIndex.clear();
+    items.forEach(([name, price, quantity]) => {
+        const existing = cartIndex.get(name);
+        if (existing) {
+            existing.quantity += quantity;
+        } else {
+            cartIndex.set(name, { name: name, price: price, priceCents: toCents(price), quantity: quantity });
+        }
+    });
+    updateCartDisplay();
+    console.log(`Seeded cart with ${cartIndex.size} items`);
+    return cartVersion;
+}
+
 /**
  * Utility function to get cart summary (for debugging or future features)
  * @returns {Object} - Cart summary with item count and total price
  */
 function getCartSummary() {
-    const itemCount = cart.reduce((total, item) => total + item.quantity, 0);
+    const items = Array.from(cartIndex.values());
+    const itemCount = items.reduce((total, item) => total + item.quantity, 0);
     
     return {
         itemCount: itemCount,
         totalPrice: totalPrice,
-        items: cart
+        totalCents: totalCents,
+        moneyMode: moneyMode,
+        items: items
     };
 }
 
@@ -212,8 +487,7 @@ function getCartSummary() {
  * Clear the entire cart (utility function for future features)
  */
 function clearCart() {
-    cart = [];
-    totalPrice = 0;
+    cartIndex.clear();
     updateCartDisplay();
     console.log('Cart cleared');
 }
@@ -225,6 +499,7 @@ if (typeof module !== 'undefined' && module.exports) {
         addToCart,
         removeFromCart,
         getCartSummary,
+        seedCart,
         clearCart
     };
 }
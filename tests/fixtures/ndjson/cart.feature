@@ -0,0 +1,16 @@
+Feature: Cart events
+
+  @logic
+  Scenario: Add a product
+    Given the cart is empty
+    When the user adds "Laptop"
+    Then the cart should hold 1 item
+
+  Scenario: Wrong total
+    Given the cart is empty
+    Then the cart should hold 2 items
+    And the total price should be $0.00
+
+  @wip
+  Scenario: Not selected
+    Given the cart is empty
@@ -0,0 +1,17 @@
+from behave import given, when, then
+
+
+@given('the cart is empty')
+def step_empty(context):
+    context.items = []
+
+
+@when('the user adds "{product_name}"')
+def step_add(context, product_name):
+    context.items.append(product_name)
+
+
+@then('the cart should hold {count:d} item')
+@then('the cart should hold {count:d} items')
+def step_count(context, count):
+    assert len(context.items) == count, f"Expected {count} items, got {len(context.items)}"
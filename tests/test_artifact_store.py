@@ -0,0 +1,82 @@
+import base64
+import json
+
+from utilities.artifact_store import ArtifactStore, extract, iter_captures, read_blob
+
+SCREENSHOT = b"\xff\xd8\xff\xe0 fake jpeg" * 20
+
+
+class FakeDriver:
+    """Answers the two roundtrips ArtifactStore.capture makes"""
+
+    def __init__(self, screenshot=SCREENSHOT, cart_dom="<div id='cart-items'></div>"):
+        self.screenshot = screenshot
+        self.cart_dom = cart_dom
+
+    def execute_cdp_cmd(self, command, params):
+        assert command == "Page.captureScreenshot"
+        return {'data': base64.b64encode(self.screenshot).decode()}
+
+    def execute_script(self, script):
+        return {'url': 'http://127.0.0.1/index.html', 'cartDom': self.cart_dom,
+                'totalText': '$0.00', 'cart': {'items': []}, 'cartVersion': 3}
+
+
+def test_round_trip_with_deduplication(tmp_path):
+    store = ArtifactStore(tmp_path)
+    first = store.capture(FakeDriver(), "Add to Cart", "Add product", "Then the total ...", "AssertionError: total")
+    second = store.capture(FakeDriver(), "Add to Cart", "Add again", "Then the total ...", "AssertionError: total")
+    other = store.capture(FakeDriver(cart_dom="<div>Laptop</div>"), "Remove", "Remove product", "When ...")
+    stats = store.close()
+
+    assert (first, second, other) == (0, 1, 2)
+    # screenshot, DOM and state of the first capture; only the changed DOM after that
+    assert stats['blobs_written'] == 4
+    assert stats['deduplicated'] == 5
+
+    captures = [record for record, _ in iter_captures(tmp_path)]
+    assert [c['scenario'] for c in captures] == ["Add product", "Add again", "Remove product"]
+    assert captures[0]['artifacts'] == captures[1]['artifacts']
+
+    record, blobs = list(iter_captures(tmp_path))[2]
+    assert read_blob(tmp_path, blobs[record['artifacts']['screenshot']]) == SCREENSHOT
+    assert read_blob(tmp_path, blobs[record['artifacts']['cart_dom']]) == b"<div>Laptop</div>"
+    state = json.loads(read_blob(tmp_path, blobs[record['artifacts']['cart_state']]))
+    assert state['cartVersion'] == 3 and 'cartDom' not in state
+
+
+def test_extract_writes_one_directory_per_capture(tmp_path):
+    store = ArtifactStore(tmp_path / "artifacts")
+    store.capture(FakeDriver(), "Add to Cart", "Add product: Laptop", "Then ...", "boom")
+    store.close()
+
+    assert extract(tmp_path / "artifacts", tmp_path / "out") == 1
+    target = tmp_path / "out" / "000_Add_product_Laptop"
+    assert (target / "screenshot.jpg").read_bytes() == SCREENSHOT
+    assert json.loads((target / "failure.json").read_text())['error'] == "boom"
+
+
+def test_caps_bound_captures_and_archive_size(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=len(SCREENSHOT) + 10, max_captures=2)
+    ids = [store.capture(FakeDriver(screenshot=SCREENSHOT + bytes([i])), "F", f"S{i}", "step") for i in range(3)]
+    assert store.capture(None, "F", "no driver", "step") is None
+    stats = store.close()
+
+    assert ids == [0, 1, None]
+    assert stats['captures'] == 2 and stats['not_captured'] == 2
+    assert stats['archive_bytes'] <= len(SCREENSHOT) + 10
+    dropped = [record['dropped'] for record, _ in iter_captures(tmp_path)]
+    assert "screenshot" in dropped[1]
+
+
+def test_append_continues_ids_and_deduplication(tmp_path):
+    store = ArtifactStore(tmp_path)
+    store.capture(FakeDriver(), "F", "first run", "step")
+    store.close()
+
+    store = ArtifactStore(tmp_path, fresh=False)
+    assert store.capture(FakeDriver(), "F", "second run", "step") == 1
+    stats = store.close()
+
+    assert stats['blobs_written'] == 0
+    assert [record['id'] for record, _ in iter_captures(tmp_path)] == [0, 1]
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from utilities.async_webdriver import AsyncConnectionPool
+
+OK = b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 16\r\n\r\n{"value": "hi"}\n'
+
+
+async def _serve(replies):
+    """A server answering each request with the next reply; records whether each connection was closed"""
+    closed = []
+
+    async def handle(reader, writer):
+        while replies:
+            try:
+                await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            writer.write(replies.pop(0))
+            await writer.drain()
+        # The client closing its end shows up as EOF
+        closed.append(await reader.read() == b"")
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], closed
+
+
+def test_keep_alive_connections_are_reused():
+    async def scenario():
+        server, port, _ = await _serve([OK, OK])
+        pool = AsyncConnectionPool("127.0.0.1", port)
+        results = [await pool.request("GET", "/status") for _ in range(2)]
+        await pool.close()
+        server.close()
+        return results, pool.stats
+
+    results, stats = asyncio.run(scenario())
+
+    assert results == [(200, {'value': 'hi'})] * 2
+    assert stats == {'requests': 2, 'connections_opened': 1, 'reused': 1}
+
+
+@pytest.mark.parametrize("reply", [
+    b"HTTP/1.1 OK\r\n\r\n",
+    b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n{nope",
+])
+def test_malformed_response_closes_the_connection(reply):
+    async def scenario():
+        server, port, closed = await _serve([reply])
+        pool = AsyncConnectionPool("127.0.0.1", port)
+        with pytest.raises(ValueError):
+            await pool.request("GET", "/status")
+        await asyncio.sleep(0.1)
+        server.close()
+        return pool, closed
+
+    pool, closed = asyncio.run(scenario())
+
+    assert closed == [True]
+    assert pool._idle == [] and pool.stats['requests'] == 0
@@ -0,0 +1,107 @@
+import json
+
+from reports.run_history import RunHistoryStore
+from utilities.budgets import check_run, format_violations, tighten_budgets
+
+BUDGETS = {
+    "headroom": 1.2,
+    "run": {"max_duration": 600},
+    "features": {"*": 180, "Add to Cart": 20},
+    "scenarios": {"*": 20, "Add to Cart::Add one product": 1.0},
+    "metrics": {"add.cartUpdateMs": {"p95": 50}, "navigation.loadMs": {"p95": 2000}},
+}
+
+
+def _element(name, line, durations, status="passed"):
+    return {
+        'type': 'scenario', 'name': name, 'location': f"features/add_to_cart.feature:{line}", 'status': status,
+        'steps': [{'keyword': 'When', 'name': f'step {i}', 'result': {'status': status, 'duration': duration}}
+                  for i, duration in enumerate(durations)],
+    }
+
+
+def _write_run(tmp_path):
+    results = tmp_path / "behave_results.json"
+    results.write_text(json.dumps([{
+        'name': 'Add to Cart', 'location': 'features/add_to_cart.feature:1', 'status': 'failed',
+        'elements': [
+            _element("Add one product", 10, [0.5, 0.25]),
+            _element("Add many products", 20, [20.0, 5.0]),
+            _element("Not run", 30, [100.0], status="skipped"),
+        ],
+    }]))
+    metrics = tmp_path / "perf_metrics.jsonl"
+    with open(metrics, "w") as f:
+        f.write(json.dumps({'samples': [{'kind': 'add', 'cartUpdateMs': value} for value in range(10, 90, 10)]}) + "\n")
+        f.write(json.dumps({'samples': [{'kind': 'navigation', 'loadMs': 900}]}) + "\n")
+    budgets = tmp_path / "budgets.json"
+    budgets.write_text(json.dumps(BUDGETS))
+    return budgets, results, metrics
+
+
+def test_check_run_reports_every_exceeded_budget(tmp_path):
+    budgets, results, metrics = _write_run(tmp_path)
+
+    violations = check_run(budgets, results, [metrics])
+
+    found = {(v['kind'], v['name']): (v['budget'], v['actual']) for v in violations}
+    assert found == {
+        ('scenario', 'Add to Cart::Add many products'): (20, 25.0),
+        ('feature', 'Add to Cart'): (20, 25.75),
+        ('metric', 'add.cartUpdateMs p95'): (50, 80),
+    }
+    # Worst first: the metric is 60% over, the feature 28.75%, the scenario 25%
+    assert [v['kind'] for v in violations] == ['metric', 'feature', 'scenario']
+    assert "3 performance budget(s) exceeded" in format_violations(violations)
+
+
+def test_check_run_within_budget(tmp_path):
+    budgets, results, _ = _write_run(tmp_path)
+    relaxed = dict(BUDGETS, features={"*": 180}, scenarios={"*": 30})
+    budgets.write_text(json.dumps(relaxed))
+
+    assert check_run(budgets, results, []) == []
+
+
+def _history(tmp_path, runs):
+    store = RunHistoryStore(tmp_path / "run_history.db")
+    for run, (quick, new, update_ms) in enumerate(runs):
+        records = [{'feature': 'Add to Cart', 'scenario': 'Add one product', 'location': 'a:10',
+                    'status': 'passed', 'duration': quick, 'steps': []}]
+        if run >= len(runs) - 2:
+            records.append({'feature': 'Checkout', 'scenario': 'Pay', 'location': 'c:5',
+                            'status': 'passed', 'duration': new, 'steps': []})
+        run_id = store.append_run(records)
+        store.append_metrics(run_id, {'add.cartUpdateMs': {'count': 10, 'p95': update_ms}})
+    return store
+
+
+def test_tighten_budgets_from_history(tmp_path):
+    store = _history(tmp_path, [(0.5 + i / 10, 2.0, 30 + 2 * i) for i in range(6)])
+    try:
+        budgets = dict(BUDGETS, scenarios={"*": 20})
+        tightened, changes = tighten_budgets(budgets, store, window=20, min_runs=5)
+    finally:
+        store.close()
+
+    # p95 of 0.5..1.0 is 1.0, of 30..40 is 40; both times the 1.2 headroom
+    assert tightened['scenarios'] == {"*": 20, "Add to Cart::Add one product": 1.2}
+    assert tightened['features'] == {"*": 180, "Add to Cart": 1.2}
+    assert tightened['metrics']['add.cartUpdateMs'] == {"p95": 48}
+    # Too little history for Checkout, no samples for navigation
+    assert "Checkout::Pay" not in tightened['scenarios']
+    assert tightened['metrics']['navigation.loadMs'] == {"p95": 2000}
+    assert len(changes) == 3
+    assert budgets['scenarios'] == {"*": 20}, "input budgets must not be modified"
+
+
+def test_tighten_budgets_never_loosens(tmp_path):
+    store = _history(tmp_path, [(5.0, 2.0, 90) for _ in range(6)])
+    try:
+        tightened, changes = tighten_budgets(BUDGETS, store, window=20, min_runs=5)
+    finally:
+        store.close()
+
+    assert tightened['scenarios']["Add to Cart::Add one product"] == 1.0
+    assert tightened['metrics']['add.cartUpdateMs'] == {"p95": 50}
+    assert changes == [('features', 'Add to Cart', 20, 6.0)]
@@ -0,0 +1,79 @@
+import json
+
+from utilities.live_results import LiveResults
+
+
+def _scenario_events(name, status, error=None):
+    step_status = "failed" if status == "failed" else "passed"
+    return [
+        {'event': 'scenario_start', 'feature': 'Add to Cart', 'scenario': name, 'location': 'f:1', 'tags': []},
+        {'event': 'step', 'feature': 'Add to Cart', 'scenario': name, 'keyword': 'Then', 'name': 'the total is right',
+         'location': 'f:2', 'status': step_status, 'duration': 0.1, 'error': error},
+        {'event': 'scenario_end', 'feature': 'Add to Cart', 'scenario': name, 'location': 'f:1',
+         'status': status, 'duration': 0.25},
+    ]
+
+
+def _run(live, events):
+    output = []
+    for event in events:
+        # Round trip through the wire format, as run_tests.py reads it
+        parsed = live.parse(json.dumps(event) + "\n")
+        assert parsed == event
+        output.append(live.handle(parsed) or "")
+    return "".join(output)
+
+
+def test_parse_ignores_ordinary_output():
+    assert LiveResults.parse("🚀 Starting scenario: Add product\n") is None
+    assert LiveResults.parse('{"event": truncated\n') is None
+    assert LiveResults.parse('{"other": 1}\n') is None
+
+
+def test_totals_output_and_reports(tmp_path):
+    live = LiveResults(tmp_path, summary_interval=0)
+    events = [{'event': 'feature_start', 'feature': 'Add to Cart', 'location': 'f:1'}]
+    events += _scenario_events("Add product", "passed")
+    events += _scenario_events("Check total", "failed", error="AssertionError: Expected $10.00\nline two")
+    events += _scenario_events("Skipped one", "skipped")
+    events += [{'event': 'feature_end', 'feature': 'Add to Cart', 'location': 'f:1', 'status': 'failed',
+                'duration': 0.75}, {'event': 'run_end', 'duration': 1.0}]
+
+    text = _run(live, events)
+    summary = live.finish()
+
+    assert "📂 Add to Cart" in text
+    assert "✅ Add product (0.25s)  [1 passed, 0 failed, 0 skipped" in text
+    assert "❌ Check total" in text and "      line two" in text
+    assert summary['scenarios'] == {'passed': 1, 'failed': 1, 'skipped': 1}
+    assert summary['steps'] == {'passed': 2, 'failed': 1, 'skipped': 0, 'undefined': 0}
+    assert summary['features'] == 1 and not summary['running']
+    assert summary['failures'] == [{'feature': 'Add to Cart', 'scenario': 'Check total', 'location': 'f:1',
+                                    'error': "Then the total is right: AssertionError: Expected $10.00\nline two"}]
+
+    assert json.loads((tmp_path / "live_summary.json").read_text())['scenarios'] == summary['scenarios']
+    written = [json.loads(line) for line in (tmp_path / "events.ndjson").read_text().splitlines()]
+    assert written == events
+
+
+def test_failures_kept_are_bounded(tmp_path):
+    live = LiveResults(tmp_path, max_failures=2)
+    for i in range(5):
+        _run(live, _scenario_events(f"Broken {i}", "failed", error="boom"))
+    # A scenario failed by its after_scenario hook has no failing step
+    _run(live, _scenario_events("Hook failure", "failed")[::2])
+    summary = live.finish()
+
+    assert summary['failure_count'] == 6
+    assert [f['scenario'] for f in summary['failures']] == ["Broken 0", "Broken 1"]
+    assert live.pending_error is None
+
+
+def test_summary_rewrites_are_throttled(tmp_path):
+    live = LiveResults(tmp_path, summary_interval=3600)
+    _run(live, _scenario_events("First", "passed"))
+    _run(live, _scenario_events("Second", "passed"))
+    assert json.loads((tmp_path / "live_summary.json").read_text())['scenarios']['passed'] == 1
+
+    live.finish()
+    assert json.loads((tmp_path / "live_summary.json").read_text())['scenarios']['passed'] == 2
@@ -0,0 +1,35 @@
+from decimal import Decimal
+
+from utilities.money import Money
+
+
+def test_parse_price_strings():
+    assert Money.parse("$1,299.99").cents == 129999
+    assert Money.parse("Total: $0.10").cents == 10
+    assert Money.parse("699.995").cents == 70000
+    assert Money.parse("no amount") == Money(0)
+
+
+def test_from_float_matches_to_fixed():
+    # 1.005 is stored as 1.00499999...; toFixed(2) gives "1.00"
+    assert Money.from_float(1.005).cents == 100
+    assert Money.from_float(0.1 + 0.2).cents == 30
+    assert Money.from_float(1299.99).cents == 129999
+
+
+def test_arithmetic_is_exact():
+    prices = [Money.parse("$0.10")] * 3
+    assert sum(prices) == Money(30)
+    assert Money(129999) * 2 - Money(1) == Money(259997)
+    assert 3 * Money(5) == Money(15)
+    assert Money.bulk_total([129999, 1999], [2, 3]) == Money(265995)
+
+
+def test_ordering_and_formatting():
+    assert Money(5) < Money(10)
+    assert sorted([Money(30), Money(-5), Money(10)]) == [Money(-5), Money(10), Money(30)]
+    assert not Money(0)
+    assert str(Money(129999)) == "$1299.99"
+    assert str(Money(-5)) == "-$0.05"
+    assert Money(129999).to_decimal() == Decimal("1299.99")
+    assert Money(1) != 1
@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE = ROOT / "tests" / "fixtures" / "ndjson"
+
+
+@pytest.fixture(scope="module")
+def events():
+    # Run from the fixture directory so the project's behave.ini and environment.py stay out of it
+    result = subprocess.run(
+        [sys.executable, "-m", "behave", "--format=utilities.ndjson_formatter:NDJSONFormatter",
+         "--outfile=-", "--tags=~@wip", "--no-capture", "."],
+        cwd=FIXTURE, capture_output=True, text=True, timeout=60,
+        env=dict(os.environ, PYTHONPATH=str(ROOT)),
+    )
+    assert result.returncode == 1, result.stdout + result.stderr
+    return [json.loads(line) for line in result.stdout.splitlines() if line.startswith('{"event"')]
+
+
+def test_event_sequence(events):
+    assert [(e['event'], e.get('scenario') or e.get('feature'), e.get('status')) for e in events] == [
+        ("feature_start", "Cart events", None),
+        ("scenario_start", "Add a product", None),
+        ("step", "Add a product", "passed"),
+        ("step", "Add a product", "passed"),
+        ("step", "Add a product", "passed"),
+        ("scenario_end", "Add a product", "passed"),
+        ("scenario_start", "Wrong total", None),
+        ("step", "Wrong total", "passed"),
+        ("step", "Wrong total", "failed"),
+        # Never run after the failure, emitted when the scenario ends
+        ("step", "Wrong total", "undefined"),
+        ("scenario_end", "Wrong total", "failed"),
+        ("scenario_start", "Not selected", None),
+        ("step", "Not selected", "skipped"),
+        ("scenario_end", "Not selected", "skipped"),
+        ("feature_end", "Cart events", "failed"),
+        ("run_end", None, None),
+    ]
+
+
+def test_event_fields(events):
+    start, first_step = events[1], events[2]
+    assert start == {'event': 'scenario_start', 'time': start['time'], 'feature': 'Cart events',
+                     'scenario': 'Add a product', 'location': 'cart.feature:4', 'tags': ['logic']}
+    assert (first_step['keyword'], first_step['name'], first_step['location']) == \
+        ("Given", "the cart is empty", "cart.feature:5")
+
+    failed = events[8]
+    assert failed['error'] == "Assertion Failed: Expected 2 items, got 0"
+    assert all(e['error'] is None for e in events if e['event'] == 'step' and e is not failed)
+    assert [e['time'] for e in events] == sorted(e['time'] for e in events)
+    assert all(e['duration'] >= 0 for e in events if 'duration' in e)
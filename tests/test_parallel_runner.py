@@ -0,0 +1,97 @@
+import json
+
+from utilities.parallel_runner import (ParallelRunner, discover_scenarios, format_summary,
+                                       merge_behave_results, schedule_longest_first)
+
+
+def _scenarios(*names):
+    return [{'key': f"features/cart.feature::{name}", 'name': name, 'location': f"features/cart.feature:{i}"}
+            for i, name in enumerate(names, 1)]
+
+
+def _element(line, status, durations=(0.5,), kind='scenario'):
+    element = {'type': kind, 'name': f"Scenario {line}", 'location': f"features/cart.feature:{line}",
+               'steps': [{'name': 'step', 'result': {'status': status or 'passed', 'duration': d}} for d in durations]}
+    if status is not None:
+        element['status'] = status
+    return element
+
+
+def _worker_file(path, elements):
+    path.write_text(json.dumps([{'name': 'Cart', 'location': 'features/cart.feature:1', 'status': 'passed',
+                                 'elements': elements}]))
+    return path
+
+
+def test_discover_scenarios(tmp_path):
+    (tmp_path / "cart.feature").write_text(
+        "Feature: Cart\n\n  Scenario: Add product\n    Given x\n\n  Scenario Outline: Add <n>\n    Given y\n")
+
+    assert discover_scenarios(tmp_path) == [
+        {'key': f"{tmp_path.name}/cart.feature::Add product", 'name': 'Add product',
+         'location': f"{tmp_path.name}/cart.feature:3"},
+        {'key': f"{tmp_path.name}/cart.feature::Add <n>", 'name': 'Add <n>',
+         'location': f"{tmp_path.name}/cart.feature:6"},
+    ]
+
+
+def test_schedule_longest_first_balances_load():
+    scenarios = _scenarios("a", "b", "c", "d", "e")
+    durations = {s['key']: d for s, d in zip(scenarios, [7, 5, 4, 3, 1])}
+
+    buckets = schedule_longest_first(scenarios, durations, 2)
+
+    assert [[s['name'] for s in bucket] for bucket in buckets] == [["a", "d"], ["b", "c", "e"]]
+    assert [sum(durations[s['key']] for s in bucket) for bucket in buckets] == [10, 10]
+
+
+def test_schedule_uses_mean_duration_for_unknown_scenarios_and_drops_empty_workers():
+    scenarios = _scenarios("known", "new")
+    buckets = schedule_longest_first(scenarios, {scenarios[0]['key']: 2.0, 'gone::old': 4.0}, 4)
+
+    # "new" is estimated at the 3.0s mean, so it is scheduled first
+    assert [[s['name'] for s in bucket] for bucket in buckets] == [["new"], ["known"]]
+
+
+def test_merge_combines_workers_and_prefers_scenarios_that_ran(tmp_path):
+    # Both workers list every scenario of the feature; each ran only its own share
+    first = _worker_file(tmp_path / "worker_0.json", [
+        _element(3, None, kind='background'), _element(5, 'passed'), _element(9, 'skipped'), _element(12, 'skipped'),
+    ])
+    second = _worker_file(tmp_path / "worker_1.json", [
+        _element(3, None, kind='background'), _element(5, 'skipped'), _element(9, 'failed'), _element(12, 'skipped'),
+    ])
+
+    features = merge_behave_results([second, first])
+
+    assert len(features) == 1
+    assert [(e['location'].rsplit(':', 1)[1], e.get('status')) for e in features[0]['elements']] == \
+        [('3', None), ('5', 'passed'), ('9', 'failed'), ('12', 'skipped')]
+    assert features[0]['status'] == 'failed'
+    assert format_summary(features, 61.5).splitlines() == [
+        "0 features passed, 1 failed, 0 skipped",
+        "1 scenario passed, 1 failed, 1 skipped",
+        "1 step passed, 1 failed, 1 skipped",
+        "Took 1m1.500s",
+    ]
+
+
+def test_merge_skips_unreadable_worker_results(tmp_path, capsys):
+    good = _worker_file(tmp_path / "worker_0.json", [_element(5, 'passed')])
+    (tmp_path / "worker_1.json").write_text("Feature: Cart  # pretty output, not JSON\n")
+
+    features = merge_behave_results([good, tmp_path / "worker_1.json", tmp_path / "missing.json"])
+
+    assert [e['status'] for e in features[0]['elements']] == ['passed']
+    assert capsys.readouterr().out.count("Skipping unreadable worker results") == 2
+
+
+def test_worker_command_pairs_outfiles_with_formats(tmp_path):
+    cmd, json_file, output_file = ParallelRunner(tmp_path, 2).worker_command(1, _scenarios("a", "b"))
+
+    assert cmd[3:5] == ["features/cart.feature:1", "features/cart.feature:2"]
+    # behave pairs the n-th --outfile with the n-th --format
+    formats = [arg.split("=", 1)[1] for arg in cmd if arg.startswith("--format=")]
+    outfiles = [arg.split("=", 1)[1] for arg in cmd if arg.startswith("--outfile=")]
+    assert list(zip(formats, outfiles)) == [("json", str(json_file)), ("pretty", str(output_file)), ("ndjson", "-")]
+    assert json_file.name == "worker_1.json" and "--define=worker_id=1" in cmd
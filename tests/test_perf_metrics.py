@@ -0,0 +1,15 @@
+from utilities.perf_metrics import percentile, summarize
+
+
+def test_percentile_nearest_rank():
+    samples = [7, 3, 10, 1, 9, 2, 8, 4, 6, 5]
+    assert [percentile(samples, p) for p in (0, 50, 90, 99, 100)] == [1, 5, 9, 10, 10]
+    assert percentile([], 50) is None
+
+
+def test_summarize():
+    assert summarize([4.0, 1.0, 2.0, 3.0]) == {
+        'runs': 4, 'mean': 2.5, 'median': 2.5, 'min': 1.0, 'max': 4.0, 'p50': 2.0, 'p90': 4.0, 'p99': 4.0,
+    }
+    assert summarize([]) == {'runs': 0, 'mean': None, 'median': None, 'min': None, 'max': None,
+                             'p50': None, 'p90': None, 'p99': None}
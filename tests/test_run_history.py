@@ -0,0 +1,67 @@
+import sqlite3
+
+import pytest
+
+from reports.run_history import RunHistoryStore
+
+# find_regressions uses ROW_NUMBER() window functions
+pytestmark = pytest.mark.skipif(sqlite3.sqlite_version_info < (3, 25, 0),
+                                reason="find_regressions needs SQLite 3.25+")
+
+
+def _record(scenario, duration, status="passed", feature="Cart"):
+    return {'feature': feature, 'scenario': scenario, 'location': f"features/cart.feature:{len(scenario)}",
+            'status': status, 'duration': duration, 'steps': []}
+
+
+@pytest.fixture
+def store():
+    store = RunHistoryStore(":memory:")
+    yield store
+    store.close()
+
+
+def test_find_regressions_flags_slow_scenarios(store):
+    for run in range(5):
+        store.append_run([
+            _record("Steady", 1.0),
+            _record("Slower", 1.0 + run * 0.01),
+            _record("Tiny", 0.02),
+            # A failing run is not part of the baseline
+            _record("Flaky", 9.0 if run == 2 else 2.0, status="failed" if run == 2 else "passed"),
+        ])
+    store.append_run([
+        _record("Steady", 1.1),
+        _record("Slower", 2.0),
+        _record("Tiny", 0.05),
+        _record("Flaky", 3.0),
+        _record("New", 50.0),
+    ])
+
+    regressions = store.find_regressions()
+
+    # Tiny is 2.5x slower but by less than min_delta; New has no history
+    assert [(r['scenario'], r['baseline']) for r in regressions] == [("Slower", 1.02), ("Flaky", 2.0)]
+    assert regressions[0]['ratio'] == pytest.approx(2.0 / 1.02)
+
+
+def test_find_regressions_baseline_uses_the_window_before_the_run(store):
+    durations = [5.0, 5.0, 5.0, 1.0, 1.0, 1.0, 2.0, 1.0]
+    for duration in durations:
+        store.append_run([_record("Add product", duration)])
+
+    # Baseline of the last run: median of the 3 previous passing runs (1.0, 1.0, 2.0)
+    assert store.find_regressions(window=3) == []
+    # Run 7 (2.0s) against runs 4-6 (1.0s each)
+    assert [r['duration'] for r in store.find_regressions(run_id=7, window=3)] == [2.0]
+    # With a wider window the older, slower runs raise the baseline
+    assert store.find_regressions(run_id=7, window=6) == []
+    assert store.find_regressions(run_id=2, min_history=3) == []
+
+
+def test_scenario_trend_oldest_first(store):
+    for duration in (1.0, 2.0, 3.0):
+        store.append_run([_record("Add product", duration), _record("Other", 9.0)])
+
+    assert [(run_id, duration) for run_id, _, _, duration in store.scenario_trend("Add product", limit=2)] == \
+        [(2, 2.0), (3, 3.0)]
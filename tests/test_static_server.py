@@ -0,0 +1,122 @@
+import gzip
+import http.client
+
+import pytest
+
+from utilities.static_server import APP_ASSETS, StaticServer, _etag_matches
+
+SCRIPT = "function addToCart(name) { cart.push(name); }\n" * 40
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    """A server for a directory holding the app assets plus files that must not be served"""
+    tmp_path = tmp_path_factory.mktemp("static")
+    app = tmp_path / "app"
+    app.mkdir()
+    (app / "index.html").write_text("<html><script src='script.js'></script></html>")
+    (app / "script.js").write_text(SCRIPT)
+    (app / "style.css").write_text("body { margin: 0; }")
+    (app / "run_tests.py").write_text("print('not an asset')")
+    (tmp_path / "secret.txt").write_text("outside the root")
+    server = StaticServer(app, allow=APP_ASSETS).start()
+    yield server
+    server.stop()
+
+
+def _get(server, path, **headers):
+    connection = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    try:
+        # skip_accept_encoding keeps the request free of gzip unless a test asks for it
+        connection.putrequest("GET", path, skip_accept_encoding=True)
+        for name, value in headers.items():
+            connection.putheader(name.replace("_", "-"), value)
+        connection.endheaders()
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def test_serves_allowed_assets_with_validators(server):
+    status, headers, body = _get(server, "/script.js")
+    assert status == 200
+    assert body.decode() == SCRIPT
+    assert headers["Cache-Control"] == "public, max-age=3600"
+
+    status, headers, _ = _get(server, "/")
+    assert status == 200 and headers["Cache-Control"] == "no-cache"
+    assert headers["Content-Type"] == "text/html; charset=utf-8"
+
+
+def test_gzip_has_its_own_etag(server):
+    _, plain, _ = _get(server, "/script.js")
+    status, headers, body = _get(server, "/script.js", Accept_Encoding="gzip, deflate")
+
+    assert status == 200 and headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == SCRIPT
+    assert headers["ETag"] != plain["ETag"]
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    'W/{etag}',
+    '"0000", {etag}',
+    '"0000",{etag} , "1111"',
+    "*",
+])
+def test_conditional_requests_get_not_modified(server, if_none_match):
+    _, headers, _ = _get(server, "/style.css")
+
+    condition = if_none_match.format(etag=headers["ETag"])
+    status, response_headers, body = _get(server, "/style.css", If_None_Match=condition)
+
+    assert status == 304 and body == b""
+    assert response_headers["ETag"] == headers["ETag"]
+
+
+def test_other_validators_get_the_asset(server):
+    _, headers, _ = _get(server, "/style.css")
+    # A substring of the real ETag used to count as a match
+    partial = headers["ETag"][:-3] + '"'
+
+    assert _get(server, "/style.css", If_None_Match=partial)[0] == 200
+    assert _get(server, "/style.css", If_None_Match='"0000", "1111"')[0] == 200
+
+
+@pytest.mark.parametrize("path", [
+    "/run_tests.py",
+    "/missing.js",
+    "/../secret.txt",
+    "/%2e%2e/secret.txt",
+    "/..%2fsecret.txt",
+    "/script.js/../../secret.txt",
+])
+def test_files_outside_the_allow_list_or_root_are_not_found(server, path):
+    status, _, body = _get(server, path)
+    assert status == 404 and body == b""
+
+
+def test_without_allow_list_everything_under_root_is_served(tmp_path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "notes.txt").write_text("hello")
+    (tmp_path / "app-secret.txt").write_text("sibling, not inside app/")
+    server = StaticServer(tmp_path / "app").start()
+    try:
+        assert _get(server, "/notes.txt")[0] == 200
+        # Shares the root's name as a prefix but is outside it
+        assert _get(server, "/../app-secret.txt")[0] == 404
+    finally:
+        server.stop()
+
+    assert server.stats["notes.txt"]["ok"] == 1
+
+
+def test_etag_matching():
+    assert _etag_matches('"abc"', '"abc"')
+    assert _etag_matches('"abc"', 'W/"abc"')
+    assert _etag_matches('"abc"', '"x", "abc"')
+    assert _etag_matches('"abc"', "*")
+    assert not _etag_matches('"abc"', None)
+    assert not _etag_matches('"abc"', '"ab"')
+    assert not _etag_matches('"abc"', '"abcd"')
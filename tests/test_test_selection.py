@@ -0,0 +1,116 @@
+import subprocess
+
+import pytest
+
+from utilities import test_selection
+
+STEPS = '''from behave import given, when, then
+
+
+def helper(context):
+    return 1
+
+
+@given('the cart is empty')
+def step_empty(context):
+    pass
+
+
+@when('the user clicks "Add to Cart" for "{product_name}"')
+def step_add(context, product_name):
+    helper(context)
+
+
+@then('the total price should be {total}')
+def step_total(context, total):
+    pass
+'''
+
+FEATURE = '''Feature: Cart
+
+  Scenario: Add a product
+    Given the cart is empty
+    When the user clicks "Add to Cart" for "Laptop"
+
+  Scenario: Check the total
+    Given the cart is empty
+    Then the total price should be $0.00
+'''
+
+SCRIPT = '''function addToCart(name) {
+    cart.push(name);
+}
+
+function calculateTotalPrice() {
+    return 0;
+}
+'''
+
+
+def _git(root, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A committed mini project with one feature, one steps module and script.js"""
+    (tmp_path / "features" / "steps").mkdir(parents=True)
+    (tmp_path / "features" / "steps" / "cart_steps.py").write_text(STEPS)
+    (tmp_path / "features" / "cart.feature").write_text(FEATURE)
+    (tmp_path / "script.js").write_text(SCRIPT)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def _edit(path, old, new):
+    path.write_text(path.read_text().replace(old, new))
+
+
+def test_changed_files_and_lines(project):
+    _edit(project / "script.js", "return 0;", "return 1;")
+    (project / "features" / "new.feature").write_text("Feature: New\n")
+    (project / "features" / "cart.feature").unlink()
+
+    assert test_selection.changed_files(cwd=project) == ["features/cart.feature", "features/new.feature", "script.js"]
+    assert test_selection.changed_lines("script.js", cwd=project) == {6}
+    assert test_selection.changed_lines("features/new.feature", cwd=project) is None
+    assert test_selection.changed_lines("features/steps/cart_steps.py", cwd=project) == set()
+
+
+def test_changed_step_selects_its_scenarios(project):
+    _edit(project / "features" / "steps" / "cart_steps.py", "    pass\n\n\n@when", "    assert True\n\n\n@when")
+
+    locations, explanation = test_selection.TestSelector(project).impacted()
+
+    # step_empty is used by both scenarios
+    assert locations == ["features/cart.feature:3", "features/cart.feature:7"]
+    assert explanation == {"features/steps/cart_steps.py": 2}
+
+
+def test_changed_helper_selects_scenarios_of_steps_calling_it(project):
+    _edit(project / "features" / "steps" / "cart_steps.py", "return 1", "return 2")
+
+    locations, _ = test_selection.TestSelector(project).impacted()
+
+    assert locations == ["features/cart.feature:3"]
+
+
+def test_changed_script_function_selects_matching_scenarios(project):
+    _edit(project / "script.js", "return 0;", "return 1;")
+
+    locations, _ = test_selection.TestSelector(project).impacted()
+
+    assert locations == ["features/cart.feature:7"]
+
+
+@pytest.mark.parametrize("deleted", ["script.js", "features/steps/cart_steps.py"])
+def test_deleted_code_selects_everything(project, deleted):
+    (project / deleted).unlink()
+
+    locations, explanation = test_selection.TestSelector(project).impacted()
+
+    assert locations == ["features/cart.feature:3", "features/cart.feature:7"]
+    assert explanation == {deleted: 2}
@@ -0,0 +1,266 @@
+"""
+Failure artifact store for Mini E-Kart
+On a failed step the page is captured (viewport screenshot, #cart-items DOM
+and cart state) and handed to a background writer, so the next step is not
+kept waiting on disk. Artifacts are deduplicated by SHA-256 and appended to
+one packed archive (artifacts.pack) described by an append-only index
+(index.jsonl). Capture count, queue length and archive size are all capped,
+so a flaky run costs bounded time and disk.
+
+Usage:
+    python -m utilities.artifact_store --list
+    python -m utilities.artifact_store --extract reports/failures
+"""
+
+import re
+import json
+import time
+import zlib
+import base64
+import queue
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+
+# One roundtrip for everything but the screenshot
+FAILURE_STATE_JS = """
+const items = document.getElementById('cart-items');
+const total = document.getElementById('total-price');
+return {
+    url: location.href,
+    cartDom: items ? items.outerHTML : null,
+    totalText: total ? total.textContent.trim() : null,
+    cart: typeof getCartSummary === 'function' ? getCartSummary() : null,
+    cartVersion: typeof cartVersion === 'undefined' ? null : cartVersion
+};
+"""
+
+EXTENSIONS = {'image/jpeg': '.jpg', 'image/png': '.png', 'text/html': '.html', 'application/json': '.json'}
+
+
+class ArtifactStore:
+    """
+    Deduplicating, append-only store for failure captures
+    Usage:
+        store = ArtifactStore("reports/artifacts")
+        store.capture(driver, "Add to Cart", "Add product", "Then the total ...", error)
+        store.close()
+    """
+
+    def __init__(self, directory="reports/artifacts", max_bytes=50 * 1024 * 1024, max_captures=25,
+                 queue_size=8, screenshot_quality=60, fresh=True):
+        """
+        Args:
+            directory: Where artifacts.pack and index.jsonl live
+            max_bytes: Archive size cap; blobs that do not fit are dropped (and recorded as dropped)
+            max_captures: Failures captured per run; later failures are not captured at all
+            queue_size: Captures waiting for the writer; a full queue drops the capture
+            screenshot_quality: JPEG quality of the viewport screenshot (PNG if JPEG is unavailable)
+            fresh: Start a new archive instead of appending to the previous run's
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.pack_path = self.directory / "artifacts.pack"
+        self.index_path = self.directory / "index.jsonl"
+        self.max_bytes = max_bytes
+        self.max_captures = max_captures
+        self.screenshot_quality = screenshot_quality
+        self.pack = open(self.pack_path, "wb" if fresh else "ab")
+        self.index = open(self.index_path, "w" if fresh else "a")
+        self.known = {} if fresh else {blob['sha256']: blob for blob in self._read_index('blob')}
+        self.pack_bytes = self.pack.tell()
+        self.next_id = 0 if fresh else sum(1 for _ in self._read_index('capture'))
+        self.stats = {
+            'captures': 0, 'not_captured': 0, 'queue_full': 0, 'blobs_written': 0,
+            'deduplicated': 0, 'over_budget': 0, 'capture_ms_max': 0.0, 'capture_ms_total': 0.0,
+        }
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._writer, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def capture(self, driver, feature, scenario, step, error=None):
+        """
+        Grab the failure state from the browser and queue it for writing
+        Only the two browser roundtrips happen on the caller's thread
+        Returns:
+            The capture id, or None if the capture was skipped or dropped
+        """
+        if driver is None or self.stats['captures'] >= self.max_captures:
+            self._count('not_captured')
+            return None
+        start = time.perf_counter()
+        screenshot, media_type = None, None
+        try:
+            screenshot = driver.execute_cdp_cmd(
+                "Page.captureScreenshot", {"format": "jpeg", "quality": self.screenshot_quality})['data']
+            media_type = "image/jpeg"
+        except Exception:
+            try:
+                screenshot, media_type = driver.get_screenshot_as_base64(), "image/png"
+            except Exception as e:
+                print(f"⚠️ Could not capture screenshot: {e}")
+        try:
+            state = driver.execute_script(FAILURE_STATE_JS)
+        except Exception as e:
+            print(f"⚠️ Could not capture cart state: {e}")
+            state = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            capture_id = self.next_id
+            self.next_id += 1
+            self.stats['captures'] += 1
+            self.stats['capture_ms_total'] += elapsed_ms
+            self.stats['capture_ms_max'] = max(self.stats['capture_ms_max'], elapsed_ms)
+        record = {
+            'type': 'capture', 'id': capture_id, 'time': time.time(), 'feature': feature,
+            'scenario': scenario, 'step': step, 'error': (error or "")[:2000], 'capture_ms': elapsed_ms,
+        }
+        try:
+            self._queue.put_nowait((record, screenshot, media_type, state))
+        except queue.Full:
+            self._count('queue_full')
+            return None
+        return capture_id
+
+    def _writer(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write_capture(*item)
+            except Exception as e:
+                print(f"⚠️ Could not store failure artifacts: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write_capture(self, record, screenshot, media_type, state):
+        parts = []
+        if screenshot:
+            # Screenshots are already compressed images; text is zlib-compressed
+            parts.append(("screenshot", base64.b64decode(screenshot), media_type, "raw"))
+        if state:
+            dom = state.pop('cartDom', None)
+            if dom is not None:
+                parts.append(("cart_dom", dom.encode(), "text/html", "zlib"))
+            parts.append(("cart_state", json.dumps(state, sort_keys=True).encode(), "application/json", "zlib"))
+
+        record['artifacts'], record['dropped'] = {}, []
+        for name, data, part_type, encoding in parts:
+            blob = self._store_blob(data, part_type, encoding)
+            if blob is None:
+                record['dropped'].append(name)
+            else:
+                record['artifacts'][name] = blob
+        self.index.write(json.dumps(record) + "\n")
+        self.pack.flush()
+        self.index.flush()
+
+    def _store_blob(self, data, media_type, encoding):
+        """Append a blob unless an identical one is stored; returns its hash (None if over budget)"""
+        sha = hashlib.sha256(data).hexdigest()
+        if sha in self.known:
+            self._count('deduplicated')
+            return sha
+        payload = zlib.compress(data, 6) if encoding == "zlib" else data
+        if self.pack_bytes + len(payload) > self.max_bytes:
+            self._count('over_budget')
+            return None
+        blob = {'type': 'blob', 'sha256': sha, 'offset': self.pack_bytes, 'length': len(payload),
+                'size': len(data), 'encoding': encoding, 'media_type': media_type}
+        self.pack.write(payload)
+        self.pack_bytes += len(payload)
+        self.index.write(json.dumps(blob) + "\n")
+        self.known[sha] = blob
+        self._count('blobs_written')
+        return sha
+
+    def flush(self):
+        """Wait until every queued capture is on disk"""
+        self._queue.join()
+
+    def close(self):
+        """Drain the queue, stop the writer and close the archive; returns the stats"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.pack.close()
+        self.index.close()
+        return dict(self.stats, archive_bytes=self.pack_bytes)
+
+    def _read_index(self, record_type):
+        if not self.index_path.exists():
+            return
+        with open(self.index_path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if record['type'] == record_type:
+                        yield record
+
+
+def iter_captures(directory="reports/artifacts"):
+    """Yield (capture record, {sha256: blob entry}) for every capture in an archive"""
+    blobs = {}
+    with open(Path(directory) / "index.jsonl") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record['type'] == 'blob':
+                blobs[record['sha256']] = record
+            else:
+                yield record, blobs
+
+
+def read_blob(directory, blob):
+    """The original bytes of one stored blob"""
+    with open(Path(directory) / "artifacts.pack", "rb") as f:
+        f.seek(blob['offset'])
+        payload = f.read(blob['length'])
+    return zlib.decompress(payload) if blob['encoding'] == "zlib" else payload
+
+
+def extract(directory, destination):
+    """Unpack every capture into <destination>/<id>_<scenario>/ files"""
+    destination = Path(destination)
+    count = 0
+    for record, blobs in iter_captures(directory):
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", record['scenario'] or "scenario").strip("_")[:60]
+        target = destination / f"{record['id']:03d}_{slug}"
+        target.mkdir(parents=True, exist_ok=True)
+        for name, sha in record['artifacts'].items():
+            blob = blobs[sha]
+            (target / (name + EXTENSIONS.get(blob['media_type'], ".bin"))).write_bytes(read_blob(directory, blob))
+        (target / "failure.json").write_text(json.dumps(record, indent=2))
+        count += 1
+    return count
+
+
+def main():
+    """List or extract the failure captures of a run"""
+    parser = argparse.ArgumentParser(description="Mini E-Kart failure artifacts")
+    parser.add_argument("--dir", default="reports/artifacts", help="artifact archive directory")
+    parser.add_argument("--list", action="store_true", help="list captured failures")
+    parser.add_argument("--extract", metavar="DEST", help="unpack captures into DEST")
+    args = parser.parse_args()
+
+    if args.list:
+        for record, _ in iter_captures(args.dir):
+            dropped = f" (dropped: {', '.join(record['dropped'])})" if record['dropped'] else ""
+            print(f"{record['id']:3d}  {record['feature']} :: {record['scenario']}\n"
+                  f"     {record['step']}: {record['error'].splitlines()[0] if record['error'] else ''}{dropped}")
+    if args.extract:
+        print(f"📦 {extract(args.dir, args.extract)} capture(s) extracted to {args.extract}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,281 @@
+"""
+Asyncio WebDriver client for Mini E-Kart load driving
+Speaks the W3C WebDriver HTTP protocol directly to one chromedriver over a
+pool of keep-alive connections, so a single Python process (one thread) can
+drive dozens of headless Chrome sessions concurrently. Standard library only.
+
+Usage:
+    async with ChromeDriverService() as service:
+        async with AsyncWebDriver(service.pool) as driver:
+            await driver.get("http://127.0.0.1:8000/index.html")
+            title = await driver.title()
+"""
+
+import json
+import shutil
+import socket
+import asyncio
+from urllib.parse import urlsplit
+
+# W3C key for element references in WebDriver JSON
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Safe to resend when the response was lost; WebDriver POSTs (clicks, new sessions) are not
+IDEMPOTENT_METHODS = ("GET", "HEAD")
+
+HEADLESS_CHROME_ARGS = [
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--window-size=1280,800",
+]
+
+
+class WebDriverError(Exception):
+    """A W3C WebDriver error response"""
+
+    def __init__(self, error, message, status=None):
+        super().__init__(f"{error}: {message}")
+        self.error = error
+        self.status = status
+
+
+class AsyncConnectionPool:
+    """
+    HTTP/1.1 keep-alive connections to one host, shared by all sessions
+    Each connection carries one request at a time; idle connections are reused
+    """
+
+    def __init__(self, host, port, max_connections=32):
+        self.host = host
+        self.port = port
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle = []
+        self.stats = {'requests': 0, 'connections_opened': 0, 'reused': 0}
+
+    async def _connection(self):
+        """An idle connection if one is still open, else a new one; returns (reader, writer, reused)"""
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.stats['reused'] += 1
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stats['connections_opened'] += 1
+        return reader, writer, False
+
+    async def request(self, method, path, payload=None):
+        """
+        Send one request and read the JSON response
+        Returns:
+            Tuple of (HTTP status, decoded JSON body or None)
+        """
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = (f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                f"Connection: keep-alive\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n").encode()
+        async with self._slots:
+            # A pooled connection may have been closed by the server; retry once on a
+            # fresh one, but only when the request cannot have been acted on twice
+            for attempt in range(2):
+                reader, writer, reused = await self._connection()
+                sent = pooled = False
+                try:
+                    writer.write(head + body)
+                    await writer.drain()
+                    sent = True
+                    status, data, keep_alive = await self._read_response(reader)
+                    value = json.loads(data) if data else None
+                    if keep_alive:
+                        self._idle.append((reader, writer))
+                        pooled = True
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    stale = reused and not sent
+                    if attempt or not (stale or method in IDEMPOTENT_METHODS):
+                        raise
+                    continue
+                finally:
+                    # Any failure (a malformed response, cancellation) must not leak the socket
+                    if not pooled:
+                        writer.close()
+                self.stats['requests'] += 1
+                return status, value
+
+    async def _read_response(self, reader):
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        else:
+            data = await reader.readexactly(int(headers.get("content-length", 0)))
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return status, data, keep_alive
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class ChromeDriverService:
+    """Runs one chromedriver process that all async sessions share"""
+
+    def __init__(self, executable=None, port=0, max_connections=32):
+        """
+        Args:
+            executable: chromedriver path (default: PATH, then webdriver-manager)
+            port: Port for chromedriver (0 picks a free port)
+            max_connections: Size of the keep-alive connection pool
+        """
+        self.executable = executable
+        self.port = port
+        self.max_connections = max_connections
+        self.process = None
+        self.pool = None
+
+    @staticmethod
+    def find_executable():
+        path = shutil.which("chromedriver")
+        if path:
+            return path
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+    async def start(self, timeout=20):
+        if not self.port:
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                self.port = sock.getsockname()[1]
+        executable = self.executable or self.find_executable()
+        self.process = await asyncio.create_subprocess_exec(
+            executable, f"--port={self.port}",
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+        )
+        self.pool = AsyncConnectionPool("127.0.0.1", self.port, self.max_connections)
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            try:
+                status, data = await self.pool.request("GET", "/status")
+                if status == 200 and data['value'].get('ready', True):
+                    return self
+            except OSError:
+                pass
+            if asyncio.get_running_loop().time() > deadline:
+                await self.stop()
+                raise TimeoutError(f"chromedriver did not become ready on port {self.port}")
+            await asyncio.sleep(0.05)
+
+    async def stop(self):
+        if self.pool:
+            await self.pool.close()
+        if self.process and self.process.returncode is None:
+            self.process.terminate()
+            await self.process.wait()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+
+class AsyncWebDriver:
+    """One browser session driven through the W3C WebDriver protocol"""
+
+    def __init__(self, pool, chrome_args=None, page_load_strategy="normal"):
+        self.pool = pool
+        self.chrome_args = HEADLESS_CHROME_ARGS if chrome_args is None else chrome_args
+        self.page_load_strategy = page_load_strategy
+        self.session_id = None
+
+    async def _command(self, method, path, payload=None):
+        status, data = await self.pool.request(method, path, payload)
+        value = data.get('value') if data else None
+        if status >= 400:
+            value = value or {}
+            raise WebDriverError(value.get('error', 'unknown error'), value.get('message', ''), status)
+        return value
+
+    def _session_path(self, suffix=""):
+        return f"/session/{self.session_id}{suffix}"
+
+    async def start(self):
+        value = await self._command("POST", "/session", {
+            "capabilities": {"alwaysMatch": {
+                "browserName": "chrome",
+                "pageLoadStrategy": self.page_load_strategy,
+                "goog:chromeOptions": {"args": self.chrome_args},
+            }}
+        })
+        self.session_id = value['sessionId']
+        return self
+
+    async def quit(self):
+        if self.session_id:
+            try:
+                await self._command("DELETE", self._session_path())
+            finally:
+                self.session_id = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.quit()
+
+    async def get(self, url):
+        await self._command("POST", self._session_path("/url"), {"url": url})
+
+    async def title(self):
+        return await self._command("GET", self._session_path("/title"))
+
+    async def set_script_timeout(self, seconds):
+        await self._command("POST", self._session_path("/timeouts"), {"script": int(seconds * 1000)})
+
+    async def execute_script(self, script, *args):
+        return await self._command("POST", self._session_path("/execute/sync"),
+                                   {"script": script, "args": list(args)})
+
+    async def execute_async_script(self, script, *args):
+        return await self._command("POST", self._session_path("/execute/async"),
+                                   {"script": script, "args": list(args)})
+
+    async def find_element(self, css_selector):
+        value = await self._command("POST", self._session_path("/element"),
+                                    {"using": "css selector", "value": css_selector})
+        return value[ELEMENT_KEY]
+
+    async def click(self, element):
+        """Click an element id or a W3C element reference (as returned by execute_script)"""
+        element_id = element[ELEMENT_KEY] if isinstance(element, dict) else element
+        await self._command("POST", self._session_path(f"/element/{element_id}/click"), {})
+
+
+def pool_for_url(url, max_connections=32):
+    """Connection pool for an already running WebDriver server (e.g. http://127.0.0.1:9515)"""
+    parts = urlsplit(url)
+    return AsyncConnectionPool(parts.hostname, parts.port or 80, max_connections)
@@ -0,0 +1,232 @@
+"""
+Performance budgets for Mini E-Kart
+Checks a run (serial or merged parallel results plus page metrics) against
+budgets.json and tightens the budgets from historical p95 values.
+
+budgets.json:
+    {
+      "headroom": 1.2,
+      "run": {"max_duration": 600},
+      "features": {"*": 180, "Add to Cart": 120},
+      "scenarios": {"*": 20, "Add to Cart::Add product and verify cart updates": 15},
+      "metrics": {"add.cartUpdateMs": {"p95": 50}, "navigation.loadMs": {"p95": 2000}}
+    }
+
+Durations are seconds of behave step time, "*" is the default for names
+without their own entry, and metric ceilings apply to the percentiles in
+reports/perf_metrics*.jsonl (see utilities.perf_metrics).
+
+Usage:
+    python -m utilities.budgets --check
+    python -m utilities.budgets --tighten [--dry-run]
+"""
+
+import copy
+import json
+import math
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+from utilities.perf_metrics import percentile, load_perf_records, summarize_perf_metrics
+
+DEFAULT_BUDGETS_FILE = "budgets.json"
+METRIC_STATS = ('p50', 'p90', 'p95', 'p99', 'max')
+
+
+def load_budgets(path=DEFAULT_BUDGETS_FILE):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_budgets(budgets, path=DEFAULT_BUDGETS_FILE):
+    with open(path, "w") as f:
+        json.dump(budgets, f, indent=2)
+        f.write("\n")
+
+
+def budget_for(limits, name):
+    """A name's own limit, else the "*" default (None when neither is set)"""
+    return limits.get(name, limits.get("*"))
+
+
+def _violation(kind, name, budget, actual, unit):
+    return {
+        'kind': kind,
+        'name': name,
+        'budget': budget,
+        'actual': actual,
+        'unit': unit,
+        'over': (actual - budget) / budget if budget else float('inf'),
+    }
+
+
+def check_budgets(budgets, records, perf_summary=None):
+    """
+    Compare a run against its budgets
+    Args:
+        budgets: Parsed budgets.json
+        records: Scenario records (see reports/test_summary.iter_scenario_records)
+        perf_summary: Metric percentiles (see utilities.perf_metrics.summarize_perf_metrics)
+    Returns:
+        List of violation dicts, worst first
+    """
+    violations = []
+    scenario_limits = budgets.get('scenarios', {})
+    feature_totals = defaultdict(float)
+    run_total = 0.0
+    for record in records:
+        if record['status'] == 'skipped':
+            continue
+        feature_totals[record['feature']] += record['duration']
+        run_total += record['duration']
+        name = f"{record['feature']}::{record['scenario']}"
+        limit = budget_for(scenario_limits, name)
+        if limit is not None and record['duration'] > limit:
+            violations.append(_violation('scenario', name, limit, record['duration'], 's'))
+
+    feature_limits = budgets.get('features', {})
+    for feature, total in feature_totals.items():
+        limit = budget_for(feature_limits, feature)
+        if limit is not None and total > limit:
+            violations.append(_violation('feature', feature, limit, total, 's'))
+
+    run_limit = budgets.get('run', {}).get('max_duration')
+    if run_limit is not None and run_total > run_limit:
+        violations.append(_violation('run', 'total', run_limit, run_total, 's'))
+
+    for metric, ceilings in budgets.get('metrics', {}).items():
+        stats = (perf_summary or {}).get(metric)
+        if not stats:
+            continue
+        for stat, limit in ceilings.items():
+            actual = stats.get(stat)
+            if actual is not None and actual > limit:
+                violations.append(_violation('metric', f"{metric} {stat}", limit, actual, 'ms'))
+
+    violations.sort(key=lambda v: v['over'], reverse=True)
+    return violations
+
+
+def format_violations(violations):
+    """Budget-vs-actual diff, one block per exceeded budget"""
+    lines = [f"❌ {len(violations)} performance budget(s) exceeded:"]
+    for v in violations:
+        lines.append(f"@@ {v['kind']}: {v['name']} @@")
+        lines.append(f"-  budget {v['budget']:10.2f}{v['unit']}")
+        lines.append(f"+  actual {v['actual']:10.2f}{v['unit']}  (+{v['over'] * 100:.1f}%)")
+    return "\n".join(lines)
+
+
+def check_run(budgets_path=DEFAULT_BUDGETS_FILE, results_json="reports/behave_results.json",
+              metrics_files=None, reports_dir="reports"):
+    """
+    Check the latest run's results against budgets.json
+    Returns:
+        List of violations (empty when everything is within budget)
+    """
+    from reports.test_summary import iter_scenario_records
+
+    budgets = load_budgets(budgets_path)
+    if metrics_files is None:
+        metrics_files = sorted(Path(reports_dir).glob("perf_metrics*.jsonl"))
+    perf_summary = summarize_perf_metrics(load_perf_records(metrics_files)) if metrics_files else {}
+    return check_budgets(budgets, iter_scenario_records(results_json), perf_summary)
+
+
+def _ceil(value, digits=2):
+    """Round up so a tightened budget never sits below the observed p95"""
+    factor = 10 ** digits
+    return math.ceil(value * factor) / factor
+
+
+def tighten_budgets(budgets, store, window=20, min_runs=5):
+    """
+    Lower budgets to historical p95 * headroom (budgets are never loosened)
+    Args:
+        budgets: Parsed budgets.json
+        store: reports.run_history.RunHistoryStore
+        window: Number of most recent runs to consider
+        min_runs: Minimum samples needed before a budget is tightened
+    Returns:
+        Tuple of (new budgets, list of (section, name, old, new) changes)
+    """
+    tightened = copy.deepcopy(budgets)
+    headroom = budgets.get('headroom', 1.2)
+    changes = []
+
+    def tighten(section, name, samples, current):
+        if len(samples) < min_runs:
+            return None
+        proposed = _ceil(percentile(samples, 95) * headroom)
+        if current is None or proposed < current:
+            changes.append((section, name, current, proposed))
+            return proposed
+        return None
+
+    scenarios = tightened.setdefault('scenarios', {})
+    for (feature, scenario), samples in sorted(store.recent_scenario_durations(window).items()):
+        name = f"{feature}::{scenario}"
+        new = tighten('scenarios', name, samples, budget_for(scenarios, name))
+        if new is not None:
+            scenarios[name] = new
+
+    features = tightened.setdefault('features', {})
+    for feature, samples in sorted(store.recent_feature_durations(window).items()):
+        new = tighten('features', feature, samples, budget_for(features, feature))
+        if new is not None:
+            features[feature] = new
+
+    for metric, ceilings in tightened.get('metrics', {}).items():
+        for stat, limit in list(ceilings.items()):
+            if stat not in METRIC_STATS:
+                continue
+            new = tighten('metrics', f"{metric} {stat}", store.recent_metric_values(metric, stat, window), limit)
+            if new is not None:
+                ceilings[stat] = new
+
+    return tightened, changes
+
+
+def main():
+    """Check the last run against budgets.json or tighten it from history"""
+    from reports.run_history import RunHistoryStore
+
+    parser = argparse.ArgumentParser(description="Mini E-Kart performance budgets")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS_FILE, help="budget file")
+    parser.add_argument("--check", action="store_true", help="check reports/behave_results.json")
+    parser.add_argument("--results", default="reports/behave_results.json")
+    parser.add_argument("--tighten", action="store_true", help="tighten budgets from historical p95")
+    parser.add_argument("--window", type=int, default=20, help="runs of history to use")
+    parser.add_argument("--min-runs", type=int, default=5, help="samples needed to tighten a budget")
+    parser.add_argument("--dry-run", action="store_true", help="show tightened budgets without saving")
+    parser.add_argument("--db", default="reports/run_history.db", help="history database path")
+    args = parser.parse_args()
+
+    status = 0
+    if args.tighten:
+        store = RunHistoryStore(args.db)
+        try:
+            budgets, changes = tighten_budgets(load_budgets(args.budgets), store, args.window, args.min_runs)
+        finally:
+            store.close()
+        for section, name, old, new in changes:
+            print(f"🔧 {section}: {name}: {'-' if old is None else f'{old:.2f}'} -> {new:.2f}")
+        if not changes:
+            print("✅ Budgets already at or below historical p95")
+        elif not args.dry_run:
+            save_budgets(budgets, args.budgets)
+            print(f"💾 {len(changes)} budget(s) tightened in {args.budgets}")
+
+    if args.check:
+        violations = check_run(args.budgets, args.results)
+        if violations:
+            print(format_violations(violations))
+            status = 1
+        else:
+            print("✅ All performance budgets met")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
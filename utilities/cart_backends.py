@@ -0,0 +1,140 @@
+"""
+Cart backends for the Mini E-Kart step definitions
+The steps drive the cart through one of these backends:
+- SeleniumCartBackend: the real page in Chrome (DOM and visual checks)
+- ModelCartBackend: the in-process CartModel (pricing/quantity logic only)
+"""
+
+from utilities.cart_model import CartModel, load_catalog
+from utilities.cart_snapshot import CartLine, CartSnapshot
+from utilities.money import Money
+
+EMPTY_MESSAGE = "Your cart is empty."
+
+
+class SeleniumCartBackend:
+    """Drives the cart through the browser via DriverSetup"""
+
+    name = "selenium"
+
+    def __init__(self, driver_setup):
+        self.driver_setup = driver_setup
+        self.driver = driver_setup.get_driver()
+
+    def verify_homepage(self):
+        # Imported here so the model backend runs without Selenium installed
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "products-grid"))
+        )
+        assert "Mini E-Kart" in self.driver.title
+
+    def product_names(self):
+        return list(self.driver_setup.get_catalog())
+
+    def get_product_price(self, name):
+        product = self.driver_setup.get_product(name)
+        return product['price'] if product else None
+
+    def add(self, name):
+        product = self.driver_setup.get_product(name)
+        if product is None:
+            raise AssertionError(f"{name} not found to add")
+        desc = f"Add to Cart for {name}"
+        if not self.driver_setup.click_and_wait_for_cart(product['button'], desc):
+            # The page was reloaded behind our back; rebuild the index and retry once
+            self.driver_setup.invalidate_catalog()
+            product = self.driver_setup.get_product(name)
+            assert product is not None, f"{name} not found to add after reload"
+            assert self.driver_setup.click_and_wait_for_cart(product['button'], desc), f"Could not add {name}"
+
+    def remove(self, name):
+        button = self.driver_setup.find_cart_remove_button(name)
+        if button is None:
+            raise AssertionError(f"{name} not found to remove")
+        assert self.driver_setup.click_and_wait_for_cart(button, f"Remove for {name}"), f"Could not remove {name}"
+
+    def remove_first(self):
+        buttons = self.driver_setup.query_all(".remove-btn")
+        if not buttons:
+            return False
+        assert self.driver_setup.click_and_wait_for_cart(buttons[0], "Remove"), "Could not remove product"
+        return True
+
+    def seed(self, names):
+        """Put the named products in the cart with a single script call"""
+        rows = []
+        for name in names:
+            price = self.get_product_price(name)
+            if price is None:
+                raise AssertionError(f"{name} not found to seed")
+            rows.append((name, price, 1))
+        assert self.driver_setup.seed_cart(rows) is not None, "Could not seed the cart"
+
+    def navigate_home(self):
+        assert self.driver_setup.navigate_to_homepage(), "Could not open homepage"
+
+    def snapshot(self):
+        return CartSnapshot.capture(self.driver)
+
+
+class ModelCartBackend:
+    """Runs cart operations against the in-process CartModel"""
+
+    name = "model"
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.model = CartModel()
+
+    def verify_homepage(self):
+        assert self.catalog, "No products found in index.html"
+
+    def product_names(self):
+        return list(self.catalog)
+
+    def get_product_price(self, name):
+        return self.catalog.get(name)
+
+    def add(self, name):
+        if name not in self.catalog:
+            raise AssertionError(f"{name} not found to add")
+        self.model.add_to_cart(name, self.catalog[name])
+
+    def remove(self, name):
+        if not self.model.remove_from_cart(name):
+            raise AssertionError(f"{name} not found to remove")
+
+    def remove_first(self):
+        if not self.model.cart:
+            return False
+        return self.model.remove_from_cart(self.model.cart[0]['name'])
+
+    def seed(self, names):
+        """Put the named products in the cart in one step"""
+        for name in names:
+            if name not in self.catalog:
+                raise AssertionError(f"{name} not found to seed")
+        self.model.seed_cart([(name, self.catalog[name], 1) for name in names])
+
+    def navigate_home(self):
+        # script.js restores the cart from localStorage after navigation,
+        # so the model keeps its state too
+        self.verify_homepage()
+
+    def snapshot(self):
+        lines = [CartLine(item['name'], Money(item['price_cents']), item['quantity']) for item in self.model.cart]
+        return CartSnapshot(
+            items=lines,
+            # The page renders totalPrice.toFixed(2)
+            total=Money.from_float(self.model.total_price),
+            empty_message=EMPTY_MESSAGE,
+            empty_message_visible=not lines,
+            remove_buttons=len(lines),
+            state_items=[CartLine(line.name, line.price, line.quantity) for line in lines],
+            state_total=self.model.total_price,
+            state_total_cents=self.model.total_cents,
+        )
@@ -0,0 +1,217 @@
+"""
+Differential fuzz checker for the Mini E-Kart cart
+Generates random add/remove sequences over the index.html catalog, replays
+them in batches inside one browser session and compares the browser cart
+(calculateTotalPrice and the rendered DOM) against the Python CartModel after
+every operation. Failing sequences are shrunk to a minimal reproduction.
+
+Usage:
+    python -m utilities.cart_fuzz --sequences 100 --length 100
+"""
+
+import json
+import time
+import random
+import argparse
+from decimal import Decimal, ROUND_HALF_UP
+from datetime import datetime
+from pathlib import Path
+
+from utilities.cart_model import CartModel, load_catalog
+
+# Replays a batch of operations and records what the page shows after each one
+REPLAY_JS = """
+const ops = arguments[0];
+if (arguments[1]) { clearCart(); }
+const buttons = new Map(Array.from(document.querySelectorAll('.add-btn')).map(b => [b.getAttribute('data-name'), b]));
+const observations = [];
+for (const [kind, name] of ops) {
+    if (kind === 'add') {
+        buttons.get(name).click();
+    } else {
+        const button = document.querySelector(`#cart-items .cart-item[data-name="${CSS.escape(name)}"] .remove-btn`);
+        if (button) { button.click(); } else { removeFromCart(name); }
+    }
+    const lines = Array.from(document.querySelectorAll('#cart-items .cart-item')).map(node => {
+        const quantity = node.querySelector('.cart-item-quantity');
+        return [
+            node.querySelector('.cart-item-name').textContent.trim(),
+            node.querySelector('.cart-item-price').textContent.trim(),
+            quantity ? quantity.textContent.trim() : ''
+        ];
+    });
+    observations.push([totalPrice, document.getElementById('total-price').textContent.trim(), lines]);
+}
+// Keep the performance timeline from growing across thousands of operations
+performance.clearMeasures('cart-update');
+return observations;
+"""
+
+
+def js_to_fixed(value, digits=2):
+    """Number.prototype.toFixed: round the exact binary value half-up"""
+    quantum = Decimal(1).scaleb(-digits)
+    return str(Decimal(value).quantize(quantum, rounding=ROUND_HALF_UP))
+
+
+def expected_lines(model):
+    """The cart lines createCartItemElement would render for the model state"""
+    return [[item['name'], f"${js_to_fixed(item['price'])}",
+             f"Qty: {item['quantity']}" if item['quantity'] > 1 else '']
+            for item in model.cart]
+
+
+def generate_sequence(rng, names, length, remove_ratio=0.35):
+    """Random add/remove sequence; removes mostly target products in the cart"""
+    ops, in_cart = [], set()
+    for _ in range(length):
+        if in_cart and rng.random() < remove_ratio:
+            # Occasionally remove something that is not in the cart (must be a no-op)
+            name = rng.choice(sorted(in_cart)) if rng.random() < 0.9 else rng.choice(names)
+            in_cart.discard(name)
+            ops.append(("remove", name))
+        else:
+            name = rng.choice(names)
+            in_cart.add(name)
+            ops.append(("add", name))
+    return ops
+
+
+class CartDifferentialChecker:
+    """
+    Replays operation sequences in the browser and diffs them against CartModel
+    """
+
+    def __init__(self, driver, catalog=None, batch_size=500):
+        """Use an already opened Mini E-Kart page"""
+        self.driver = driver
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.batch_size = batch_size
+        self.replays = 0
+
+    def replay(self, ops):
+        """Run ops from an empty cart; returns one observation per operation"""
+        observations = []
+        for start in range(0, len(ops), self.batch_size):
+            batch = [list(op) for op in ops[start:start + self.batch_size]]
+            observations += self.driver.execute_script(REPLAY_JS, batch, start == 0)
+        self.replays += 1
+        return observations
+
+    def first_mismatch(self, ops):
+        """
+        Index and description of the first operation where browser and model disagree
+        Returns:
+            (index, details) or None when the whole sequence agrees
+        """
+        model = CartModel()
+        for index, ((kind, name), observed) in enumerate(zip(ops, self.replay(ops))):
+            if kind == "add":
+                model.add_to_cart(name, self.catalog[name])
+            else:
+                model.remove_from_cart(name)
+            js_total, total_text, lines = observed
+            expected = {
+                'totalPrice': model.total_price,
+                'total_text': js_to_fixed(model.total_price),
+                'lines': expected_lines(model),
+            }
+            actual = {'totalPrice': js_total, 'total_text': total_text, 'lines': lines}
+            if actual != expected:
+                return index, {'expected': expected, 'actual': actual}
+        return None
+
+    def shrink(self, ops):
+        """Delta-debug a failing sequence down to a minimal one that still fails"""
+        mismatch = self.first_mismatch(ops)
+        if mismatch is None:
+            return ops
+        ops = ops[:mismatch[0] + 1]
+        granularity = 2
+        while len(ops) >= 2:
+            chunk = max(1, len(ops) // granularity)
+            reduced = False
+            for start in range(0, len(ops), chunk):
+                candidate = ops[:start] + ops[start + chunk:]
+                if candidate and self.first_mismatch(candidate) is not None:
+                    ops = candidate
+                    granularity = max(granularity - 1, 2)
+                    reduced = True
+                    break
+            if not reduced:
+                if chunk == 1:
+                    break
+                granularity = min(granularity * 2, len(ops))
+        return ops
+
+    def run(self, sequences, length, seed=0):
+        """
+        Fuzz the cart with random sequences
+        Returns:
+            Report dict with totals and minimal reproductions of failures
+        """
+        rng = random.Random(seed)
+        names = list(self.catalog)
+        failures = []
+        start = time.perf_counter()
+        for number in range(sequences):
+            ops = generate_sequence(rng, names, length)
+            mismatch = self.first_mismatch(ops)
+            if mismatch is None:
+                continue
+            minimal = self.shrink(ops)
+            failures.append({
+                'sequence': number,
+                'failed_at': mismatch[0],
+                'details': mismatch[1],
+                'minimal_reproduction': [list(op) for op in minimal],
+                'minimal_details': self.first_mismatch(minimal)[1],
+            })
+            print(f"❌ Sequence {number} diverged at op {mismatch[0]}; "
+                  f"shrunk to {len(minimal)} ops: {minimal}")
+        elapsed = time.perf_counter() - start
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'seed': seed,
+            'sequences': sequences,
+            'operations': sequences * length,
+            'replays': self.replays,
+            'elapsed_seconds': elapsed,
+            'failures': failures,
+        }
+
+
+def main():
+    """Fuzz the cart in one headless Chrome session and save the report"""
+    from utilities.driver_setup import DriverSetup
+
+    parser = argparse.ArgumentParser(description="Differential fuzzing of the browser cart against CartModel")
+    parser.add_argument("--sequences", type=int, default=100)
+    parser.add_argument("--length", type=int, default=100, help="operations per sequence")
+    parser.add_argument("--batch-size", type=int, default=500, help="operations per execute_script call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="reports/cart_fuzz_report.json")
+    args = parser.parse_args()
+
+    setup = DriverSetup()
+    setup.setup_driver()
+    try:
+        if not setup.navigate_to_homepage():
+            raise Exception("Could not open homepage")
+        checker = CartDifferentialChecker(setup.get_driver(), batch_size=args.batch_size)
+        report = checker.run(args.sequences, args.length, args.seed)
+    finally:
+        setup.cleanup()
+
+    print(f"🎲 {report['operations']} operations in {report['elapsed_seconds']:.1f}s, "
+          f"{len(report['failures'])} divergent sequences")
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📊 Fuzz report saved to: {output}")
+    return 0 if not report['failures'] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
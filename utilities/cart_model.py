@@ -0,0 +1,114 @@
+"""
+Pure-Python cart model for Mini E-Kart
+Mirrors the cart semantics of script.js (addToCart, removeFromCart,
+calculateTotalPrice, getCartSummary, seedCart, clearCart) so cart logic can be tested
+in-process without a browser
+"""
+
+from html.parser import HTMLParser
+from pathlib import Path
+
+from utilities.money import Money
+
+
+class _CatalogParser(HTMLParser):
+    """Collects data-name/data-price from the .add-btn buttons of index.html"""
+
+    def __init__(self):
+        super().__init__()
+        self.products = {}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "button" and "add-btn" in (attrs.get("class") or "").split():
+            self.products[attrs["data-name"]] = float(attrs["data-price"])
+
+
+def load_catalog(index_path="index.html"):
+    """
+    Read the product catalog from index.html
+    Returns:
+        Dict of product name -> price, in page order
+    """
+    parser = _CatalogParser()
+    parser.feed(Path(index_path).read_text(encoding="utf-8"))
+    return parser.products
+
+
+class CartModel:
+    """
+    In-memory cart with the same behaviour as script.js:
+    adding an existing product bumps its quantity, removing drops the whole
+    line, and the total is a running float sum updated on every add/remove.
+    The exact integer-cents total (script.js ?money=cents) is kept alongside
+    """
+
+    def __init__(self):
+        """Start with an empty cart"""
+        self.cart = []
+        self.total_price = 0.0
+        self.total_cents = 0
+
+    def add_to_cart(self, name, price):
+        """Add one unit of a product (merging by name)"""
+        existing = next((item for item in self.cart if item['name'] == name), None)
+        if existing:
+            existing['quantity'] += 1
+        else:
+            existing = {'name': name, 'price': float(price),
+                        'price_cents': Money.from_float(price).cents, 'quantity': 1}
+            self.cart.append(existing)
+        self._add_to_total(existing['price'], existing['price_cents'])
+
+    def remove_from_cart(self, name):
+        """Remove the whole line for a product; returns False if it was not in the cart"""
+        for index, item in enumerate(self.cart):
+            if item['name'] == name:
+                del self.cart[index]
+                self._add_to_total(-item['price'] * item['quantity'], -item['price_cents'] * item['quantity'])
+                return True
+        return False
+
+    def seed_cart(self, rows):
+        """Replace the cart with (name, price, quantity) rows the way seedCart() does"""
+        self.cart = []
+        index = {}
+        for name, price, quantity in rows:
+            if name in index:
+                index[name]['quantity'] += quantity
+            else:
+                index[name] = {'name': name, 'price': float(price),
+                               'price_cents': Money.from_float(price).cents, 'quantity': quantity}
+                self.cart.append(index[name])
+        self.calculate_total_price()
+
+    def _add_to_total(self, price, cents):
+        """Apply a change to the running totals the way addToTotal() does"""
+        self.total_cents += cents
+        # An empty cart drops any accumulated rounding error
+        self.total_price = self.total_price + price if self.cart else 0.0
+
+    def calculate_total_price(self):
+        """Recompute both totals from scratch (float accumulation in cart order)"""
+        total = 0.0
+        for item in self.cart:
+            total += item['price'] * item['quantity']
+        self.total_price = total
+        self.total_cents = Money.bulk_total([item['price_cents'] for item in self.cart],
+                                            [item['quantity'] for item in self.cart]).cents
+        return total
+
+    def get_cart_summary(self):
+        """Same shape as getCartSummary() in script.js"""
+        return {
+            'itemCount': sum(item['quantity'] for item in self.cart),
+            'totalPrice': self.total_price,
+            'totalCents': self.total_cents,
+            'items': [dict(item) for item in self.cart],
+        }
+
+    def clear_cart(self):
+        """Empty the cart"""
+        self.cart = []
+        self.total_price = 0.0
+        self.total_cents = 0
@@ -0,0 +1,116 @@
+"""
+Cart snapshot for Mini E-Kart assertions
+Reads the whole rendered cart (and the script.js cart state) in a single
+WebDriver roundtrip instead of one find_element/.text call per field.
+Prices and totals are exact Money amounts (integer cents)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from utilities.money import Money
+
+CART_SNAPSHOT_JS = """
+const lines = Array.from(document.querySelectorAll('#cart-items .cart-item')).map(node => {
+    const quantity = node.querySelector('.cart-item-quantity');
+    return [
+        node.querySelector('.cart-item-name').textContent.trim(),
+        node.querySelector('.cart-item-price').textContent.trim(),
+        quantity ? quantity.textContent.trim() : ''
+    ];
+});
+const empty = document.getElementById('empty-message');
+const style = getComputedStyle(empty);
+const summary = getCartSummary();
+return {
+    lines: lines,
+    total: document.getElementById('total-price').textContent.trim(),
+    emptyMessage: empty.textContent.trim(),
+    emptyVisible: style.display !== 'none' && style.visibility !== 'hidden' && empty.getClientRects().length > 0,
+    removeButtons: document.querySelectorAll('#cart-items .remove-btn').length,
+    state: summary.items.map(item => [item.name, item.price, item.quantity]),
+    stateTotal: summary.totalPrice,
+    stateTotalCents: summary.totalCents
+};
+"""
+
+
+def parse_price(price_text):
+    """Extract the exact amount from a price string such as '$699.99'"""
+    return Money.parse(price_text)
+
+
+def parse_quantity(quantity_text):
+    """Extract the quantity from a 'Qty: N' label (no label means 1)"""
+    match = re.search(r'(\d+)', quantity_text)
+    return int(match.group(1)) if match else 1
+
+
+@dataclass
+class CartLine:
+    """A single line in the cart"""
+    name: str
+    price: Money
+    quantity: int = 1
+
+    @property
+    def subtotal(self):
+        return self.price * self.quantity
+
+
+@dataclass
+class CartSnapshot:
+    """Point-in-time view of the cart as rendered in the DOM and held by script.js"""
+    items: List[CartLine] = field(default_factory=list)
+    total: Money = field(default_factory=Money)
+    empty_message: str = ""
+    empty_message_visible: bool = False
+    remove_buttons: int = 0
+    state_items: List[CartLine] = field(default_factory=list)
+    state_total: float = 0.0
+    state_total_cents: Optional[int] = None
+
+    @classmethod
+    def capture(cls, driver):
+        """Read the cart with a single execute_script call"""
+        data = driver.execute_script(CART_SNAPSHOT_JS)
+        return cls(
+            items=[CartLine(name, parse_price(price), parse_quantity(quantity))
+                   for name, price, quantity in data['lines']],
+            total=parse_price(data['total']),
+            empty_message=data['emptyMessage'],
+            empty_message_visible=data['emptyVisible'],
+            remove_buttons=data['removeButtons'],
+            state_items=[CartLine(name, Money.from_float(price), int(quantity))
+                         for name, price, quantity in data['state']],
+            state_total=float(data['stateTotal']),
+            state_total_cents=data.get('stateTotalCents'),
+        )
+
+    @property
+    def line_count(self):
+        """Number of distinct cart lines rendered"""
+        return len(self.items)
+
+    @property
+    def quantity_count(self):
+        """Number of products in the cart, counting quantities"""
+        return sum(item.quantity for item in self.items)
+
+    @property
+    def is_empty(self):
+        return not self.items and self.empty_message_visible
+
+    @property
+    def expected_total(self):
+        """Exact total computed from the rendered lines"""
+        return Money.bulk_total([item.price.cents for item in self.items],
+                                [item.quantity for item in self.items])
+
+    def find(self, name) -> Optional[CartLine]:
+        """Return the cart line for a product name, if present"""
+        for item in self.items:
+            if item.name == name:
+                return item
+        return None
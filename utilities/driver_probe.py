@@ -0,0 +1,75 @@
+"""
+Cached Chrome WebDriver probe for Mini E-Kart
+Launching a browser just to check that one can be launched costs seconds on
+every run. The probe result is cached in .cache/driver_probe.json and reused
+while the installed Chrome and chromedriver versions stay the same.
+"""
+
+import json
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+DEFAULT_PROBE_CACHE = Path(".cache") / "driver_probe.json"
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+
+def _version(binaries):
+    """`<binary> --version` of the first binary found on PATH (None if none is installed)"""
+    for name in binaries:
+        path = shutil.which(name)
+        if not path:
+            continue
+        try:
+            result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10)
+            return result.stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+    return None
+
+
+def chrome_version():
+    return _version(CHROME_BINARIES)
+
+
+def chromedriver_version():
+    return _version(("chromedriver",))
+
+
+def probe_driver(cache_path=DEFAULT_PROBE_CACHE, force=False):
+    """
+    Check that Chrome starts through WebDriver, reusing a cached success
+    Args:
+        cache_path: Where the last successful probe is remembered
+        force: Launch the probe browser even if the cache matches
+    Returns:
+        Dict with 'ok', 'cached', 'chrome', 'chromedriver', 'probe_s' and 'error'
+    """
+    cache_path = Path(cache_path)
+    key = {'chrome': chrome_version(), 'chromedriver': chromedriver_version()}
+    if not force and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached.get('ok') and {name: cached.get(name) for name in key} == key:
+                return dict(cached, cached=True)
+        except ValueError:
+            pass
+
+    # Selenium is only imported when a real probe is needed
+    from utilities.driver_setup import DriverSetup
+
+    start = time.perf_counter()
+    setup = DriverSetup(fast_startup=True)
+    result = dict(key, ok=True, cached=False, error=None)
+    try:
+        setup.setup_driver()
+    except Exception as e:
+        result.update(ok=False, error=str(e))
+    finally:
+        setup.cleanup()
+    result['probe_s'] = time.perf_counter() - start
+    if result['ok']:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(result, indent=2))
+    return result
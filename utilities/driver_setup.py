@@ -1,5 +1,9 @@
 import os
+import json
 import time
+import shutil
+import tempfile
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -7,11 +11,161 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
+from utilities.money import Money
+
+# Resolves as soon as script.js has re-rendered the cart past `since`,
+# observed through the data-cart-version attribute set by markCartRendered()
+WAIT_FOR_CART_VERSION_JS = """
+const since = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+if (cartVersion > since) { done(cartVersion); return; }
+let timer = null;
+const observer = new MutationObserver(() => {
+    if (cartVersion > since) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(cartVersion);
+    }
+});
+observer.observe(document.body, {attributes: true, attributeFilter: ['data-cart-version']});
+timer = setTimeout(() => { observer.disconnect(); done(cartVersion); }, timeoutMs);
+"""
+
+# Must match CART_STORAGE_KEY in script.js
+CART_STORAGE_KEY = "ekart.cart.v1"
+
+# Everything about the page that a scenario can change; two equal
+# fingerprints mean the next scenario cannot tell the pages apart
+PAGE_FINGERPRINT_FN = """
+const fingerprint = () => {
+    const storage = [];
+    for (let i = 0; i < localStorage.length; i++) {
+        const key = localStorage.key(i);
+        storage.push([key, localStorage.getItem(key)]);
+    }
+    storage.sort();
+    const empty = document.getElementById('empty-message');
+    return {
+        href: location.href,
+        cart: serializeCart(),
+        lines: document.querySelectorAll('#cart-items .cart-item').length,
+        total: document.getElementById('total-price').textContent.trim(),
+        emptyVisible: empty.style.display !== 'none',
+        localStorage: JSON.stringify(storage),
+        sessionStorage: sessionStorage.length,
+        addButtons: Array.from(document.querySelectorAll('.add-btn'))
+            .filter(button => button.textContent !== 'Add to Cart').length,
+        pendingWrite: persistTimer !== null,
+        scroll: [window.scrollX, window.scrollY]
+    };
+};
+"""
+
+PAGE_FINGERPRINT_JS = PAGE_FINGERPRINT_FN + "return fingerprint();"
+
+# Puts a reused page back into its checkpointed state without reloading:
+# storage and cart are re-injected and transient UI state is reset.
+# Returns null when the page is not the checkpointed one (caller reloads)
+RESTORE_CHECKPOINT_JS = PAGE_FINGERPRINT_FN + """
+const [href, rows, storage] = arguments;
+if (location.href !== href || typeof seedCart !== 'function') { return null; }
+const before = fingerprint();
+cancelCartPersist();
+localStorage.clear();
+sessionStorage.clear();
+storage.forEach(([key, value]) => localStorage.setItem(key, value));
+seedCart(rows);
+cancelCartPersist();
+document.querySelectorAll('.add-btn').forEach(button => {
+    button.textContent = 'Add to Cart';
+    button.style.background = '';
+});
+window.scrollTo(0, 0);
+return {before: before, after: fingerprint()};
+"""
+
+# Extra flags for fast_startup: skip first-run work, background services and
+# features the tests never touch
+FAST_STARTUP_ARGS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-breakpad",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-hang-monitor",
+    "--disable-popup-blocking",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--password-store=basic",
+    "--use-mock-keychain",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication,"
+    "CertificateTransparencyComponentUpdater,InterestFeedContentSuggestions",
+]
+
+PROFILE_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "chrome_profile"
+
+# Preferences of the pre-built profile: no first-run UI, no password,
+# translate or safe browsing work on the first navigation
+MINIMAL_PROFILE_PREFERENCES = {
+    "browser": {"check_default_browser": False, "has_seen_welcome_page": True},
+    "credentials_enable_service": False,
+    "profile": {"password_manager_enabled": False, "exit_type": "Normal", "exited_cleanly": True},
+    "safebrowsing": {"enabled": False},
+    "translate": {"enabled": False},
+    "search": {"suggest_enabled": False},
+}
+
+
+def build_minimal_profile(template_dir=PROFILE_TEMPLATE_DIR):
+    """Create the minimal profile template once; later launches copy it"""
+    template_dir = Path(template_dir)
+    if template_dir.exists():
+        return template_dir
+    # Build under a temporary name and rename, so parallel workers never copy a half-written template
+    template_dir.parent.mkdir(parents=True, exist_ok=True)
+    building = Path(tempfile.mkdtemp(prefix=f".{template_dir.name}-", dir=template_dir.parent))
+    (building / "Default").mkdir()
+    (building / "First Run").touch()
+    (building / "Local State").write_text(json.dumps({"browser": {"enabled_labs_experiments": []}}))
+    (building / "Default" / "Preferences").write_text(json.dumps(MINIMAL_PROFILE_PREFERENCES))
+    try:
+        os.rename(building, template_dir)
+    except OSError:
+        # Another worker finished first; its template is identical
+        shutil.rmtree(building, ignore_errors=True)
+    return template_dir
+
+
+# Harvests the product catalog (name, price, add button) in one roundtrip
+CATALOG_INDEX_JS = """
+return Array.from(document.querySelectorAll('.add-btn')).map(btn => [
+    btn.getAttribute('data-name'),
+    btn.getAttribute('data-price'),
+    btn
+]);
+"""
+
+
 class DriverSetup:
-    def __init__(self):
+    def __init__(self, base_url=None, money_mode="float", fast_startup=False):
         self.driver = None
         self.wait = None
-        self.base_url = "file://" + os.path.abspath("index.html")
+        self.base_url = base_url or "file://" + os.path.abspath("index.html")
+        if money_mode == "cents":
+            # script.js keeps integer-cent totals when the page is opened with ?money=cents
+            self.base_url += ("&" if "?" in self.base_url else "?") + "money=cents"
+        self.uses = 0
+        self.catalog = None
+        self.checkpoint = None
+        self.fast_startup = fast_startup
+        self.profile_dir = None
+        # False when the driver is borrowed from a SharedBrowser (cleanup must not quit it)
+        self.owns_driver = True
 
     def setup_driver(self):
         try:
@@ -24,6 +178,14 @@ class DriverSetup:
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-plugins")
             chrome_options.add_argument("--disable-images")
+            if self.fast_startup:
+                for arg in FAST_STARTUP_ARGS:
+                    chrome_options.add_argument(arg)
+                # A private copy, so concurrent browsers never share a profile lock
+                self.profile_dir = tempfile.mkdtemp(prefix="ekart-chrome-")
+                user_data_dir = os.path.join(self.profile_dir, "profile")
+                shutil.copytree(build_minimal_profile(), user_data_dir)
+                chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
 
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.implicitly_wait(10)
@@ -37,10 +199,12 @@ class DriverSetup:
     def navigate_to_homepage(self):
         try:
             print(f"Navigating to: {self.base_url}")
+            self.invalidate_catalog()
             self.driver.get(self.base_url)
             self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "products-grid")))
             title = self.driver.title
             assert "Mini E-Kart" in title, f"Expected 'Mini E-Kart' in title, got {title}"
+            self.build_catalog_index()
             print("Opened Mini E-Kart homepage")
             return True
         except TimeoutException:
@@ -50,6 +214,25 @@ class DriverSetup:
             print(f"Error navigating to homepage: {e}")
             return False
 
+    def build_catalog_index(self):
+        entries = self.driver.execute_script(CATALOG_INDEX_JS)
+        self.catalog = {
+            name: {'price': float(price), 'button': button}
+            for name, price, button in entries
+        }
+        return self.catalog
+
+    def invalidate_catalog(self):
+        self.catalog = None
+
+    def get_catalog(self):
+        if self.catalog is None:
+            self.build_catalog_index()
+        return self.catalog
+
+    def get_product(self, name):
+        return self.get_catalog().get(name)
+
     def find_element_safely(self, by, value, timeout=10):
         try:
             element = WebDriverWait(self.driver, timeout).until(
@@ -70,12 +253,24 @@ class DriverSetup:
             print(f"Elements not found: {by}={value}")
             return []
 
+    def query_all(self, selector):
+        # Unlike find_elements this returns immediately (no implicit wait) when nothing matches
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]));", selector
+        )
+
+    def find_cart_remove_button(self, product_name):
+        # Cart lines are keyed by data-name, so this is a single selector lookup
+        return self.driver.execute_script("""
+            return document.querySelector(
+                `#cart-items .cart-item[data-name="${CSS.escape(arguments[0])}"] .remove-btn`);
+        """, product_name)
+
     def click_element_safely(self, element, desc="element"):
         try:
             if element and element.is_displayed() and element.is_enabled():
                 element.click()
                 print(f"Clicked {desc}")
-                time.sleep(0.5)
                 return True
             else:
                 print(f"{desc} not clickable")
@@ -84,6 +279,22 @@ class DriverSetup:
             print(f"Error clicking {desc}: {e}")
             return False
 
+    def get_cart_version(self):
+        return self.driver.execute_script("return cartVersion;")
+
+    def wait_for_cart_update(self, since_version, timeout=5):
+        version = self.driver.execute_async_script(WAIT_FOR_CART_VERSION_JS, since_version, int(timeout * 1000))
+        if version <= since_version:
+            raise TimeoutException(f"Cart did not re-render within {timeout}s")
+        return version
+
+    def click_and_wait_for_cart(self, element, desc="element", timeout=5):
+        version = self.get_cart_version()
+        if not self.click_element_safely(element, desc):
+            return False
+        self.wait_for_cart_update(version, timeout)
+        return True
+
     def get_text_safely(self, element, desc="element"):
         try:
             if element:
@@ -96,6 +307,95 @@ class DriverSetup:
             print(f"Error getting text from {desc}: {e}")
             return ""
 
+    def reset_state(self):
+        try:
+            self.driver.delete_all_cookies()
+            # Drop any pending cart write first, or pagehide would save the cart again
+            self.driver.execute_script("""
+                if (typeof cancelCartPersist === 'function') { cancelCartPersist(); }
+                window.localStorage.clear(); window.sessionStorage.clear();
+            """)
+            return self.navigate_to_homepage()
+        except Exception as e:
+            print(f"Error resetting browser state: {e}")
+            return False
+
+    def seed_cart(self, items):
+        """
+        Replace the cart on the open page in one execute_script call (no clicks, no reload)
+        items: iterable of (name, price) or (name, price, quantity)
+        Returns the cart version after rendering, or None on error
+        """
+        rows = []
+        for item in items:
+            name, price, quantity = (tuple(item) + (1,))[:3]
+            rows.append([name, float(price), int(quantity)])
+        try:
+            return self.driver.execute_script("return seedCart(arguments[0]);", rows)
+        except Exception as e:
+            print(f"Error seeding cart: {e}")
+            return None
+
+    def seed_cart_storage(self, items):
+        """
+        Store a cart directly in localStorage and reload so script.js restores it
+        items: iterable of (name, price) or (name, price, quantity)
+        """
+        rows = []
+        for item in items:
+            name, price, quantity = (tuple(item) + (1,))[:3]
+            rows.append([name, Money.from_float(price).cents, int(quantity)])
+        try:
+            self.driver.execute_script("""
+                if (typeof cancelCartPersist === 'function') { cancelCartPersist(); }
+                window.localStorage.setItem(arguments[0], JSON.stringify(arguments[1]));
+            """, CART_STORAGE_KEY, rows)
+            return self.navigate_to_homepage()
+        except Exception as e:
+            print(f"Error seeding cart storage: {e}")
+            return False
+
+    def page_fingerprint(self):
+        return self.driver.execute_script(PAGE_FINGERPRINT_JS)
+
+    def capture_checkpoint(self):
+        """Remember the current ready page (URL, cart, storage) for restore_checkpoint()"""
+        try:
+            fingerprint = self.page_fingerprint()
+            self.checkpoint = {
+                'href': fingerprint['href'],
+                'rows': [[name, cents / 100, quantity] for name, cents, quantity in json.loads(fingerprint['cart'])],
+                'storage': json.loads(fingerprint['localStorage']),
+                'fingerprint': fingerprint,
+            }
+            return True
+        except Exception as e:
+            print(f"Error capturing checkpoint: {e}")
+            self.checkpoint = None
+            return False
+
+    def restore_checkpoint(self):
+        """
+        Return the open page to the captured checkpoint in one script call
+        Returns a dict with the fingerprints before/after and whether the
+        result matches the checkpoint, or None if the page must be reloaded
+        """
+        if not self.checkpoint:
+            return None
+        try:
+            result = self.driver.execute_script(
+                RESTORE_CHECKPOINT_JS, self.checkpoint['href'], self.checkpoint['rows'], self.checkpoint['storage']
+            )
+        except Exception as e:
+            print(f"Error restoring checkpoint: {e}")
+            return None
+        if result is None:
+            return None
+        expected = self.checkpoint['fingerprint']
+        result['isolated'] = result['after'] == expected
+        result['leaked'] = sorted(key for key in expected if result['before'].get(key) != expected[key])
+        return result
+
     def take_screenshot(self, filename="screenshot.png"):
         try:
             path = os.path.join("reports", filename)
@@ -106,11 +406,14 @@ class DriverSetup:
 
     def cleanup(self):
         try:
-            if self.driver:
+            if self.driver and self.owns_driver:
                 self.driver.quit()
                 print("WebDriver closed")
         except Exception as e:
             print(f"Error closing WebDriver: {e}")
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
 
     def get_driver(self):
         return self.driver
@@ -119,6 +422,243 @@ class DriverSetup:
         return self.wait
 
 
+class DriverPool:
+    """
+    Keeps warm Chrome sessions alive across scenarios
+    A session is reset before it is handed out again and recycled after
+    max_uses scenarios or after any error
+    """
+
+    def __init__(self, max_uses=20, max_idle=1, checkpoints=True, **setup_kwargs):
+        """
+        Args:
+            max_uses: Scenarios a session serves before it is recycled
+            max_idle: Sessions kept warm between scenarios; extra ones are recycled on release
+            checkpoints: Reset by restoring the ready page captured after the first load
+                (storage and cart re-injected, no reload) instead of clearing storage and
+                reloading index.html; a page that does not match the checkpoint is reloaded
+            setup_kwargs: Passed to every DriverSetup the pool creates (base_url, money_mode,
+                fast_startup)
+        """
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self.checkpoints = checkpoints
+        self.setup_kwargs = setup_kwargs
+        self._idle = []
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0, 'restored': 0, 'reloaded': 0}
+        self.resets = []
+
+    def acquire(self):
+        """
+        Hand out a reset idle session, or start a new one on the homepage
+        Returns:
+            DriverSetup with uses set to the scenarios it has served, this one included
+        """
+        while self._idle:
+            setup = self._idle.pop()
+            if self._reset(setup):
+                setup.uses += 1
+                self.stats['reused'] += 1
+                return setup
+            self._recycle(setup)
+        setup = DriverSetup(**self.setup_kwargs)
+        setup.setup_driver()
+        self.stats['created'] += 1
+        if not setup.navigate_to_homepage():
+            self._recycle(setup)
+            raise Exception("Could not open homepage")
+        if self.checkpoints:
+            setup.capture_checkpoint()
+        setup.uses = 1
+        return setup
+
+    def _reset(self, setup):
+        start = time.perf_counter()
+        result = setup.restore_checkpoint() if self.checkpoints else None
+        if result and result['isolated']:
+            self.stats['restored'] += 1
+            self._log_reset(setup, "checkpoint", start, result)
+            return True
+        # No checkpoint, or the page drifted from it: fall back to a full reload
+        ok = setup.reset_state()
+        if ok:
+            self.stats['reloaded'] += 1
+            if self.checkpoints:
+                setup.capture_checkpoint()
+        self._log_reset(setup, "reload", start, result, ok)
+        return ok
+
+    def _log_reset(self, setup, mode, start, result, ok=True):
+        self.resets.append({
+            'session': id(setup),
+            'use': setup.uses + 1,
+            'mode': mode,
+            'ms': (time.perf_counter() - start) * 1000,
+            'ok': ok,
+            'isolated': bool(result and result['isolated']) if mode == "checkpoint" else ok,
+            'leaked_before_reset': result['leaked'] if result else None,
+        })
+
+    def release(self, setup, failed=False):
+        """
+        Return a session after its scenario
+        Args:
+            setup: DriverSetup from acquire()
+            failed: Recycle the session instead of keeping it warm
+        """
+        if failed or setup.uses >= self.max_uses or len(self._idle) >= self.max_idle:
+            self._recycle(setup)
+        else:
+            self._idle.append(setup)
+
+    def _recycle(self, setup):
+        self.stats['recycled'] += 1
+        setup.cleanup()
+
+    def isolation_report(self):
+        """Summary of every reset: how it was done, how long it took, whether state was isolated"""
+        by_mode = {}
+        for entry in self.resets:
+            by_mode.setdefault(entry['mode'], []).append(entry['ms'])
+        return {
+            'stats': dict(self.stats),
+            'all_isolated': all(entry['isolated'] for entry in self.resets),
+            'mean_reset_ms': {mode: sum(samples) / len(samples) for mode, samples in by_mode.items()},
+            'resets': self.resets,
+        }
+
+    def write_isolation_report(self, path):
+        """Write isolation_report() as JSON and return the path"""
+        with open(path, "w") as f:
+            json.dump(self.isolation_report(), f, indent=2)
+        return path
+
+    def shutdown(self):
+        """Quit the idle sessions and print the pool statistics"""
+        while self._idle:
+            self._idle.pop().cleanup()
+        print(f"Driver pool: {self.stats['created']} created, "
+              f"{self.stats['reused']} reused ({self.stats['restored']} from checkpoint), "
+              f"{self.stats['recycled']} recycled")
+
+
+class SharedBrowser:
+    """
+    One long-lived Chrome process with an isolated browser context per scenario
+    Each scenario gets a new incognito-style context over CDP, so cookies and
+    storage never leak between scenarios without paying for a new process
+    """
+
+    def __init__(self, fast_startup=True, **setup_kwargs):
+        """
+        Args:
+            fast_startup: Launch Chrome from the minimal profile template
+            setup_kwargs: Passed to every DriverSetup (base_url, money_mode)
+        """
+        self.setup_kwargs = dict(setup_kwargs, fast_startup=fast_startup)
+        self.browser = None
+        self.home_window = None
+        self.contexts_supported = True
+        self.stats = {'launched': 0, 'contexts': 0, 'fallback_reloads': 0}
+        self.launch_ms = []
+        self.context_ms = []
+
+    def _launch(self):
+        start = time.perf_counter()
+        self.browser = DriverSetup(**self.setup_kwargs)
+        self.browser.setup_driver()
+        # The first window stays open on about:blank so the browser never loses its last target
+        self.home_window = self.browser.driver.current_window_handle
+        self.stats['launched'] += 1
+        self.launch_ms.append((time.perf_counter() - start) * 1000)
+
+    def acquire(self):
+        """
+        Open the homepage in a new browser context, launching Chrome on first use
+        Falls back to resetting the shared window when contexts are unavailable
+        Returns:
+            DriverSetup borrowing the shared driver (cleanup() does not quit it)
+        """
+        if self.browser is None:
+            self._launch()
+        start = time.perf_counter()
+        driver = self.browser.driver
+        setup = DriverSetup(**self.setup_kwargs)
+        setup.driver, setup.wait, setup.owns_driver = driver, self.browser.wait, False
+        setup.browser_context_id = None
+        driver.switch_to.window(self.home_window)
+        if self.contexts_supported:
+            try:
+                setup.browser_context_id = driver.execute_cdp_cmd(
+                    "Target.createBrowserContext", {"disposeOnDetach": True})['browserContextId']
+                target = driver.execute_cdp_cmd("Target.createTarget", {
+                    "url": "about:blank", "browserContextId": setup.browser_context_id})
+                # chromedriver window handles are DevTools target ids
+                driver.switch_to.window(target['targetId'])
+            except Exception as e:
+                print(f"⚠️ Browser contexts unavailable, resetting the shared window instead: {e}")
+                self.contexts_supported = False
+                self._dispose(setup)
+        if setup.browser_context_id is None:
+            self.stats['fallback_reloads'] += 1
+            ok = setup.reset_state() if driver.current_url != "about:blank" else setup.navigate_to_homepage()
+        else:
+            ok = setup.navigate_to_homepage()
+        if not ok:
+            self._dispose(setup)
+            raise Exception("Could not open homepage")
+        self.stats['contexts'] += 1
+        self.context_ms.append((time.perf_counter() - start) * 1000)
+        setup.uses = 1
+        return setup
+
+    def release(self, setup, failed=False):
+        """Dispose the scenario's context; a failure that killed the browser forces a relaunch"""
+        try:
+            self._dispose(setup)
+        except WebDriverException as e:
+            print(f"⚠️ Shared browser lost ({e}); relaunching for the next scenario")
+            self.browser.cleanup()
+            self.browser = None
+
+    def _dispose(self, setup):
+        driver = setup.driver
+        driver.switch_to.window(self.home_window)
+        if setup.browser_context_id:
+            # Disposing the context closes its targets and drops its cookies and storage
+            driver.execute_cdp_cmd("Target.disposeBrowserContext",
+                                   {"browserContextId": setup.browser_context_id})
+            setup.browser_context_id = None
+
+    def startup_report(self):
+        """Cold (browser launch) against warm (new context + homepage) startup times"""
+        def mean(samples):
+            return sum(samples) / len(samples) if samples else None
+        return {
+            'stats': dict(self.stats),
+            'cold_start_ms': mean(self.launch_ms),
+            'warm_start_ms': mean(self.context_ms),
+            'launch_ms': self.launch_ms,
+            'context_ms': self.context_ms,
+        }
+
+    def write_startup_report(self, path):
+        """Write startup_report() as JSON and return the path"""
+        with open(path, "w") as f:
+            json.dump(self.startup_report(), f, indent=2)
+        return path
+
+    def shutdown(self):
+        """Quit the shared browser and print cold and warm startup times"""
+        if self.browser:
+            self.browser.cleanup()
+            self.browser = None
+        report = self.startup_report()
+        if report['cold_start_ms'] is not None and report['warm_start_ms'] is not None:
+            print(f"Shared browser: {self.stats['contexts']} contexts, "
+                  f"cold start {report['cold_start_ms']:.0f}ms, warm start {report['warm_start_ms']:.0f}ms")
+
+
 driver_setup = DriverSetup()
 
 def before_scenario(context, scenario):
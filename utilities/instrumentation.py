@@ -0,0 +1,183 @@
+"""
+Low-overhead timing instrumentation for Mini E-Kart test runs
+Records wall time per phase (scenario, step, DriverSetup method, WebDriver
+command), counts WebDriver commands and writes a per-scenario breakdown plus
+a collapsed-stack file that flame-graph tools (flamegraph.pl, speedscope,
+inferno) can render
+"""
+
+import json
+import functools
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+
+# DriverSetup methods that get their own frame in the profile
+DRIVER_SETUP_METHODS = (
+    "setup_driver",
+    "navigate_to_homepage",
+    "reset_state",
+    "capture_checkpoint",
+    "restore_checkpoint",
+    "seed_cart",
+    "seed_cart_storage",
+    "build_catalog_index",
+    "click_element_safely",
+    "click_and_wait_for_cart",
+    "wait_for_cart_update",
+    "get_cart_version",
+    "query_all",
+    "find_cart_remove_button",
+    "find_element_safely",
+    "find_elements_safely",
+    "take_screenshot",
+    "cleanup",
+)
+
+
+def _frame_name(name):
+    """Frame names must not contain the collapsed-stack separator"""
+    return str(name).replace(";", ",").replace("\n", " ")
+
+
+class Profiler:
+    """
+    Collects nested phase timings and WebDriver command counts
+    """
+
+    def __init__(self):
+        """Initialize an empty profile"""
+        self.folded = defaultdict(float)
+        self.scenarios = []
+        self.current = None
+        self._stack = []
+
+    def start_scenario(self, feature, scenario):
+        """Open the root frame for a scenario"""
+        self.current = {
+            'feature': feature,
+            'scenario': scenario,
+            'phases': defaultdict(float),
+            'commands': Counter(),
+            'webdriver_time': 0.0,
+        }
+        self._stack = []
+        self.enter(feature)
+        self.enter(scenario)
+
+    def end_scenario(self, status=None):
+        """Close all open frames and store the scenario breakdown"""
+        if self.current is None:
+            return
+        while len(self._stack) > 1:
+            self.exit()
+        self.current['wall_time'] = self.exit()
+        self.current['status'] = status
+        self.current['phases'] = dict(self.current['phases'])
+        self.current['total_commands'] = sum(self.current['commands'].values())
+        self.current['commands'] = dict(self.current['commands'])
+        self.scenarios.append(self.current)
+        self.current = None
+
+    def enter(self, name):
+        """Push a frame onto the current stack"""
+        # [name, start time, time spent in children]
+        self._stack.append([_frame_name(name), perf_counter(), 0.0])
+
+    def exit(self):
+        """Pop the innermost frame and account its time; returns the elapsed seconds"""
+        name, start, children = self._stack.pop()
+        elapsed = perf_counter() - start
+        stack_key = ";".join([frame[0] for frame in self._stack] + [name])
+        self.folded[stack_key] += elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        if self.current is not None and len(self._stack) >= 2:
+            self.current['phases'][name] += elapsed
+        return elapsed
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block of code as a nested frame"""
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def wrap(self, func, name):
+        """Return func wrapped in a frame called name"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self.current is None:
+                return func(*args, **kwargs)
+            self.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.exit()
+        return wrapper
+
+    def instrument_driver(self, driver):
+        """Count and time every WebDriver command sent by this driver"""
+        if driver is None or getattr(driver, '_ekart_profiled', False):
+            return
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            if self.current is None:
+                return execute(driver_command, params)
+            self.current['commands'][driver_command] += 1
+            self.enter(f"webdriver:{driver_command}")
+            start = perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.current['webdriver_time'] += perf_counter() - start
+                self.exit()
+
+        driver.execute = counted_execute
+        driver._ekart_profiled = True
+
+    def instrument_driver_setup(self, driver_setup):
+        """Wrap DriverSetup methods in frames and instrument its WebDriver"""
+        if getattr(driver_setup, '_ekart_profiled', False):
+            return driver_setup
+        for method_name in DRIVER_SETUP_METHODS:
+            method = getattr(driver_setup, method_name, None)
+            if method is not None:
+                setattr(driver_setup, method_name, self.wrap(method, f"DriverSetup.{method_name}"))
+
+        setup_driver = driver_setup.setup_driver
+
+        def setup_and_instrument(*args, **kwargs):
+            driver = setup_driver(*args, **kwargs)
+            self.instrument_driver(driver)
+            return driver
+
+        driver_setup.setup_driver = setup_and_instrument
+        self.instrument_driver(driver_setup.driver)
+        driver_setup._ekart_profiled = True
+        return driver_setup
+
+    def write_reports(self, reports_dir="reports", tag=None):
+        """
+        Write the per-scenario breakdown (JSON) and the collapsed stacks
+        Collapsed stack values are integer microseconds of self time
+        """
+        reports_dir = Path(reports_dir)
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        suffix = f"_{tag}" if tag else ""
+
+        breakdown_path = reports_dir / f"profile_scenarios{suffix}.json"
+        with open(breakdown_path, "w") as f:
+            json.dump(self.scenarios, f, indent=2)
+
+        folded_path = reports_dir / f"profile{suffix}.folded"
+        with open(folded_path, "w") as f:
+            for stack, seconds in sorted(self.folded.items()):
+                micros = int(seconds * 1_000_000)
+                if micros > 0:
+                    f.write(f"{stack} {micros}\n")
+        return breakdown_path, folded_path
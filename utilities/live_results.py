@@ -0,0 +1,141 @@
+"""
+Live results for streamed Behave runs
+Consumes the NDJSON events of utilities/ndjson_formatter.py one line at a
+time: prints a line per finished scenario with running totals, appends the
+events to reports/events.ndjson and rewrites reports/live_summary.json as
+the run progresses. Only counters and a bounded list of failures are kept,
+so memory does not grow with the size of the suite.
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+
+EVENT_PREFIX = '{"event":'
+STATUS_ICONS = {'passed': '✅', 'failed': '❌', 'skipped': '⏭️', 'untested': '⏭️', 'undefined': '❓'}
+
+
+class LiveResults:
+    """
+    Running totals for one streamed run
+    Usage:
+        live = LiveResults("reports")
+        for line in process.stdout:
+            event = live.parse(line)
+            if event:
+                print(live.handle(event) or "", end="")
+        live.finish()
+    """
+
+    def __init__(self, reports_dir="reports", max_failures=50, summary_interval=1.0):
+        """
+        Args:
+            reports_dir: Where events.ndjson and live_summary.json are written
+            max_failures: Failures kept with their error for the summary
+            summary_interval: Minimum seconds between live_summary.json rewrites
+        """
+        self.reports_dir = Path(reports_dir)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.summary_path = self.reports_dir / "live_summary.json"
+        self.events_file = open(self.reports_dir / "events.ndjson", "w")
+        self.max_failures = max_failures
+        self.summary_interval = summary_interval
+        self.started = time.time()
+        self.last_written = 0.0
+        self.scenarios = {'passed': 0, 'failed': 0, 'skipped': 0}
+        self.steps = {'passed': 0, 'failed': 0, 'skipped': 0, 'undefined': 0}
+        self.features = 0
+        self.current = None
+        self.failures = []
+        self.failure_count = 0
+        self.pending_error = None
+
+    @staticmethod
+    def parse(line):
+        """The event on this output line, or None for ordinary output"""
+        if not line.startswith(EVENT_PREFIX):
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    def handle(self, event):
+        """
+        Update the totals and reports for one event
+        Returns:
+            Text for the console and output log (None for events that print nothing)
+        """
+        self.events_file.write(json.dumps(event) + "\n")
+        kind = event['event']
+        if kind == "feature_start":
+            self.current = event['feature']
+            return f"\n📂 {event['feature']}\n"
+        if kind == "step":
+            status = event['status']
+            self.steps[status if status in self.steps else 'skipped'] += 1
+            if event.get('error'):
+                self.pending_error = f"{event['keyword']} {event['name']}: {event['error']}"
+            return None
+        if kind == "scenario_end":
+            return self._scenario_end(event)
+        if kind == "feature_end":
+            self.features += 1
+            self.write_summary()
+            return None
+        if kind == "run_end":
+            self.current = None
+            self.write_summary(force=True)
+            return None
+        return None
+
+    def _scenario_end(self, event):
+        status = event['status']
+        self.scenarios[status if status in self.scenarios else 'skipped'] += 1
+        text = f"  {STATUS_ICONS.get(status, '•')} {event['scenario']} ({event['duration']:.2f}s)  {self.progress()}\n"
+        if status == "failed":
+            self.failure_count += 1
+            error = self.pending_error or "after_scenario hook failed"
+            if len(self.failures) < self.max_failures:
+                self.failures.append({'feature': event['feature'], 'scenario': event['scenario'],
+                                      'location': event['location'], 'error': error[:2000]})
+            text += "".join(f"      {line}\n" for line in error.splitlines()[:8])
+        self.pending_error = None
+        self.write_summary()
+        return text
+
+    def progress(self):
+        return (f"[{self.scenarios['passed']} passed, {self.scenarios['failed']} failed, "
+                f"{self.scenarios['skipped']} skipped | {time.time() - self.started:.1f}s]")
+
+    def summary(self):
+        return {
+            'running': self.current is not None,
+            'current_feature': self.current,
+            'elapsed_s': time.time() - self.started,
+            'features': self.features,
+            'scenarios': dict(self.scenarios),
+            'steps': dict(self.steps),
+            'failure_count': self.failure_count,
+            'failures': self.failures,
+        }
+
+    def write_summary(self, force=False):
+        """Rewrite live_summary.json (atomically, at most every summary_interval seconds)"""
+        now = time.time()
+        if not force and now - self.last_written < self.summary_interval:
+            return
+        self.last_written = now
+        self.events_file.flush()
+        tmp = self.summary_path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+        os.replace(tmp, self.summary_path)
+
+    def finish(self):
+        """Final summary write; returns the summary"""
+        self.current = None
+        self.write_summary(force=True)
+        self.events_file.close()
+        return self.summary()
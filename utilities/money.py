@@ -0,0 +1,97 @@
+"""
+Exact money arithmetic for the Mini E-Kart test harness
+Amounts are held as integer cents so totals can be compared exactly instead
+of with a float tolerance
+"""
+
+import re
+import operator
+from decimal import Decimal, ROUND_HALF_UP
+from functools import total_ordering
+
+AMOUNT_PATTERN = re.compile(r'-?\d[\d,]*(?:\.\d+)?')
+CENT = Decimal("0.01")
+
+
+@total_ordering
+class Money:
+    """An amount of money in integer cents"""
+
+    __slots__ = ('cents',)
+
+    def __init__(self, cents=0):
+        self.cents = int(cents)
+
+    @classmethod
+    def parse(cls, text):
+        """Parse a price string such as '$1,299.99' or '699.99' (no amount means $0.00)"""
+        match = AMOUNT_PATTERN.search(str(text))
+        if not match:
+            return cls(0)
+        amount = Decimal(match.group(0).replace(",", ""))
+        return cls(int(amount.quantize(CENT, rounding=ROUND_HALF_UP) * 100))
+
+    @classmethod
+    def from_float(cls, value):
+        """
+        Convert a float the way Number.prototype.toFixed(2) does: the exact
+        binary value rounded half-up to the nearest cent
+        """
+        return cls(int(Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP) * 100))
+
+    @staticmethod
+    def bulk_total(prices_cents, quantities):
+        """
+        Sum price * quantity over many cart lines
+        map/operator.mul keeps the loop in C, so carts with thousands of
+        lines are summed without per-line Money objects
+        """
+        return Money(sum(map(operator.mul, prices_cents, quantities)))
+
+    def __add__(self, other):
+        if isinstance(other, Money):
+            return Money(self.cents + other.cents)
+        return NotImplemented
+
+    def __radd__(self, other):
+        # Lets sum() start from its default 0
+        if other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, Money):
+            return Money(self.cents - other.cents)
+        return NotImplemented
+
+    def __mul__(self, quantity):
+        if isinstance(quantity, int):
+            return Money(self.cents * quantity)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        return isinstance(other, Money) and self.cents == other.cents
+
+    def __lt__(self, other):
+        if isinstance(other, Money):
+            return self.cents < other.cents
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.cents)
+
+    def __bool__(self):
+        return self.cents != 0
+
+    def to_decimal(self):
+        return Decimal(self.cents) / 100
+
+    def __str__(self):
+        sign = "-" if self.cents < 0 else ""
+        dollars, cents = divmod(abs(self.cents), 100)
+        return f"{sign}${dollars}.{cents:02d}"
+
+    def __repr__(self):
+        return f"Money('{self}')"
@@ -0,0 +1,91 @@
+"""
+Streaming NDJSON formatter for Behave
+Writes one JSON object per line as the run progresses (feature and scenario
+boundaries, every finished step) and flushes after each, so a consumer can
+follow a long run live without waiting for the suite to finish.
+
+Events:
+    {"event": "feature_start", "feature", "location"}
+    {"event": "scenario_start", "feature", "scenario", "location", "tags"}
+    {"event": "step", "feature", "scenario", "keyword", "name", "location", "status", "duration", "error"}
+    {"event": "scenario_end", "feature", "scenario", "location", "status", "duration"}
+    {"event": "feature_end", "feature", "location", "status", "duration"}
+    {"event": "run_end", "duration"}
+
+Usage (registered as "ndjson" in behave.ini):
+    behave --format=ndjson --outfile=- features/
+"""
+
+import json
+import time
+
+from behave.formatter.base import Formatter
+
+
+def _status(element):
+    return getattr(element.status, "name", element.status)
+
+
+class NDJSONFormatter(Formatter):
+    name = "ndjson"
+    description = "Newline-delimited JSON events, one per finished step"
+
+    def __init__(self, stream_opener, config):
+        super().__init__(stream_opener, config)
+        self.started = time.time()
+        self.current_feature = None
+        self.current_scenario = None
+        self.reported_steps = 0
+
+    def emit(self, event, **fields):
+        stream = self.open()
+        stream.write(json.dumps(dict(event=event, time=time.time(), **fields)) + "\n")
+        stream.flush()
+
+    def feature(self, feature):
+        self.current_feature = feature
+        self.emit("feature_start", feature=feature.name, location=str(feature.location))
+
+    def scenario(self, scenario):
+        self._end_scenario()
+        self.current_scenario = scenario
+        self.reported_steps = 0
+        self.emit("scenario_start", feature=self.current_feature.name, scenario=scenario.name,
+                  location=str(scenario.location), tags=list(scenario.effective_tags))
+
+    def result(self, step):
+        self.reported_steps += 1
+        self._emit_step(step)
+
+    def _emit_step(self, step):
+        scenario = self.current_scenario
+        self.emit("step",
+                  feature=self.current_feature.name,
+                  scenario=scenario.name if scenario else None,
+                  keyword=step.keyword, name=step.name, location=str(step.location),
+                  status=_status(step), duration=step.duration,
+                  error=step.error_message if _status(step) in ("failed", "undefined") else None)
+
+    def _end_scenario(self):
+        # Scenarios end when the next one starts (or at feature end), so the
+        # status includes failures from after_scenario hooks
+        scenario = self.current_scenario
+        if scenario is not None:
+            # Steps after a failure (or of a skipped scenario) never get a result() call
+            for step in list(scenario.all_steps)[self.reported_steps:]:
+                self._emit_step(step)
+            self.current_scenario = None
+            self.emit("scenario_end", feature=self.current_feature.name, scenario=scenario.name,
+                      location=str(scenario.location), status=_status(scenario), duration=scenario.duration)
+
+    def eof(self):
+        self._end_scenario()
+        feature = self.current_feature
+        if feature is not None:
+            self.emit("feature_end", feature=feature.name, location=str(feature.location),
+                      status=_status(feature), duration=feature.duration)
+        self.current_feature = None
+
+    def close(self):
+        self.emit("run_end", duration=time.time() - self.started)
+        self.close_stream()
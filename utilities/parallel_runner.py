@@ -0,0 +1,283 @@
+"""
+Parallel Behave runner for Mini E-Kart
+Spreads scenarios across worker processes (each owning its own Chrome session)
+and merges the per-worker JSON output into a single behave_results.json.
+Worker events are streamed into one set of live results as scenarios finish.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import heapq
+import threading
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+SCENARIO_PATTERN = re.compile(r'^\s*(Scenario|Scenario Outline):\s*(.+?)\s*$')
+DURATIONS_FILE = "scenario_durations.json"
+DEFAULT_DURATION = 3.0
+
+
+def scenario_key(feature_file, scenario_name):
+    """Stable key for a scenario that survives line number changes"""
+    return f"{feature_file}::{scenario_name}"
+
+
+def discover_scenarios(features_dir):
+    """
+    Find all scenarios in the feature files
+    Returns:
+        List of dicts with key, name and behave location (file:line)
+    """
+    scenarios = []
+    for feature_path in sorted(Path(features_dir).glob("*.feature")):
+        relative = f"{Path(features_dir).name}/{feature_path.name}"
+        with open(feature_path) as f:
+            for line_no, line in enumerate(f, 1):
+                match = SCENARIO_PATTERN.match(line)
+                if match:
+                    scenarios.append({
+                        'key': scenario_key(relative, match.group(2)),
+                        'name': match.group(2),
+                        'location': f"{relative}:{line_no}",
+                    })
+    return scenarios
+
+
+def schedule_longest_first(scenarios, durations, workers):
+    """
+    Assign scenarios to workers using longest-processing-time-first scheduling
+    Args:
+        scenarios: Scenarios from discover_scenarios()
+        durations: Mapping of scenario key to historical duration in seconds
+        workers: Number of worker processes
+    Returns:
+        List of scenario lists, one per worker
+    """
+    known = [d for d in durations.values() if d > 0]
+    fallback = sum(known) / len(known) if known else DEFAULT_DURATION
+
+    ordered = sorted(scenarios, key=lambda s: durations.get(s['key'], fallback), reverse=True)
+    buckets = [[] for _ in range(workers)]
+    loads = [(0.0, index) for index in range(workers)]
+    heapq.heapify(loads)
+    for scenario in ordered:
+        load, index = heapq.heappop(loads)
+        buckets[index].append(scenario)
+        heapq.heappush(loads, (load + durations.get(scenario['key'], fallback), index))
+    return [bucket for bucket in buckets if bucket]
+
+
+def scenario_duration(element):
+    """Total duration of a scenario element from behave JSON output"""
+    return sum(step.get('result', {}).get('duration', 0.0) for step in element.get('steps', []))
+
+
+def _not_run(element):
+    return element.get('status') in (None, 'skipped')
+
+
+def merge_behave_results(result_files):
+    """
+    Merge per-worker behave JSON output into one list of features
+    Scenarios of the same feature are combined and ordered by line number
+    """
+    features, elements = {}, {}
+    for result_file in result_files:
+        try:
+            with open(result_file) as f:
+                worker_features = json.load(f)
+        except (OSError, ValueError) as e:
+            # A worker that crashed or wrote non-JSON output loses its scenarios from the report
+            print(f"⚠️ Skipping unreadable worker results {result_file}: {e}")
+            continue
+
+        for feature in worker_features:
+            features.setdefault(feature['location'], feature)
+            merged = elements.setdefault(feature['location'], {})
+            for element in feature.get('elements', []):
+                # Each worker lists every scenario of the features it touched and reports
+                # the ones it was not assigned as skipped; a scenario that ran wins
+                kept = merged.get(element['location'])
+                if kept is None or (_not_run(kept) and not _not_run(element)):
+                    merged[element['location']] = element
+
+    merged_features = []
+    for location, feature in features.items():
+        feature['elements'] = sorted(elements[location].values(),
+                                     key=lambda e: int(e['location'].rsplit(':', 1)[1]))
+        statuses = {e.get('status') for e in feature['elements'] if e.get('type') != 'background'}
+        if 'failed' in statuses:
+            feature['status'] = 'failed'
+        elif 'passed' in statuses:
+            feature['status'] = 'passed'
+        else:
+            feature['status'] = 'skipped'
+        merged_features.append(feature)
+    merged_features.sort(key=lambda f: f['location'])
+    return merged_features
+
+
+def format_summary(features, elapsed):
+    """Render behave-style summary lines for merged results"""
+    def line(label, counts):
+        passed = counts.get('passed', 0)
+        noun = label if passed == 1 else label + "s"
+        return (f"{passed} {noun} passed, {counts.get('failed', 0)} failed, "
+                f"{counts.get('skipped', 0)} skipped")
+
+    feature_counts, scenario_counts, step_counts = {}, {}, {}
+    for feature in features:
+        feature_counts[feature['status']] = feature_counts.get(feature['status'], 0) + 1
+        for element in feature['elements']:
+            if element.get('type') == 'background':
+                continue
+            status = element.get('status') or 'skipped'
+            scenario_counts[status] = scenario_counts.get(status, 0) + 1
+            for step in element.get('steps', []):
+                status = step.get('result', {}).get('status', 'skipped')
+                step_counts[status] = step_counts.get(status, 0) + 1
+
+    steps_line = line("step", step_counts)
+    if step_counts.get('undefined'):
+        steps_line += f", {step_counts['undefined']} undefined"
+    minutes, seconds = divmod(elapsed, 60)
+    return "\n".join([
+        line("feature", feature_counts),
+        line("scenario", scenario_counts),
+        steps_line,
+        f"Took {int(minutes)}m{seconds:.3f}s",
+    ])
+
+
+class ParallelRunner:
+    """
+    Runs the Behave suite across a pool of worker processes
+    """
+
+    def __init__(self, project_root, workers=2):
+        """Initialize the runner for the given project root"""
+        self.project_root = Path(project_root)
+        self.reports_dir = self.project_root / "reports"
+        self.workers_dir = self.reports_dir / "workers"
+        self.features_dir = self.project_root / "features"
+        self.workers = workers
+        self._live_lock = threading.Lock()
+
+    def load_durations(self):
+        """Load historical scenario durations"""
+        try:
+            with open(self.reports_dir / DURATIONS_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_durations(self, durations, features):
+        """Blend the durations observed in this run into the history"""
+        for feature in features:
+            feature_file = feature['location'].rsplit(':', 1)[0]
+            for element in feature['elements']:
+                if element.get('type') == 'background' or not element.get('status'):
+                    continue
+                key = scenario_key(feature_file, element['name'])
+                observed = scenario_duration(element)
+                previous = durations.get(key)
+                durations[key] = observed if previous is None else 0.5 * previous + 0.5 * observed
+        with open(self.reports_dir / DURATIONS_FILE, "w") as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+
+    def worker_command(self, index, scenarios):
+        """
+        The behave command line of one worker
+        Returns:
+            Tuple of (command, JSON result file, pretty output file)
+        """
+        json_file = self.workers_dir / f"worker_{index}.json"
+        output_file = self.workers_dir / f"worker_{index}.txt"
+        cmd = [
+            sys.executable, "-m", "behave",
+            *[s['location'] for s in scenarios],
+            # Outfiles pair with formats by position: JSON and pretty to the worker
+            # files, events to stdout
+            "--format=json",
+            f"--outfile={json_file}",
+            "--format=pretty",
+            f"--outfile={output_file}",
+            "--format=ndjson",
+            "--outfile=-",
+            f"--define=worker_id={index}",
+            "--no-capture",
+            "--no-capture-stderr"
+        ]
+        return cmd, json_file, output_file
+
+    def _run_worker(self, index, scenarios, live):
+        """Run one behave process for the scenarios assigned to a worker, streaming its events"""
+        cmd, json_file, output_file = self.worker_command(index, scenarios)
+        process = subprocess.Popen(cmd, cwd=self.project_root, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, bufsize=1,
+                                   env=dict(os.environ, PYTHONUNBUFFERED="1"))
+        with open(self.workers_dir / f"worker_{index}.log", "w") as console:
+            for line in process.stdout:
+                event = live.parse(line)
+                if event is None:
+                    console.write(line)
+                    continue
+                # One LiveResults for all workers; events are applied one at a time
+                with self._live_lock:
+                    text = live.handle(event)
+                    if text:
+                        print("".join(f"[w{index}] {row}\n" if row else "\n"
+                                      for row in text.rstrip("\n").split("\n")), end="", flush=True)
+        return process.wait(), json_file, output_file
+
+    def run(self, locations=None):
+        """
+        Execute scenarios in parallel and write merged reports
+        Args:
+            locations: Optional behave locations (file:line) to restrict the run to
+        Returns:
+            True if every worker succeeded
+        """
+        self.workers_dir.mkdir(parents=True, exist_ok=True)
+        # Per-worker metrics from an earlier run must not leak into this run's summary
+        for stale in self.reports_dir.glob("perf_metrics*.jsonl"):
+            stale.unlink()
+        durations = self.load_durations()
+        scenarios = discover_scenarios(self.features_dir)
+        if locations is not None:
+            scenarios = [s for s in scenarios if s['location'] in set(locations)]
+        buckets = schedule_longest_first(scenarios, durations, self.workers)
+
+        print(f"⚡ Running {sum(len(b) for b in buckets)} scenarios on {len(buckets)} workers")
+        for index, bucket in enumerate(buckets):
+            estimate = sum(durations.get(s['key'], DEFAULT_DURATION) for s in bucket)
+            print(f"   Worker {index}: {len(bucket)} scenarios (~{estimate:.1f}s)")
+
+        from utilities.live_results import LiveResults
+
+        live = LiveResults(self.reports_dir)
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+            results = list(executor.map(lambda args: self._run_worker(*args, live), enumerate(buckets)))
+        elapsed = time.time() - start
+        live.finish()
+
+        features = merge_behave_results([json_file for _, json_file, _ in results])
+        with open(self.reports_dir / "behave_results.json", "w") as f:
+            json.dump(features, f, indent=2)
+
+        summary = format_summary(features, elapsed)
+        with open(self.reports_dir / "behave_output.txt", "w") as out:
+            for index, (_, _, output_file) in enumerate(results):
+                out.write(f"===== Worker {index} =====\n")
+                out.write(output_file.read_text())
+                out.write("\n")
+            out.write(summary + "\n")
+
+        self.save_durations(durations, features)
+        print(summary)
+        return all(returncode == 0 for returncode, _, _ in results)
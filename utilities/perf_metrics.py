@@ -0,0 +1,211 @@
+"""
+Page performance metrics for Mini E-Kart
+Pulls Navigation Timing, paint timings, long tasks and JS heap size from
+Chrome after every navigation and every add/remove click, groups them per
+scenario and appends them to reports/perf_metrics.jsonl (one scenario per
+line) next to the behave results.
+"""
+
+import json
+import functools
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+# Installed before any page script runs (CDP) so long tasks during load are seen
+LONG_TASK_OBSERVER_JS = """
+window.__ekartLongTasks = [];
+try {
+    new PerformanceObserver(list => {
+        list.getEntries().forEach(entry => window.__ekartLongTasks.push(entry.duration));
+    }).observe({type: 'longtask', buffered: true});
+} catch (error) {}
+"""
+
+# One roundtrip per sample; long tasks are drained so each is counted once
+PERF_SNAPSHOT_JS = """
+const kind = arguments[0];
+if (!window.__ekartLongTasks) {
+""" + LONG_TASK_OBSERVER_JS + """
+}
+const longTasks = window.__ekartLongTasks.splice(0);
+const sample = {
+    kind: kind,
+    longTasks: longTasks.length,
+    longTaskMs: longTasks.reduce((total, duration) => total + duration, 0),
+    heapUsedBytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+    heapTotalBytes: performance.memory ? performance.memory.totalJSHeapSize : null
+};
+if (kind === 'navigation') {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+        sample.ttfbMs = nav.responseStart - nav.startTime;
+        sample.domInteractiveMs = nav.domInteractive - nav.startTime;
+        sample.domContentLoadedMs = nav.domContentLoadedEventEnd - nav.startTime;
+        sample.loadMs = nav.loadEventEnd - nav.startTime;
+        sample.transferBytes = nav.transferSize;
+    }
+    performance.getEntriesByType('paint').forEach(paint => {
+        sample[paint.name === 'first-paint' ? 'firstPaintMs' : 'firstContentfulPaintMs'] = paint.startTime;
+    });
+} else {
+    const measures = performance.getEntriesByName('cart-update');
+    sample.cartUpdateMs = measures.length ? measures[measures.length - 1].duration : null;
+    performance.clearMeasures('cart-update');
+}
+return sample;
+"""
+
+
+def interaction_kind(desc):
+    """'Add to Cart for Laptop' -> 'add', 'Remove for Laptop' -> 'remove'"""
+    desc = str(desc).lower()
+    if desc.startswith("add"):
+        return "add"
+    if desc.startswith("remove"):
+        return "remove"
+    return "interaction"
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(samples):
+    """
+    Summary statistics of a list of samples, in the samples' own unit
+    Returns:
+        Dict of runs, mean, median, min, max and p50/p90/p99 (None when there are no samples)
+    """
+    return {
+        'runs': len(samples),
+        'mean': statistics.mean(samples) if samples else None,
+        'median': statistics.median(samples) if samples else None,
+        'min': min(samples) if samples else None,
+        'max': max(samples) if samples else None,
+        'p50': percentile(samples, 50),
+        'p90': percentile(samples, 90),
+        'p99': percentile(samples, 99),
+    }
+
+
+class PerfMetricsCollector:
+    """
+    Collects page metrics for each scenario through DriverSetup
+    """
+
+    def __init__(self, output_path="reports/perf_metrics.jsonl", serial=True):
+        """
+        Start a fresh metrics file for this run
+        A serial run also drops per-worker files left by an earlier parallel run
+        """
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if serial:
+            for stale in self.output_path.parent.glob("perf_metrics_*.jsonl"):
+                stale.unlink()
+        self.output_path.write_text("")
+        self.current = None
+
+    def start_scenario(self, feature, scenario):
+        self.current = {'feature': feature, 'scenario': scenario, 'samples': []}
+
+    def end_scenario(self, status=None):
+        """Append the scenario's samples to the metrics file"""
+        if self.current is None:
+            return
+        self.current['status'] = status
+        with open(self.output_path, "a") as f:
+            f.write(json.dumps(self.current) + "\n")
+        self.current = None
+
+    def attach(self, driver):
+        """Register the long task observer for every document this driver loads"""
+        if driver is None or getattr(driver, '_ekart_perf', False):
+            return
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": LONG_TASK_OBSERVER_JS})
+        except Exception as e:
+            # Without CDP the observer is installed at the first sample (load-time long tasks are missed)
+            print(f"⚠️ Long task observer not preinstalled: {e}")
+        driver._ekart_perf = True
+
+    def sample(self, driver, kind, label=None):
+        """Read one metrics sample from the page into the current scenario"""
+        if self.current is None or driver is None:
+            return None
+        try:
+            sample = driver.execute_script(PERF_SNAPSHOT_JS, kind)
+        except Exception as e:
+            print(f"⚠️ Could not read performance metrics: {e}")
+            return None
+        sample['label'] = label
+        self.current['samples'].append(sample)
+        return sample
+
+    def instrument_driver_setup(self, driver_setup):
+        """Sample after every navigation and every click that updates the cart"""
+        if getattr(driver_setup, '_ekart_perf', False):
+            return driver_setup
+        navigate = driver_setup.navigate_to_homepage
+        click = driver_setup.click_and_wait_for_cart
+        setup_driver = driver_setup.setup_driver
+
+        @functools.wraps(navigate)
+        def navigate_and_sample(*args, **kwargs):
+            ok = navigate(*args, **kwargs)
+            if ok:
+                self.sample(driver_setup.driver, "navigation", driver_setup.base_url)
+            return ok
+
+        @functools.wraps(click)
+        def click_and_sample(element, desc="element", *args, **kwargs):
+            ok = click(element, desc, *args, **kwargs)
+            if ok:
+                self.sample(driver_setup.driver, interaction_kind(desc), desc)
+            return ok
+
+        @functools.wraps(setup_driver)
+        def setup_and_attach(*args, **kwargs):
+            driver = setup_driver(*args, **kwargs)
+            self.attach(driver)
+            return driver
+
+        driver_setup.navigate_to_homepage = navigate_and_sample
+        driver_setup.click_and_wait_for_cart = click_and_sample
+        driver_setup.setup_driver = setup_and_attach
+        driver_setup._ekart_perf = True
+        self.attach(driver_setup.driver)
+        return driver_setup
+
+
+def load_perf_records(paths):
+    """Yield scenario records from one or more perf_metrics JSONL files"""
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def summarize_perf_metrics(records, percentiles=(50, 90, 95, 99)):
+    """
+    Percentiles of every numeric metric, keyed "<kind>.<metric>"
+    (e.g. "navigation.firstContentfulPaintMs", "add.cartUpdateMs")
+    """
+    values = defaultdict(list)
+    for record in records:
+        for sample in record['samples']:
+            for name, value in sample.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    values[f"{sample['kind']}.{name}"].append(value)
+    return {
+        metric: dict({'count': len(samples), 'max': max(samples)},
+                     **{f"p{pct}": percentile(samples, pct) for pct in percentiles})
+        for metric, samples in sorted(values.items())
+    }
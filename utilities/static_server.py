@@ -0,0 +1,214 @@
+"""
+Embedded static HTTP server for Mini E-Kart
+Serves the app over http:// (instead of file://) from a background thread so
+the browser can cache assets between navigations. Responses carry ETag and
+Cache-Control headers, conditional requests get 304 Not Modified and text
+assets are gzip-compressed when the client accepts it. Per-asset request
+counts and timings are kept for the run report.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import mimetypes
+import threading
+import time
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlsplit, unquote
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_GZIP_BYTES = 512
+# Everything the page loads; the rest of the project tree is not served
+APP_ASSETS = ("index.html", "script.js", "style.css")
+
+
+class _Asset:
+    """A file read once into memory, with its ETag and gzip variant"""
+
+    def __init__(self, path, mtime_ns):
+        self.mtime_ns = mtime_ns
+        self.body = path.read_bytes()
+        self.content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        if self.content_type.startswith('text/'):
+            self.content_type += '; charset=utf-8'
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()[:16]}"'
+        self.gzip_body = None
+        if self.content_type.startswith(COMPRESSIBLE_TYPES) and len(self.body) >= MIN_GZIP_BYTES:
+            self.gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0)
+
+
+def _etag_matches(etag, if_none_match):
+    """Whether an If-None-Match header (comma-separated ETags or "*") matches etag"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(',')]
+    # Weak comparison, as RFC 7232 requires for If-None-Match
+    return '*' in candidates or etag in (candidate[2:] if candidate.startswith('W/') else candidate
+                                         for candidate in candidates)
+
+
+class _StaticRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.static.handle(self, send_body=True)
+
+    def do_HEAD(self):
+        self.server.static.handle(self, send_body=False)
+
+    def log_message(self, format, *args):
+        # Per-asset stats replace the default access log
+        pass
+
+
+class StaticServer:
+    """
+    Threaded static file server for the app directory
+    Usage:
+        server = StaticServer(".", allow=APP_ASSETS).start()
+        driver.get(server.url("index.html"))
+        server.stop()
+    """
+
+    def __init__(self, root=".", host="127.0.0.1", port=0, gzip_enabled=True, max_age=3600, html_max_age=0,
+                 allow=None):
+        """
+        Args:
+            root: Directory to serve
+            allow: Paths (relative to root) that may be served; None serves every file under root
+            host/port: Address to bind (port 0 picks a free port)
+            gzip_enabled: Compress text assets for clients that accept gzip
+            max_age: Cache-Control max-age (seconds) for scripts, styles and images
+            html_max_age: max-age for HTML; 0 means "no-cache" (revalidate with the ETag every load)
+        """
+        self.root = Path(root).resolve()
+        self.host = host
+        self.port = port
+        self.gzip_enabled = gzip_enabled
+        self.max_age = max_age
+        self.html_max_age = html_max_age
+        self.allow = None if allow is None else {(self.root / name).resolve() for name in allow}
+        self.httpd = None
+        self.thread = None
+        self.stats = {}
+        self._assets = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Bind and serve in a daemon thread; returns self"""
+        self.httpd = ThreadingHTTPServer((self.host, self.port), _StaticRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.static = self
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="static-server", daemon=True)
+        self.thread.start()
+        print(f"🌐 Serving {self.root} at {self.url('')}")
+        return self
+
+    def url(self, path="index.html"):
+        return f"http://{self.host}:{self.port}/{path.lstrip('/')}"
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def _resolve(self, request_path):
+        """Map a URL path to a file under root (None if outside root, not allowed or missing)"""
+        path = (self.root / unquote(urlsplit(request_path).path).lstrip('/')).resolve()
+        if path.is_dir():
+            path = path / "index.html"
+        if os.path.commonpath([str(self.root), str(path)]) != str(self.root) or not path.is_file():
+            return None
+        if self.allow is not None and path not in self.allow:
+            return None
+        return path
+
+    def _asset(self, path):
+        """Cached file contents, re-read only when the file changes on disk"""
+        mtime_ns = path.stat().st_mtime_ns
+        with self._lock:
+            asset = self._assets.get(path)
+        if asset is None or asset.mtime_ns != mtime_ns:
+            asset = _Asset(path, mtime_ns)
+            with self._lock:
+                self._assets[path] = asset
+        return asset
+
+    def _cache_control(self, asset):
+        if asset.content_type.startswith('text/html'):
+            return f"max-age={self.html_max_age}" if self.html_max_age else "no-cache"
+        return f"public, max-age={self.max_age}"
+
+    def handle(self, request, send_body=True):
+        """Serve one GET/HEAD request"""
+        start = time.perf_counter()
+        path = self._resolve(request.path)
+        if path is None:
+            request.send_response(HTTPStatus.NOT_FOUND)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            self._record(request.path, HTTPStatus.NOT_FOUND, 0, False, start)
+            return
+
+        asset = self._asset(path)
+        use_gzip = (self.gzip_enabled and asset.gzip_body is not None
+                    and 'gzip' in request.headers.get('Accept-Encoding', ''))
+        # Each representation gets its own validator
+        etag = asset.etag[:-1] + '-gz"' if use_gzip else asset.etag
+        body = asset.gzip_body if use_gzip else asset.body
+
+        if _etag_matches(etag, request.headers.get('If-None-Match')):
+            status, body = HTTPStatus.NOT_MODIFIED, b""
+        else:
+            status = HTTPStatus.OK
+        request.send_response(status)
+        request.send_header("ETag", etag)
+        request.send_header("Cache-Control", self._cache_control(asset))
+        request.send_header("Vary", "Accept-Encoding")
+        if status == HTTPStatus.OK:
+            request.send_header("Content-Type", asset.content_type)
+            if use_gzip:
+                request.send_header("Content-Encoding", "gzip")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        if send_body and body:
+            request.wfile.write(body)
+        self._record(path.relative_to(self.root).as_posix(), status, len(body) if send_body else 0, use_gzip, start)
+
+    def _record(self, asset_path, status, bytes_sent, gzipped, start):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            entry = self.stats.setdefault(asset_path, {
+                'requests': 0, 'ok': 0, 'not_modified': 0, 'not_found': 0,
+                'gzip': 0, 'bytes_sent': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            })
+            entry['requests'] += 1
+            entry['ok' if status == HTTPStatus.OK else
+                  'not_modified' if status == HTTPStatus.NOT_MODIFIED else 'not_found'] += 1
+            entry['gzip'] += int(gzipped)
+            entry['bytes_sent'] += bytes_sent
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+
+    def write_stats(self, path):
+        """Save per-asset request counts and timings as JSON"""
+        with self._lock:
+            assets = {name: dict(entry, mean_ms=entry['total_ms'] / entry['requests'])
+                      for name, entry in sorted(self.stats.items())}
+        report = {
+            'url': self.url(''),
+            'gzip': self.gzip_enabled,
+            'max_age': self.max_age,
+            'requests': sum(entry['requests'] for entry in assets.values()),
+            'not_modified': sum(entry['not_modified'] for entry in assets.values()),
+            'assets': assets,
+        }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        return path
@@ -0,0 +1,317 @@
+"""
+Test selection engine for Mini E-Kart
+Picks the scenarios to run instead of the whole suite:
+- rerun mode: scenarios that failed in the previous reports/behave_results.json
+- impact mode: scenarios touched by changed files (app assets, step modules,
+  feature files, harness code)
+"""
+
+import re
+import ast
+import json
+import subprocess
+from pathlib import Path
+
+from utilities.parallel_runner import discover_scenarios, scenario_key
+
+STEP_DECORATORS = ('given', 'when', 'then', 'step')
+STEP_KEYWORDS = ('Given', 'When', 'Then', 'And', 'But', '*')
+HUNK_PATTERN = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+JS_FUNCTION_PATTERN = re.compile(r'^\s*function\s+(\w+)\s*\(')
+
+# Which step texts exercise each script.js function. Functions that are not
+# listed (rendering, globals, initialisation) affect every scenario.
+SCRIPT_FUNCTION_IMPACT = {
+    'addToCart': [r'Add to Cart', r'\badds\b'],
+    'seedCart': [r'cart contains'],
+    'showAddToCartFeedback': [r'Add to Cart', r'\badds\b'],
+    'removeFromCart': [r'Remove', r'\bremoves?\b'],
+    'calculateTotalPrice': [r'total price'],
+    'clearCart': [r'cart is empty', r'removes all'],
+}
+
+# Steps whose outcome depends on styling (visibility of cart elements)
+STYLE_IMPACT = [r'\bshow\b', r'visible', r'displayed?']
+
+# Files whose changes can affect any scenario
+GLOBAL_FILES = ('index.html', 'features/environment.py', 'behave.ini', 'requirements.txt')
+GLOBAL_PREFIXES = ('utilities/',)
+
+
+def parse_pattern_to_regex(pattern):
+    """Translate a behave 'parse' step pattern into an anchored regex"""
+    regex = ''
+    for part in re.split(r'(\{[^}]*\})', pattern):
+        if part.startswith('{') and part.endswith('}'):
+            regex += r'(-?\d+)' if part.endswith(':d}') else r'(.+?)'
+        else:
+            regex += re.escape(part)
+    return re.compile(f'^{regex}$')
+
+
+def load_step_definitions(steps_file):
+    """
+    Read step definitions from a steps module without importing it
+    Returns:
+        List of dicts with function name, patterns (as regexes), line range
+        and the names of module-level helpers the step calls
+    """
+    tree = ast.parse(Path(steps_file).read_text(encoding="utf-8"))
+    definitions = []
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        patterns = []
+        for decorator in node.decorator_list:
+            if (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name)
+                    and decorator.func.id in STEP_DECORATORS and decorator.args
+                    and isinstance(decorator.args[0], ast.Constant)):
+                patterns.append(parse_pattern_to_regex(decorator.args[0].value))
+        calls = {n.func.id for n in ast.walk(node) if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)}
+        start = min([d.lineno for d in node.decorator_list] + [node.lineno])
+        definitions.append({
+            'name': node.name,
+            'patterns': patterns,
+            'start': start,
+            'end': node.end_lineno,
+            'calls': calls,
+        })
+    return definitions
+
+
+def load_scenario_steps(feature_file):
+    """
+    Parse a feature file into scenarios and their step texts
+    Background steps are included in every scenario of the feature
+    Returns:
+        List of dicts with name, line range and steps (keyword-less text)
+    """
+    background, scenarios, current = [], [], None
+    lines = Path(feature_file).read_text(encoding="utf-8").splitlines()
+    for line_no, raw in enumerate(lines, 1):
+        line = raw.strip()
+        if line.startswith('Background:'):
+            current = {'name': None, 'start': line_no, 'steps': background}
+        elif line.startswith(('Scenario:', 'Scenario Outline:')):
+            if current is not None:
+                current['end'] = line_no - 1
+            current = {'name': line.split(':', 1)[1].strip(), 'start': line_no, 'steps': []}
+            scenarios.append(current)
+        elif current is not None and line.split(' ', 1)[0] in STEP_KEYWORDS and ' ' in line:
+            keyword, text = line.split(' ', 1)
+            current['steps'].append((keyword, text))
+    if current is not None:
+        current['end'] = len(lines)
+
+    background_range = None
+    if background and scenarios:
+        background_range = (1, scenarios[0]['start'] - 1)
+    for scenario in scenarios:
+        scenario['steps'] = background + scenario['steps']
+        scenario['background_range'] = background_range
+    return scenarios
+
+
+def changed_files(since=None, cwd=None):
+    """
+    Files changed in the working tree (and since a git ref, if given),
+    including deleted ones
+    """
+    names = set()
+    commands = [["git", "diff", "--name-only", "HEAD"],
+                ["git", "ls-files", "--others", "--exclude-standard"]]
+    if since:
+        commands.append(["git", "diff", "--name-only", f"{since}...HEAD"])
+    for cmd in commands:
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+        names.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return sorted(names)
+
+
+def changed_lines(path, since=None, cwd=None):
+    """
+    Line numbers (in the current file) touched by uncommitted changes and,
+    if given, changes since a git ref. None means the file is untracked and
+    an empty set means git has no diff for it; callers treat both as a
+    whole-file change.
+    """
+    ref = since or "HEAD"
+    result = subprocess.run(["git", "diff", "-U0", ref, "--", path], cwd=cwd, capture_output=True, text=True)
+    if not result.stdout:
+        tracked = subprocess.run(["git", "ls-files", "--error-unmatch", path], cwd=cwd, capture_output=True)
+        return None if tracked.returncode != 0 else set()
+    lines = set()
+    for line in result.stdout.splitlines():
+        match = HUNK_PATTERN.match(line)
+        if match:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            # Pure deletions (count 0) still touch the surrounding line
+            lines.update(range(start, start + max(count, 1)))
+    return lines
+
+
+def enclosing_js_functions(source, lines):
+    """Names of the top-level JS functions containing the given lines (None = outside any)"""
+    owners = []
+    current = None
+    for line_no, line in enumerate(source.splitlines(), 1):
+        match = JS_FUNCTION_PATTERN.match(line)
+        if match:
+            current = match.group(1)
+        elif line.startswith('}') and current is not None:
+            owners.append((current, line_no))
+            current = None
+            continue
+        owners.append((current, line_no))
+    by_line = {line_no: owner for owner, line_no in owners}
+    return {by_line.get(line_no) for line_no in lines}
+
+
+class TestSelector:
+    """
+    Maps failures and changed files to the scenarios that should run
+    """
+
+    def __init__(self, project_root="."):
+        """Load scenario and step-definition metadata for the project"""
+        self.project_root = Path(project_root)
+        self.features_dir = self.project_root / "features"
+        self.steps_dir = self.features_dir / "steps"
+        self.scenarios = discover_scenarios(self.features_dir)
+        self.by_key = {s['key']: s for s in self.scenarios}
+        self.scenario_steps = {}
+        for feature_path in sorted(self.features_dir.glob("*.feature")):
+            relative = f"features/{feature_path.name}"
+            for scenario in load_scenario_steps(feature_path):
+                scenario['key'] = scenario_key(relative, scenario['name'])
+                scenario['file'] = relative
+                self.scenario_steps[scenario['key']] = scenario
+
+    def _locations(self, keys):
+        """Current behave locations for scenario keys, in suite order"""
+        return [s['location'] for s in self.scenarios if s['key'] in keys]
+
+    def rerun_failed(self, results_json=None):
+        """
+        Scenarios that failed in a previous behave JSON result file
+        Returns:
+            List of behave locations (file:line) in the current feature files
+        """
+        results_json = results_json or self.project_root / "reports" / "behave_results.json"
+        try:
+            with open(results_json) as f:
+                features = json.load(f)
+        except (OSError, ValueError):
+            return []
+        failed = set()
+        for feature in features:
+            feature_file = feature['location'].rsplit(':', 1)[0]
+            for element in feature.get('elements', []):
+                if element.get('type') != 'background' and element.get('status') == 'failed':
+                    failed.add(scenario_key(feature_file, element['name']))
+        return self._locations(failed)
+
+    def _scenarios_matching(self, step_patterns):
+        """Scenario keys with at least one step text matching any regex"""
+        regexes = [re.compile(p) for p in step_patterns]
+        keys = set()
+        for key, scenario in self.scenario_steps.items():
+            for keyword, text in scenario['steps']:
+                full = f"{keyword} {text}"
+                if any(r.search(text) or r.search(full) for r in regexes):
+                    keys.add(key)
+                    break
+        return keys
+
+    def _scenarios_using_steps(self, definitions):
+        """Scenario keys that use any of the given step definitions"""
+        patterns = [p for d in definitions for p in d['patterns']]
+        keys = set()
+        for key, scenario in self.scenario_steps.items():
+            if any(p.match(text) for _, text in scenario['steps'] for p in patterns):
+                keys.add(key)
+        return keys
+
+    def _impact_of_steps_module(self, path, since):
+        """Scenarios using step definitions (or helpers they call) that changed"""
+        definitions = load_step_definitions(self.project_root / path)
+        lines = changed_lines(path, since, self.project_root)
+        if not lines:
+            return self._scenarios_using_steps(definitions)
+
+        changed_steps, changed_helpers, outside = [], set(), False
+        for line in lines:
+            owner = next((d for d in definitions if d['start'] <= line <= d['end']), None)
+            if owner is None:
+                outside = True
+            elif owner['patterns']:
+                changed_steps.append(owner)
+            else:
+                changed_helpers.add(owner['name'])
+        if outside:
+            # Imports or module-level code changed: every step may be affected
+            return self._scenarios_using_steps(definitions)
+        changed_steps += [d for d in definitions if d['patterns'] and d['calls'] & changed_helpers]
+        return self._scenarios_using_steps(changed_steps)
+
+    def _impact_of_script(self, path, since):
+        """Scenarios exercising the script.js functions that changed"""
+        lines = changed_lines(path, since, self.project_root)
+        if not lines:
+            return set(self.by_key)
+        source = (self.project_root / path).read_text(encoding="utf-8")
+        patterns = []
+        for function in enclosing_js_functions(source, lines):
+            if function not in SCRIPT_FUNCTION_IMPACT:
+                return set(self.by_key)
+            patterns += SCRIPT_FUNCTION_IMPACT[function]
+        return self._scenarios_matching(patterns)
+
+    def _impact_of_feature(self, path, since):
+        """Changed scenarios of a feature file (all of them if its Background changed)"""
+        lines = changed_lines(path, since, self.project_root)
+        scenarios = [s for s in self.scenario_steps.values() if s['file'] == path]
+        if not lines:
+            return {s['key'] for s in scenarios}
+        keys = set()
+        for scenario in scenarios:
+            background = scenario['background_range']
+            if background and any(background[0] <= line <= background[1] for line in lines):
+                return {s['key'] for s in scenarios}
+            if any(scenario['start'] <= line <= scenario['end'] for line in lines):
+                keys.add(scenario['key'])
+        return keys
+
+    def impacted(self, files=None, since=None):
+        """
+        Scenarios affected by a set of changed files
+        Args:
+            files: Changed paths relative to the project root (defaults to git)
+            since: Optional git ref to diff against in addition to the working tree
+        Returns:
+            Tuple of (locations, explanation dict of file -> scenario count)
+        """
+        files = files if files is not None else changed_files(since, self.project_root)
+        selected, explanation = set(), {}
+        for path in files:
+            path = path.replace("\\", "/")
+            code = path == "script.js" or (path.startswith("features/steps/") and path.endswith(".py"))
+            if code and not (self.project_root / path).exists():
+                # Deleted app script or steps module: nothing left to map lines to
+                keys = set(self.by_key)
+            elif path == "script.js":
+                keys = self._impact_of_script(path, since)
+            elif path == "style.css":
+                keys = self._scenarios_matching(STYLE_IMPACT)
+            elif path.startswith("features/steps/") and path.endswith(".py"):
+                keys = self._impact_of_steps_module(path, since)
+            elif path.startswith("features/") and path.endswith(".feature"):
+                keys = self._impact_of_feature(path, since)
+            elif path in GLOBAL_FILES or path.startswith(GLOBAL_PREFIXES):
+                keys = set(self.by_key)
+            else:
+                continue
+            explanation[path] = len(keys)
+            selected |= keys
+        return self._locations(selected), explanation